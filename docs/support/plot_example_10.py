@@ -0,0 +1,25 @@
+# plot_example_10.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0410,C0413
+
+import numpy as np
+import pplot
+
+def create_table_sources():
+    # Sweep of a voltage at three temperatures
+    table = np.zeros(
+        9, dtype=[("temp", "<i4"), ("time", "<f8"), ("volt", "<f8")]
+    )
+    table["temp"] = [25, 25, 25, 50, 50, 50, 85, 85, 85]
+    table["time"] = [1, 2, 3, 1, 2, 3, 1, 2, 3]
+    table["volt"] = [1.5, 2.5, 3.5, 1.0, 2.0, 3.0, 0.5, 1.5, 2.5]
+    return [
+        pplot.TableSource(
+            table,
+            indep_col_label="time",
+            dep_col_label="volt",
+            rfilter={"temp": temp},
+        )
+        for temp in [25, 50, 85]
+    ]
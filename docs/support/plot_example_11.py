@@ -0,0 +1,14 @@
+# plot_example_11.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0410,C0413
+
+import pplot
+
+def square(indep_var):
+    return indep_var ** 2
+
+def create_function_source():
+    return pplot.FunctionSource(
+        func=square, indep_min=0, indep_max=10, num_points=11
+    )
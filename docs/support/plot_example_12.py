@@ -0,0 +1,23 @@
+# plot_example_12.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0410,C0413
+
+import numpy as np
+import pplot
+
+def diff(minuend, subtrahend):
+    return minuend - subtrahend
+
+def create_derived_source():
+    minuend = pplot.BasicSource(
+        indep_var=np.array([1, 2, 3, 4]),
+        dep_var=np.array([10, 20, 30, 40]),
+    )
+    subtrahend = pplot.BasicSource(
+        indep_var=np.array([1.5, 2.5, 3.5]),
+        dep_var=np.array([1, 2, 3]),
+    )
+    return pplot.DerivedSource(
+        sources=[minuend, subtrahend], func=diff, align="interp"
+    )
@@ -0,0 +1,25 @@
+# plot_example_8.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0410,C0413
+
+import numpy as np
+import pplot
+
+def create_memmap_source(fname):
+    # Write 1,000 records with a 64-bit float time stamp and
+    # a 32-bit float voltage sample
+    dtype = [("time", "<f8"), ("volt", "<f4")]
+    data = np.zeros(1000, dtype=dtype)
+    data["time"] = 1e-3 * np.arange(1000)
+    data["volt"] = 0.5 * np.arange(1000)
+    data.tofile(fname)
+    obj = pplot.MemmapSource(
+        fname=fname,
+        indep_field="time",
+        dep_field="volt",
+        dtype=dtype,
+        indep_min=0.1,
+        indep_max=0.2,
+    )
+    return obj
@@ -0,0 +1,35 @@
+# plot_example_9.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0410,C0413
+
+import contextlib, sqlite3
+import pplot
+
+def create_sqlite_source(fname):
+    with contextlib.closing(sqlite3.connect(fname)) as conn:
+        conn.execute(
+            "CREATE TABLE meas (temp REAL, time REAL, volt REAL)"
+        )
+        conn.execute("CREATE INDEX meas_time ON meas (time)")
+        conn.executemany(
+            "INSERT INTO meas VALUES (?, ?, ?)",
+            [
+                (25, 1, 10.5),
+                (85, 1, 11.0),
+                (25, 2, 20.5),
+                (85, 2, 21.0),
+                (25, 3, 30.5),
+                (85, 3, 31.0),
+            ],
+        )
+        conn.commit()
+    obj = pplot.SqliteSource(
+        fname=fname,
+        table="meas",
+        indep_col_label="time",
+        dep_col_label="volt",
+        rfilter={"temp": 85},
+        indep_min=2,
+    )
+    return obj
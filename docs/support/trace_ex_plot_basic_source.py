@@ -11,7 +11,15 @@ def trace_module(no_print=True):
     mname = "basic_source"
     fname = "pplot"
     module_prefix = "pplot.{0}.BasicSource.".format(mname)
-    callable_names = ("__init__", "indep_min", "indep_max", "indep_var", "dep_var")
+    callable_names = (
+        "__init__",
+        "append",
+        "extend",
+        "indep_min",
+        "indep_max",
+        "indep_var",
+        "dep_var",
+    )
     module_exclude_list = ["peng.functions"]
     return docs.support.trace_support.run_trace(
         mname, fname, module_prefix, callable_names, no_print, module_exclude_list
@@ -13,6 +13,12 @@ def trace_module(no_print=True):
     module_prefix = "pplot.{0}.CsvSource.".format(mname)
     callable_names = (
         "__init__",
+        "batch_update",
+        "cache_dir",
+        "chunk_size",
+        "decimate",
+        "engine",
+        "from_columns",
         "file_name",
         "rfilter",
         "indep_col_label",
@@ -21,8 +27,12 @@ def trace_module(no_print=True):
         "indep_max",
         "fproc",
         "fproc_eargs",
+        "memoize",
+        "refresh",
+        "split_by",
         "indep_var",
         "dep_var",
+        "workers",
     )
     module_exclude_list = ["peng.functions"]
     callable_exclude_list = [
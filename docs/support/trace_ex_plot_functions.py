@@ -11,7 +11,7 @@ def trace_module(no_print=True):
     mname = "functions"
     fname = "pplot"
     module_prefix = "pplot.{0}.".format(mname)
-    callable_names = ("parameterized_color_space",)
+    callable_names = ("parameterized_color_space", "set_trusted_mode")
     module_exclude_list = ["peng.functions"]
     return docs.support.trace_support.run_trace(
         mname, fname, module_prefix, callable_names, no_print, module_exclude_list
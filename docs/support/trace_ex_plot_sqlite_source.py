@@ -0,0 +1,33 @@
+# trace_ex_plot_sqlite_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,W0212
+
+import docs.support.trace_support
+
+
+def trace_module(no_print=True):
+    """Trace plot sqlite_source module exceptions."""
+    mname = "sqlite_source"
+    fname = "pplot"
+    module_prefix = "pplot.{0}.SqliteSource.".format(mname)
+    callable_names = (
+        "__init__",
+        "dep_col_label",
+        "dep_var",
+        "fname",
+        "indep_col_label",
+        "indep_max",
+        "indep_min",
+        "indep_var",
+        "rfilter",
+        "table",
+    )
+    module_exclude_list = ["peng.functions"]
+    return docs.support.trace_support.run_trace(
+        mname, fname, module_prefix, callable_names, no_print, module_exclude_list
+    )
+
+
+if __name__ == "__main__":
+    trace_module(False)
@@ -10,11 +10,36 @@ from peng.ptypes import real_numpy_vector, increasing_real_numpy_vector
 # Intra-package imports
 from .basic_source import BasicSource
 from .csv_source import CsvSource
+from .derived_source import DerivedSource
+from .function_source import FunctionSource
+from .memmap_source import MemmapSource
+from .sqlite_source import SqliteSource
+from .table_source import TableSource
+from .csv_engine import clear_csv_cache, csv_cache_info, set_csv_cache_size
+from .fproc_cache import clear_fproc_cache, fproc_cache_info, set_fproc_cache_size
+from .loader import load_sources
+from .pipeline import Pipeline
+from . import pipeline
 from .series import Series
 from .panel import Panel
 from .figure import Figure
-from .functions import parameterized_color_space, DataSource
-from pplot.ptypes import interpolation_option, line_style_option, color_space_option
+from .functions import (
+    parameterized_color_space,
+    set_trusted_mode,
+    trusted_mode,
+    DataSource,
+)
+from pplot.ptypes import (
+    align_option,
+    interpolation_option,
+    line_style_option,
+    color_space_option,
+    csv_engine_option,
+    executor_option,
+    increasing_real_vector,
+    real_vector,
+    row_filter,
+)
 from .constants import (
     AXIS_LABEL_FONT_SIZE,
     AXIS_TICKS_FONT_SIZE,
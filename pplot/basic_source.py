@@ -29,11 +29,17 @@ if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
         import numpy as np
 import pexdoc.exh
 import pexdoc.pcontracts
-import peng
 
 # Intra-package imports
-from .constants import PRECISION
-from .functions import _C, _SEL, DataSource
+from .functions import (
+    _C,
+    DataSource,
+    _as_vector,
+    _bound_slice,
+    _exh,
+    _readonly_view,
+    _round_vector,
+)
 
 
 ###
@@ -64,6 +70,17 @@ class BasicSource(DataSource):
     :type  indep_max: `RealNum <https://pexdoc.readthedocs.io/en/stable/
                       ptypes.html#realnum>`_ *or None*
 
+    :param round_data: Flag that indicates whether the mantissa of the
+                       independent and dependent variables is rounded
+                       (True) or not (False).
+                       See :py:attr:`pplot.BasicSource.round_data`
+    :type  round_data: boolean
+
+    :param copy: Flag that indicates whether the independent and dependent
+                 variables are copied (True) or referenced (False).
+                 See :py:attr:`pplot.BasicSource.copy`
+    :type  copy: boolean
+
     :rtype: :py:class:`pplot.BasicSource`
 
     .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
@@ -71,6 +88,8 @@ class BasicSource(DataSource):
     .. pplot.basic_source.BasicSource.__init__
 
     :raises:
+     * RuntimeError (Argument \`copy\` is not valid)
+
      * RuntimeError (Argument \`dep_var\` is not valid)
 
      * RuntimeError (Argument \`indep_max\` is not valid)
@@ -79,6 +98,8 @@ class BasicSource(DataSource):
 
      * RuntimeError (Argument \`indep_var\` is not valid)
 
+     * RuntimeError (Argument \`round_data\` is not valid)
+
      * ValueError (Argument \`indep_min\` is greater than argument
        \`indep_max\`)
 
@@ -91,25 +112,40 @@ class BasicSource(DataSource):
     .. [[[end]]]
     """
 
-    # pylint: disable=R0902,R0903
-    def __init__(self, indep_var, dep_var, indep_min=None, indep_max=None):  # noqa
+    # pylint: disable=R0902,R0903,R0913
+    def __init__(
+        self,
+        indep_var,
+        dep_var,
+        indep_min=None,
+        indep_max=None,
+        round_data=True,
+        copy=True,
+    ):  # noqa
         # Private attributes
         super(BasicSource, self).__init__()
         self._exh = pexdoc.exh.get_or_create_exh_obj()
         self._raw_indep_var = None
         self._raw_dep_var = None
+        self._bufs = None
         self._indep_var_indexes = None
         self._min_indep_var_index = None
         self._max_indep_var_index = None
         # Public attributes
+        self._round_data = True
+        self._copy = True
         self._indep_min = None
         self._indep_max = None
         # Assignment of arguments to attributes
         # Assign minimum and maximum first so as not to trigger unnecessary
         # thresholding if the dependent and independent variables are
         # already assigned
+        self._set_round_data(round_data)
+        self._set_copy(copy)
         self._set_indep_min(indep_min)
         self._set_indep_max(indep_max)
+        if not self.copy:
+            indep_var, dep_var = _as_vector(indep_var), _as_vector(dep_var)
         self._set_indep_var(indep_var)
         self._set_dep_var(dep_var)
 
@@ -160,36 +196,165 @@ class BasicSource(DataSource):
         ret += super(BasicSource, self).__str__()
         return ret
 
+    @pexdoc.pcontracts.contract(indep_var="real_num", dep_var="real_num")
+    def append(self, indep_var, dep_var):
+        r"""
+        Append a point to the data set.
+
+        See :py:meth:`pplot.BasicSource.extend`
+
+        :param indep_var: Independent variable value, it has to be greater
+                          than the last independent variable value
+        :type  indep_var: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                          ptypes.html#realnum>`_
+
+        :param dep_var: Dependent variable value
+        :type  dep_var: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                        ptypes.html#realnum>`_
+
+        For example:
+
+        .. code-block:: python
+
+            >>> import numpy as np, pplot
+            >>> obj = pplot.BasicSource(np.array([1, 2]), np.array([10, 20]))
+            >>> obj.append(3, 30)
+            >>> obj.indep_var.tolist(), obj.dep_var.tolist()
+            ([1.0, 2.0, 3.0], [10.0, 20.0, 30.0])
+
+        .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+        .. Auto-generated exceptions documentation for
+        .. pplot.basic_source.BasicSource.append
+
+        :raises:
+         * RuntimeError (Argument \`dep_var\` is not valid)
+
+         * RuntimeError (Argument \`indep_var\` is not valid)
+
+        .. [[[end]]]
+        """
+        self.extend(np.array([indep_var]), np.array([dep_var]))
+
+    @pexdoc.pcontracts.contract(
+        indep_var="increasing_real_vector", dep_var="real_vector"
+    )
+    def extend(self, indep_var, dep_var):
+        r"""
+        Append points to the data set.
+
+        The data set is held in buffers whose capacity is doubled when they
+        are full, and only the appended points are validated, rounded and
+        range bounded, so appending N points one call at a time takes time
+        proportional to N. The independent and dependent variables are views
+        of the buffers
+
+        :param indep_var: Independent variable vector, its first element has
+                          to be greater than the last independent variable
+                          value
+        :type  indep_var: `IncreasingRealNumpyVector
+                          <https://peng.readthedocs.io/en/stable/
+                          api.html#increasingrealnumpyvector>`_
+
+        :param dep_var: Dependent variable vector
+        :type  dep_var: `RealNumpyVector <https://peng.readthedocs.io/en/
+                        stable/api.html#realnumpyvector>`_
+
+        .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+        .. Auto-generated exceptions documentation for
+        .. pplot.basic_source.BasicSource.extend
+
+        :raises:
+         * RuntimeError (Argument \`dep_var\` is not valid)
+
+         * RuntimeError (Argument \`indep_var\` is not valid)
+
+         * ValueError (Arguments \`indep_var\` and \`dep_var\` must have the
+           same number of elements)
+
+        .. [[[end]]]
+        """
+        _exh().addex(
+            ValueError,
+            "Arguments `indep_var` and `dep_var` must have the "
+            "same number of elements",
+            indep_var.size != dep_var.size,
+        )
+        indep_var = _round_vector(indep_var, self._rounding())
+        size = self._raw_indep_var.size
+        _exh().addex(
+            RuntimeError,
+            "Argument `indep_var` is not valid",
+            bool(indep_var[0] <= self._raw_indep_var[-1]),
+        )
+        new_size = size + indep_var.size
+        if (self._bufs is None) or (new_size > self._bufs[0].size):
+            bufs = (np.empty(2 * new_size), np.empty(2 * new_size))
+            bufs[0][:size] = self._raw_indep_var
+            bufs[1][:size] = self._raw_dep_var
+            self._bufs = bufs
+        self._bufs[0][size:new_size] = indep_var
+        _round_vector(dep_var, self._rounding(), out=self._bufs[1][size:new_size])
+        self._raw_indep_var = self._bufs[0][:new_size]
+        self._raw_dep_var = self._bufs[1][:new_size]
+        # Appended points are greater than the existing ones, the bounded data
+        # is still a contiguous (and non-empty) slice of the data set
+        self._indep_var_indexes = _bound_slice(
+            self._raw_indep_var, self.indep_min, self.indep_max
+        )
+        self._indep_var = self._raw_indep_var[self._indep_var_indexes]
+        self._dep_var = self._raw_dep_var[self._indep_var_indexes]
+
+    def _get_copy(self):
+        return self._copy
+
     def _get_indep_max(self):
         return self._indep_max
 
     def _get_indep_min(self):
         return self._indep_min
 
-    @pexdoc.pcontracts.contract(dep_var="real_numpy_vector")
+    def _get_round_data(self):
+        return self._round_data
+
+    def _ingest(self, vector):
+        """
+        Return data set vector from a given vector.
+
+        If the copy flag is False the data set vector is a read-only view of
+        the given vector, and None is returned if the given vector cannot be
+        referenced
+        """
+        if self.copy:
+            return _round_vector(vector, self.round_data)
+        return _readonly_view(vector)
+
+    def _rounding(self):
+        """Return True if data set vectors are rounded, False otherwise."""
+        return self.round_data and self.copy
+
+    @pexdoc.pcontracts.contract(copy=bool)
+    def _set_copy(self, copy):
+        # Vectors that are already set keep their ingestion mode
+        self._copy = copy
+
+    @pexdoc.pcontracts.contract(dep_var="real_vector")
     def _set_dep_var(self, dep_var):
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Arguments `indep_var` and `dep_var` must have"
             " the same number of elements",
             _C(dep_var, self._raw_indep_var)
             and (self._raw_indep_var.size != dep_var.size),
         )
-        self._raw_dep_var = peng.round_mantissa(dep_var, PRECISION)
+        dep_var = self._ingest(dep_var)
+        _exh().addai("dep_var", dep_var is None)
+        self._raw_dep_var = dep_var
+        self._bufs = None
         self._update_dep_var()
 
     @pexdoc.pcontracts.contract(indep_max="real_num")
     def _set_indep_max(self, indep_max):
-        pexdoc.exh.addex(
-            ValueError,
-            "Argument `indep_min` is greater than argument `indep_max`",
-            _C(self.indep_min, indep_max) and (indep_max < self.indep_min),
-        )
-        self._indep_max = (
-            peng.round_mantissa(indep_max, PRECISION)
-            if not isinstance(indep_max, int)
-            else indep_max
-        )
+        self._set_indep_range(self.indep_min, indep_max)
         # Apply minimum and maximum range bounding and assign it
         # to self._indep_var and thus this is what self.indep_var returns
         self._update_indep_var()
@@ -197,63 +362,87 @@ class BasicSource(DataSource):
 
     @pexdoc.pcontracts.contract(indep_min="real_num")
     def _set_indep_min(self, indep_min):
-        pexdoc.exh.addex(
-            ValueError,
-            "Argument `indep_min` is greater than argument `indep_max`",
-            _C(self.indep_max, indep_min) and (self.indep_max < indep_min),
-        )
-        self._indep_min = (
-            peng.round_mantissa(indep_min, PRECISION)
-            if not isinstance(indep_min, int)
-            else indep_min
-        )
+        self._set_indep_range(indep_min, self.indep_max)
         # Apply minimum and maximum range bounding and assign it to
         # self._indep_var and thus this is what self.indep_var returns
         self._update_indep_var()
         self._update_dep_var()
 
-    @pexdoc.pcontracts.contract(indep_var="increasing_real_numpy_vector")
+    @pexdoc.pcontracts.contract(indep_var="increasing_real_vector")
     def _set_indep_var(self, indep_var):
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Arguments `indep_var` and `dep_var` must have the "
             "same number of elements",
             _C(indep_var, self._raw_dep_var)
             and (self._raw_dep_var.size != indep_var.size),
         )
-        self._raw_indep_var = peng.round_mantissa(indep_var, PRECISION)
+        indep_var = self._ingest(indep_var)
+        _exh().addai("indep_var", indep_var is None)
+        self._raw_indep_var = indep_var
+        self._bufs = None
         # Apply minimum and maximum range bounding and assign it to
         # self._indep_var and thus this is what self.indep_var returns
         self._update_indep_var()
         self._update_dep_var()
 
+    @pexdoc.pcontracts.contract(round_data=bool)
+    def _set_round_data(self, round_data):
+        # Vectors that are already set are not rounded again
+        self._round_data = round_data
+
     def _update_dep_var(self):
         """Update dependent variable to match independent variable range bounding."""
         self._dep_var = self._raw_dep_var
         if _C(self._indep_var_indexes, self._raw_dep_var):
-            super(BasicSource, self)._set_dep_var(
-                self._raw_dep_var[self._indep_var_indexes]
-            )
+            self._dep_var = self._raw_dep_var[self._indep_var_indexes]
+            self._dep_var.flags.writeable = False
 
     def _update_indep_var(self):
         """Update independent variable according to its minimum and maximum limits."""
-        empty_ex = pexdoc.exh.addex(
+        empty_ex = _exh().addex(
             ValueError,
             "Argument `indep_var` is empty after `indep_min`/`indep_max`"
             " range bounding",
         )
         if self._raw_indep_var is not None:
-            indep_min = _SEL(self.indep_min, self._raw_indep_var[0])
-            indep_max = _SEL(self.indep_max, self._raw_indep_var[-1])
-            min_indexes = self._raw_indep_var >= indep_min
-            max_indexes = self._raw_indep_var <= indep_max
-            self._indep_var_indexes = np.where(min_indexes & max_indexes)
-            super(BasicSource, self)._set_indep_var(
-                self._raw_indep_var[self._indep_var_indexes]
+            # The independent variable is increasing, the range-bounded data
+            # is a slice (and the variables are views) of the data set
+            self._indep_var_indexes = _bound_slice(
+                self._raw_indep_var, self.indep_min, self.indep_max
             )
+            self._indep_var = self._raw_indep_var[self._indep_var_indexes]
+            self._indep_var.flags.writeable = False
             empty_ex(not self.indep_var.size)
 
     # Managed attributes
+    copy = property(_get_copy, _set_copy, doc="Data copy flag")
+    r"""
+    Get or set the data copy flag.
+
+    If True the independent and dependent variables are copied (and rounded,
+    see :py:attr:`pplot.BasicSource.round_data`) when they are set. If False
+    they are referenced: the data source holds read-only views of the
+    given vectors, which have to be C-contiguous vectors of 64-bit floating
+    point numbers, and the data is not rounded. Range bounding does not copy
+    the data either, so large data sets are held in memory only once. Objects
+    that define the Numpy array interface or that expose the buffer protocol
+    (for example :code:`array.array('d')` objects) can be given to the
+    constructor when the flag is False. Points appended with
+    :py:meth:`pplot.BasicSource.extend` are always copied. Only data set
+    after the flag is changed is affected
+
+    :type: boolean
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.basic_source.BasicSource.copy
+
+    :raises: (when assigned) RuntimeError (Argument \`copy\` is not valid)
+
+    .. [[[end]]]
+    """
+
     dep_var = property(
         DataSource._get_dep_var, _set_dep_var, doc="Dependent variable Numpy vector"
     )
@@ -360,3 +549,26 @@ class BasicSource(DataSource):
 
     .. [[[end]]]
     """
+
+    round_data = property(
+        _get_round_data, _set_round_data, doc="Data mantissa rounding flag"
+    )
+    r"""
+    Get or set the data mantissa rounding flag.
+
+    If True the mantissa of the independent and dependent variables is
+    rounded to 10 digits when they are set, otherwise the data is used as is
+    (which is faster for data that is already clean). Only data set after
+    the flag is changed is affected
+
+    :type: boolean
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.basic_source.BasicSource.round_data
+
+    :raises: (when assigned) RuntimeError (Argument \`round_data\` is not
+     valid)
+
+    .. [[[end]]]
+    """
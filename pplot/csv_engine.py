@@ -0,0 +1,783 @@
+# csv_engine.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,E1101,R0205,R0903,R0914,W0105,W0212
+
+# Standard library imports
+import collections
+import importlib
+import io
+import multiprocessing
+import operator
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+import pcsv
+
+# Intra-package imports
+from .functions import _MF, _LruCache, _exh
+
+
+###
+# Global variables
+###
+# Size (in characters) of the text blocks read from the file. Each block is
+# tokenized in one go, so this bounds the size of the temporary token arrays
+_BLOCK_SIZE = 2 ** 22
+
+# Minimum size (in bytes) of the file ranges parsed by each worker process,
+# smaller files are not worth the process start-up and data transfer cost
+_MIN_RANGE_SIZE = 4 * _BLOCK_SIZE
+
+# Parsed files cache. Files are keyed by (path, size, modification time), a
+# value of None indicates that the file cannot be parsed by the columnar engine
+_CACHE = _LruCache(2 ** 28, lambda table: 0 if table is None else table.nbytes)
+
+# Marker of files that are not in the parsed files cache
+_UNCACHED = object()
+
+# Compressed file formats, identified by their magic bytes
+_COMPRESSION = [
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "lzma"),
+]
+
+# Row filter comparison operators
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+CsvCacheInfo = collections.namedtuple(
+    "CsvCacheInfo", ["hits", "misses", "entries", "size", "max_size"]
+)
+
+
+###
+# Functions
+###
+def _collect_blocks(blocks):
+    """
+    Gather the blocks yielded by :py:func:`_parse_blocks`.
+
+    Return a (header, rows, chunks) tuple, where chunks is a list with the
+    per-block column data of each column
+    """
+    header = next(blocks)
+    rows, chunks = 0, [[] for _ in header]
+    for block_rows, block_cols in blocks:
+        rows += block_rows
+        for col_chunks, col in zip(chunks, block_cols):
+            col_chunks.append(col)
+    return header, rows, chunks
+
+
+def _file_ranges(fname, nranges):
+    """
+    Split file into (at most nranges) newline-aligned byte ranges.
+
+    Return a list of (start, stop) tuples. Ranges are at least
+    _MIN_RANGE_SIZE bytes long (except the last one)
+    """
+    size = os.path.getsize(fname)
+    nranges = max(1, min(nranges, size // _MIN_RANGE_SIZE))
+    bounds = [0]
+    with io.open(fname, "rb") as fobj:
+        for num in range(1, nranges):
+            fobj.seek(max(bounds[-1], (num * size) // nranges))
+            fobj.readline()
+            pos = fobj.tell()
+            if pos >= size:
+                break
+            bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _isnumber(obj):
+    """Test if object is a number (same definition as the pcsv module)."""
+    return (
+        (obj is not None)
+        and (not isinstance(obj, bool))
+        and isinstance(obj, (int, float, complex))
+    )
+
+
+def _tofloat(obj):
+    """Convert to number if object is a number string (same as the pcsv module)."""
+    if "inf" in obj.lower().strip():
+        return obj
+    try:
+        return int(obj)
+    except ValueError:
+        try:
+            return float(obj)
+        except ValueError:
+            return obj
+
+
+def _convert_col(tokens):
+    """
+    Convert a column of string tokens to a float Numpy vector.
+
+    Return a (values, empty) tuple where empty is a boolean Numpy vector that
+    flags empty tokens, or None if the column is not purely numeric
+    """
+    stripped = np.char.strip(tokens)
+    empty = stripped == ""
+    try:
+        values = np.where(empty, "nan", stripped).astype(np.float64)
+    except ValueError:
+        return None
+    # Strings that contain "inf" are not numbers per the pcsv conversion rules
+    if np.isinf(values).any():
+        return None
+    return values, empty
+
+
+def _compare(values, oper, value):
+    """Compare column values (None if empty) against a value, element-wise."""
+    func = _OPERATORS[oper]
+    if (values.dtype != object) and _isnumber(value):
+        with np.errstate(invalid="ignore"):
+            return func(values, value)
+    return np.array(
+        [(item is not None) and _safe_compare(func, item, value) for item in values],
+        dtype=bool,
+    )
+
+
+def _match(item, value):
+    """Test if a (non-empty) column value is selected by a row filter value."""
+    if isinstance(value, dict):
+        return all(
+            _safe_compare(_OPERATORS[oper], item, ref) for oper, ref in value.items()
+        )
+    return item in (value if isinstance(value, list) else [value])
+
+
+def _safe_compare(func, item, value):
+    """Compare two values, values of types that cannot be ordered do not match."""
+    try:
+        return bool(func(item, value))
+    except TypeError:
+        return False
+
+
+def _column_mask(values, value, empty=None):
+    """
+    Compute the rows of a column selected by a row filter value.
+
+    Comparisons are evaluated on the whole column. Rows flagged by the empty
+    boolean vector (if not None), and None values of object columns, are
+    not selected
+    """
+    if values.dtype == object:
+        if isinstance(value, dict):
+            mask = np.ones(values.size, dtype=bool)
+            for oper, ref in value.items():
+                mask &= _compare(values, oper, ref)
+            return mask
+        fvalues = value if isinstance(value, list) else [value]
+        return np.array([item in fvalues for item in values], dtype=bool)
+    numeric = values.dtype.kind in "biuf"
+    if isinstance(value, dict):
+        mask = np.ones(values.size, dtype=bool)
+        for oper, ref in value.items():
+            if numeric != _isnumber(ref):
+                # Numbers and strings are never equal and cannot be ordered
+                mask &= oper == "!="
+                continue
+            with np.errstate(invalid="ignore"):
+                mask &= _OPERATORS[oper](values, ref)
+    else:
+        mask = np.zeros(values.size, dtype=bool)
+        for item in value if isinstance(value, list) else [value]:
+            if numeric == _isnumber(item):
+                mask |= values == item
+    if empty is not None:
+        mask &= ~empty
+    return mask
+
+
+def _convert_obj_col(tokens):
+    """Convert a column of string tokens to an object Numpy vector."""
+    empty = np.char.strip(tokens) == ""
+    values = np.array(
+        [None if flag else _tofloat(item) for flag, item in zip(empty, tokens)],
+        dtype=object,
+    )
+    return values, empty
+
+
+def _tokenize(lines, ncols):
+    """
+    Split lines of text into a list of string tokens, in row-major order.
+
+    The tokens of column num are tokens[num::ncols]; only the columns that are
+    needed are converted to Numpy vectors. Raise _CsvFallback if the lines
+    cannot be tokenized by simple splitting, i.e. when quoted fields are
+    present or when rows have different number of columns
+    """
+    text = ",".join(lines)
+    if '"' in text:
+        raise _CsvFallback()
+    if (np.char.count(np.array(lines), ",") != ncols - 1).any():
+        raise _CsvFallback()
+    return text.split(",")
+
+
+def _iter_lines(fobj, block_size=_BLOCK_SIZE):
+    """Read text file in blocks, yield lists of complete lines."""
+    partial = ""
+    while True:
+        block = fobj.read(block_size)
+        if not block:
+            break
+        lines = (partial + block).split("\n")
+        partial = lines.pop()
+        if lines:
+            yield lines
+    if partial:
+        yield [partial]
+
+
+def _compression(fname):
+    """Return name of decompression module of file, None if not compressed."""
+    with io.open(fname, "rb") as fobj:
+        magic = fobj.read(max(len(item[0]) for item in _COMPRESSION))
+    for fmagic, name in _COMPRESSION:
+        if magic.startswith(fmagic):
+            return name
+    return None
+
+
+def _open_text(fname):
+    """
+    Open text file for reading, decompressing it on the fly if compressed.
+
+    Files compressed in the gzip, bzip2 or xz formats are detected by their
+    magic bytes (irrespective of the file extension)
+    """
+    comp_ex = _exh().addex(
+        RuntimeError, "Compression format of file *[fname]* is not supported"
+    )
+    name = _compression(fname)
+    if name is None:
+        return io.open(fname, "r")
+    try:
+        module = importlib.import_module(name)
+    except ImportError:  # pragma: no cover
+        module = None
+    comp_ex(not hasattr(module, "open"), _MF("fname", fname))
+    return module.open(fname, "rt")
+
+
+def _cache_key(fname):
+    """Compute parsed files cache key."""
+    stat = os.stat(fname)
+    return (os.path.realpath(fname), stat.st_size, stat.st_mtime)
+
+
+def _parse_range(args):
+    """
+    Parse a byte range of a file in a worker process.
+
+    The arguments are packed in a (fname, start, stop, header, cols) tuple;
+    header is None for the range at the start of the file. Return the tuple
+    of :py:func:`_collect_blocks`
+    """
+    fname, start, stop, header, cols = args
+    fobj = io.TextIOWrapper(io.BufferedReader(_ByteRange(fname, start, stop)))
+    return _collect_blocks(_parse_blocks(fname, fobj=fobj, header=header, cols=cols))
+
+
+def _parse_ranges(fname, cols, workers):
+    """
+    Parse file in newline-aligned byte ranges, one worker process per range.
+
+    Return the tuple of :py:func:`_collect_blocks` with the chunks of all the
+    ranges in file order, or None if the file is too small to be split
+    """
+    if (
+        (workers is None)
+        or (workers < 2)
+        or multiprocessing.current_process().daemon
+        or (_compression(fname) is not None)
+    ):
+        return None
+    ranges = _file_ranges(fname, workers)
+    if len(ranges) < 2:
+        return None
+    with _open_text(fname) as fobj:
+        header_line = fobj.readline().rstrip("\n")
+    if '"' in header_line:
+        raise _CsvFallback()
+    header = header_line.split(",")
+    args = [
+        (fname, start, stop, header if num else None, cols)
+        for num, (start, stop) in enumerate(ranges)
+    ]
+    pool = multiprocessing.Pool(len(ranges))
+    try:
+        results = pool.map(_parse_range, args)
+    except Exception:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+    header = results[0][0]
+    rows = sum(item[1] for item in results)
+    chunks = [
+        [chunk for item in results for chunk in item[2][num]]
+        for num in range(len(header))
+    ]
+    return header, rows, chunks
+
+
+def _parse_blocks(fname, block_size=_BLOCK_SIZE, fobj=None, header=None, cols=None):
+    """
+    Parse comma-separated values file in blocks of lines.
+
+    Yield the list of column labels first and then a (rows, columns) tuple
+    for each block, where columns is a list with the (values, empty) tuple of
+    each column (see :py:func:`_convert_col`). A column that has non-numeric
+    data is converted to an object vector from that block onwards. If cols is
+    given only the columns with those labels (case insensitive) are
+    converted, the item of the other columns is None.
+
+    The file text is read from fobj if given. If header is given the text is
+    expected to have only data rows (the continuation of a file whose header
+    is known)
+    """
+    # pylint: disable=R0912
+    empty_ex = _exh().addex(RuntimeError, "File *[fname]* is empty")
+    col_ex = _exh().addex(
+        RuntimeError, "Column headers are not unique in file *[fname]*"
+    )
+    nvdata_ex = _exh().addex(RuntimeError, "File *[fname]* has no valid data")
+    edata = _MF("fname", fname)
+    with _open_text(fname) if fobj is None else fobj as fobj:
+        blocks = _iter_lines(fobj, block_size)
+        if header is None:
+            lines = next(blocks, [])
+            empty_ex(not lines, edata)
+            header_line = lines.pop(0)
+            if '"' in header_line:
+                raise _CsvFallback()
+            header = header_line.split(",")
+            col_ex(len(set(col.upper() for col in header)) != len(header), edata)
+            yield header
+            # Find start of data row. A data row is defined as one that has at
+            # least one column with a number
+            while True:
+                for num, line in enumerate(lines):
+                    if any(_isnumber(_tofloat(col)) for col in line.split(",")):
+                        lines = lines[num:]
+                        break
+                else:
+                    lines = next(blocks, None)
+                    nvdata_ex(lines is None, edata)
+                    continue
+                break
+        else:
+            yield header
+            lines = next(blocks, None)
+        ncols = len(header)
+        numeric = [True] * ncols
+        cols_upper = None if cols is None else [col.upper() for col in cols]
+        selected = [
+            (cols_upper is None) or (label.upper() in cols_upper) for label in header
+        ]
+        while lines is not None:
+            tokens = _tokenize(lines, ncols)
+            block_cols = []
+            for num in range(ncols):
+                if not selected[num]:
+                    block_cols.append(None)
+                    continue
+                col_tokens = np.array(tokens[num::ncols])
+                ret = _convert_col(col_tokens) if numeric[num] else None
+                if ret is None:
+                    numeric[num] = False
+                    ret = _convert_obj_col(col_tokens)
+                block_cols.append(ret)
+            yield len(lines), block_cols
+            lines = next(blocks, None)
+
+
+def _iter_csv_tables(fname, block_size, fobj=None, header=None, cols=None):
+    """
+    Parse comma-separated values file in blocks, yield a table per block.
+
+    Only one block of the file is held in memory at a time. Raise
+    _CsvFallback if the file cannot be parsed by the columnar engine, which
+    may happen after some tables have been yielded. See
+    :py:func:`_parse_blocks` for the meaning of the fobj, header and cols
+    arguments
+    """
+    blocks = _parse_blocks(fname, block_size, fobj, header, cols)
+    header = next(blocks)
+    for rows, cols in blocks:
+        yield CsvTable._from_block(fname, header, rows, cols)
+
+
+def _read_csv(fname, engine="numpy", cols=None, workers=None):
+    """
+    Read comma-separated values file with the requested engine.
+
+    Tables parsed by the columnar engine are shared through a process-wide
+    cache. Only the columns with the labels in cols are parsed (all columns
+    if cols is None); columns that a cached table does not have are parsed
+    and added to it. The columnar engine falls back to the pcsv module when
+    the file has features it does not handle (quoted fields or ragged rows).
+    Compressed files are always read with the columnar engine, as the pcsv
+    module can only read plain files. If workers is greater than one large
+    plain files are parsed in parallel by that number of worker processes
+    """
+    comp_ex = _exh().addex(
+        RuntimeError,
+        "Compressed file *[fname]* has quoted fields or rows with "
+        "different number of columns",
+    )
+    compressed = _compression(fname) is not None
+    if compressed or (engine.upper() == "NUMPY"):
+        key = _cache_key(fname)
+        with _CACHE.lock:
+            table = _CACHE.get(key, _UNCACHED)
+            if table is None:
+                comp_ex(compressed, _MF("fname", fname))
+                return pcsv.CsvFile(fname)
+            if table is not _UNCACHED:
+                missing = table._missing(cols)
+                if not missing:
+                    return table
+        if table is not _UNCACHED:
+            # Parse missing columns outside the lock so that other files can
+            # be retrieved in the meantime
+            other = CsvTable(fname, missing, workers)
+            with _CACHE.lock:
+                table._merge(other)
+                _CACHE.resize(key)
+            return table
+        try:
+            table = CsvTable(fname, cols, workers)
+        except _CsvFallback:
+            table = None
+        with _CACHE.lock:
+            if key not in _CACHE:
+                _CACHE.put(key, table)
+        if table is not None:
+            return table
+        comp_ex(compressed, _MF("fname", fname))
+    return pcsv.CsvFile(fname)
+
+
+def clear_csv_cache():
+    """
+    Remove all comma-separated values files from the parsed files cache.
+
+    Files read with the 'NUMPY' engine of the :py:class:`pplot.CsvSource`
+    class are parsed once and shared by all the sources that refer to the same
+    file (as long as the file size and modification time do not change)
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import pplot
+        >>> pplot.clear_csv_cache()
+        >>> pplot.csv_cache_info().entries
+        0
+    """
+    _CACHE.clear()
+
+
+def csv_cache_info():
+    """
+    Return parsed comma-separated values files cache statistics.
+
+    :rtype: named tuple with fields :code:`hits` (number of times a file was
+            retrieved from the cache), :code:`misses` (number of times a file
+            had to be parsed), :code:`entries` (number of files in the cache),
+            :code:`size` (approximate cache size in bytes) and
+            :code:`max_size` (maximum cache size in bytes)
+    """
+    return CsvCacheInfo(*_CACHE.info())
+
+
+@pexdoc.pcontracts.contract(max_size="int,>=0")
+def set_csv_cache_size(max_size):
+    r"""
+    Set the maximum size of the parsed comma-separated values files cache.
+
+    Least recently used files are evicted from the cache when the cache size
+    exceeds the maximum. A maximum size of zero disables caching
+
+    :param max_size: Maximum cache size in bytes
+    :type  max_size: non-negative integer
+
+    :raises: RuntimeError (Argument \`max_size\` is not valid)
+    """
+    _CACHE.set_max_size(max_size)
+
+
+###
+# Classes
+###
+class _ByteRange(io.RawIOBase):
+    """Read-only binary stream of a byte range of a file."""
+
+    def __init__(self, fname, start, stop):  # noqa
+        super(_ByteRange, self).__init__()
+        self._fobj = io.open(fname, "rb")
+        self._fobj.seek(start)
+        self._left = stop - start
+
+    def close(self):  # noqa
+        self._fobj.close()
+        super(_ByteRange, self).close()
+
+    def readable(self):  # noqa
+        return True
+
+    def readinto(self, buf):  # noqa
+        data = self._fobj.read(min(len(buf), self._left))
+        buf[: len(data)] = data
+        self._left -= len(data)
+        return len(data)
+
+
+class _CsvFallback(Exception):
+    """Signal that a file cannot be parsed by the columnar engine."""
+
+
+class CsvTable(object):
+    """
+    Columnar representation of a comma-separated values file.
+
+    Each column is parsed into a Numpy vector (float if the column is purely
+    numeric, object otherwise) and a boolean vector that flags empty fields.
+    The header, data start row and value conversion rules mirror those of the
+    `pcsv <https://pcsv.readthedocs.io>`_ module, so that data retrieved with
+    this class is the same as data retrieved with a
+    :code:`pcsv.CsvFile` object
+
+    :param fname: Comma-separated values file name
+    :type  fname: string
+
+    :param cols: Labels (case insensitive) of the columns to parse, other
+                 columns are not held in the table. If None all columns are
+                 parsed
+    :type  cols: list of strings or None
+
+    :param workers: Number of worker processes that parse the file in
+                    parallel (each one a newline-aligned byte range of the
+                    file). If None or 1, or if the file is compressed or too
+                    small to be split, the file is parsed in the calling
+                    process
+    :type  workers: positive integer or None
+    """
+
+    def __init__(self, fname, cols=None, workers=None):  # noqa
+        self._fname = fname
+        self._header = None
+        self._header_upper = None
+        self._cols = None
+        self._rows = 0
+        ret = _parse_ranges(fname, cols, workers)
+        if ret is None:
+            ret = _collect_blocks(_parse_blocks(fname, cols=cols))
+        header, self._rows, chunks = ret
+        self._set_header(header)
+        self._cols = [
+            None
+            if (not col_chunks) or (col_chunks[0] is None)
+            else self._join_chunks(
+                col_chunks, all(item[0].dtype != object for item in col_chunks)
+            )
+            for col_chunks in chunks
+        ]
+        # Tables are shared between sources via the parsed files cache
+        for col in self._cols:
+            if col is not None:
+                col[0].flags.writeable = False
+                if col[1] is not None:
+                    col[1].flags.writeable = False
+
+    @classmethod
+    def _from_block(cls, fname, header, rows, cols):
+        """Create table from a parsed block of a file."""
+        obj = cls.__new__(cls)
+        obj._fname = fname
+        obj._set_header(header)
+        obj._rows = rows
+        obj._cols = [
+            None if col is None else (col[0], col[1] if col[1].any() else None)
+            for col in cols
+        ]
+        return obj
+
+    @staticmethod
+    def _join_chunks(chunks, numeric):
+        """Concatenate per-block column data."""
+        if not numeric:
+            chunks = [
+                (
+                    values
+                    if values.dtype == object
+                    else np.array(
+                        [None if flag else item for flag, item in zip(empty, values)],
+                        dtype=object,
+                    ),
+                    empty,
+                )
+                for values, empty in chunks
+            ]
+        values = np.concatenate([item[0] for item in chunks])
+        empty = np.concatenate([item[1] for item in chunks])
+        return values, (empty if empty.any() else None)
+
+    def _col_index(self, col):
+        return self._header_upper.index(col.upper())
+
+    def _merge(self, other):
+        """Add the columns of another table of the same file that are not held."""
+        for num, col in enumerate(other._cols):
+            if (col is not None) and (self._cols[num] is None):
+                self._cols[num] = col
+
+    def _missing(self, cols):
+        """
+        Return the labels of the columns that are in the file but not held.
+
+        If cols is None all columns are considered
+        """
+        labels = self._header if cols is None else cols
+        return [
+            label
+            for label in labels
+            if (label.upper() in self._header_upper)
+            and (self._cols[self._col_index(label)] is None)
+        ]
+
+    def _set_header(self, header):
+        self._header = header
+        self._header_upper = [col.upper() for col in header]
+
+    def data(self, col, row_mask=None):
+        """
+        Return non-empty column data, optionally filtered by a row mask.
+
+        :param col: Column label (case insensitive)
+        :type  col: string
+
+        :param row_mask: Rows to select, either as a boolean mask or as
+                         (increasing) row indexes. If None all rows are
+                         selected
+        :type  row_mask: boolean Numpy vector, integer Numpy vector or None
+
+        :rtype: Numpy vector
+        """
+        values, empty = self._cols[self._col_index(col)]
+        mask = row_mask
+        if empty is not None:
+            if mask is None:
+                mask = ~empty
+            elif mask.dtype == bool:
+                mask = mask & ~empty
+            else:
+                mask = mask[~empty[mask]]
+        values = values if mask is None else values[mask]
+        if values.dtype == object:
+            return np.array(values.tolist())
+        return values
+
+    @property
+    def nbytes(self):
+        """Approximate memory used by the table data, in bytes."""
+        return sum(
+            col[0].nbytes + (0 if col[1] is None else col[1].nbytes)
+            for col in self._cols
+            if col is not None
+        )
+
+    def groups(self, col, row_mask=None):
+        """
+        Group rows by the (non-empty) values of a column.
+
+        Numeric columns are grouped with a single sort, groups are returned
+        in ascending key order. Groups of non-numeric columns are returned in
+        order of first appearance
+
+        :param col: Column label (case insensitive)
+        :type  col: string
+
+        :param row_mask: Rows to consider. If None all rows are considered
+        :type  row_mask: boolean Numpy vector or None
+
+        :rtype: list of (key, increasing integer Numpy vector of row indexes)
+                tuples
+        """
+        values, empty = self._cols[self._col_index(col)]
+        rows = np.arange(self._rows) if row_mask is None else np.flatnonzero(row_mask)
+        if empty is not None:
+            rows = rows[~empty[rows]]
+        if values.dtype == object:
+            groups = collections.OrderedDict()
+            for row, key in zip(rows, values[rows]):
+                groups.setdefault(key, []).append(row)
+            return [
+                (key, np.array(key_rows, dtype=rows.dtype))
+                for key, key_rows in groups.items()
+            ]
+        keys, inverse = np.unique(values[rows], return_inverse=True)
+        # Stable sort keeps row indexes increasing within each group
+        rows = rows[np.argsort(inverse, kind="mergesort")]
+        bounds = np.cumsum(np.bincount(inverse, minlength=keys.size))[:-1]
+        return [
+            (int(key) if key.is_integer() else float(key), key_rows)
+            for key, key_rows in zip(keys, np.split(rows, bounds))
+        ]
+
+    def header(self):
+        """
+        Return column labels.
+
+        :rtype: list of strings
+        """
+        return self._header
+
+    def row_mask(self, rfilter):
+        """
+        Compute the rows selected by a row filter.
+
+        Comparisons are evaluated on whole columns, rows with an empty field
+        in a filtered column are not selected
+
+        :param rfilter: Row filter specification. If None no row filtering is
+                        performed
+        :type  rfilter: :ref:`RowFilter` *or None*
+
+        :rtype: boolean Numpy vector or None
+        """
+        if not rfilter:
+            return None
+        mask = np.ones(self._rows, dtype=bool)
+        for key, value in rfilter.items():
+            values, empty = self._cols[self._col_index(key)]
+            mask &= _column_mask(values, value, empty)
+        return mask
@@ -30,7 +30,13 @@ exclude_list = [
 # pylint: disable=C0111,C0302,C0413,E0602,E1101,E1103,W0105,W0212,W0611
 
 # Standard library imports
+import collections
+import contextlib
+import copy
+import glob
+import io
 import os
+import threading
 import warnings
 
 # PyPI imports
@@ -38,24 +44,108 @@ if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=RuntimeWarning)
         import numpy as np
-import pexdoc.exh
 import pexdoc.pcontracts
 import pexdoc.pinspect
 from peng import pprint_vector as pprint
-from peng import round_mantissa
-from pcsv.ptypes import csv_row_filter
-import pcsv
 
 # Intra-package imports
 from .constants import PRECISION
+from .csv_engine import (
+    _BLOCK_SIZE,
+    CsvTable,
+    _CsvFallback,
+    _cache_key,
+    _compression,
+    _iter_csv_tables,
+    _match,
+    _read_csv,
+)
 from .functions import (
     _C,
     _MF,
     _SEL,
     DataSource,
+    _bound_slice,
+    _digest,
+    _exh,
+    _increasing,
+    _minmax_decimate,
+    _readonly_view,
+    _round_vector,
+    _save_npy,
+    _check_empty_numpy_vector,
     _check_increasing_real_numpy_vector,
     _check_real_numpy_vector,
 )
+from .fproc_cache import _fproc_key, _memo_get, _memo_put
+from .ptypes import increasing_real_vector, real_vector, row_filter
+
+
+###
+# Global variables
+###
+# Pending data (re)computation stages, each stage includes the ones below it
+_BOUND, _DATA, _FILE = 1, 2, 3
+
+# Format version of the processed data disk cache entries
+_DISK_CACHE_VERSION = 1
+
+# Per-thread function that calls the processing functions of the data sources
+# created or updated in the thread, see _fproc_runner
+_FPROC = threading.local()
+
+
+###
+# Functions
+###
+@contextlib.contextmanager
+def _fproc_runner(runner):
+    """
+    Call processing functions through a runner function in the current thread.
+
+    Within the context the processing functions of the data sources that
+    process data in the current thread are called as
+    :code:`runner(fproc, indep_var, dep_var, fproc_eargs)`, which is how
+    they are sent to worker processes. The processed data is validated as
+    usual
+    """
+    prev, _FPROC.runner = getattr(_FPROC, "runner", None), runner
+    try:
+        yield
+    finally:
+        _FPROC.runner = prev
+
+
+def _pcsv_data(csv_obj, col_label, rfilter):
+    """
+    Retrieve filtered, non-empty column data from a pcsv module object.
+
+    Equality and membership row filters are applied by the pcsv module,
+    comparison row filters are applied to the retrieved rows
+    """
+    rfilter = rfilter or {}
+    eq_filter = {
+        key: value for key, value in rfilter.items() if not isinstance(value, dict)
+    }
+    cmp_filter = [
+        (key, value) for key, value in rfilter.items() if isinstance(value, dict)
+    ]
+    if eq_filter:
+        csv_obj.rfilter = eq_filter
+    else:
+        csv_obj.reset_dfilter()
+    labels = collections.OrderedDict(
+        (label.upper(), label) for label in [col_label] + [key for key, _ in cmp_filter]
+    )
+    csv_obj.cfilter = list(labels.values())
+    upper = list(labels)
+    return [
+        row[0]
+        for row in csv_obj.data(filtered=True, no_empty=True)
+        if all(
+            _match(row[upper.index(key.upper())], value) for key, value in cmp_filter
+        )
+    ]
 
 
 ###
@@ -80,10 +170,12 @@ class CsvSource(DataSource):
                           (case insensitive)
     :type  dep_col_label: string
 
-    :param rfilter: Row filter specification. If None no row filtering is
-                    performed
-    :type  rfilter: `CsvRowFilter <https://pcsv.readthedocs.io/en/stable/
-                    api.html#csvrowfilter>`_ *or None*
+    :param rfilter: Row filter specification. Rows are selected by value
+                    (a single value or a list of values) or by comparison
+                    (a dictionary of comparison operators and values, as
+                    in :code:`{"time": {">=": 1, "<": 5}}`). If None no row
+                    filtering is performed
+    :type  rfilter: :ref:`RowFilter` *or None*
 
     :param indep_min: Minimum independent variable value. If None no minimum
                       thresholding is applied to the data
@@ -105,12 +197,89 @@ class CsvSource(DataSource):
                         (if defined)
     :type  fproc_eargs: dictionary or None
 
+    :param engine: Comma-separated values file parsing engine (case
+                   insensitive), one of 'NUMPY' (file columns are tokenized
+                   directly into Numpy vectors) or 'PCSV' (file is read with
+                   the `pcsv <https://pcsv.readthedocs.io>`_ module). The
+                   'NUMPY' engine falls back to the 'PCSV' engine for files
+                   that have quoted fields or rows with different number of
+                   columns. Compressed files are always read with the
+                   'NUMPY' engine
+    :type  engine: :ref:`CsvEngineOption`
+
+    :param lazy: Flag that indicates whether file reading, row filtering and
+                 data processing are deferred until the independent or
+                 dependent variable data is accessed (True) or not (False).
+                 In deferred mode property changes are accumulated and
+                 applied with a single re-computation on next data access,
+                 and exceptions related to the file contents are raised at
+                 that point
+    :type  lazy: boolean
+
+    :param cache_dir: Directory where processed data is cached. If None
+                      processed data is not cached to disk
+    :type  cache_dir: string or None
+
+    :param chunk_size: Size (in characters) of the blocks the file is read
+                       in when streaming it, only the range-bounded data of
+                       each block is kept in memory. If None the whole file is
+                       read at once. Streaming is only supported by the
+                       'NUMPY' engine
+    :type  chunk_size: positive integer or None
+
+    :param decimate: Maximum number of points of the data set. Larger data
+                     sets are decimated keeping the minimum and maximum
+                     dependent variable values of equal-size point buckets
+                     (min/max decimation). If None data is not decimated
+    :type  decimate: integer greater than one, or None
+
+    :param follow: Flag that indicates whether the file is tailed (True) or
+                   not (False). In follow mode the file position up to which
+                   the file has been read is kept, and the
+                   :py:meth:`pplot.CsvSource.refresh` method reads only the
+                   rows appended to the file since then
+    :type  follow: boolean
+
+    :param workers: Number of worker processes that parse the file in
+                    parallel, each one a newline-aligned byte range of the
+                    file. If None the file is parsed by the calling process.
+                    See :py:attr:`pplot.CsvSource.workers`
+    :type  workers: positive integer or None
+
+    :param memoize: Flag that indicates whether the results of the data
+                    processing function are cached (True) or not (False).
+                    See :py:attr:`pplot.CsvSource.memoize`
+    :type  memoize: boolean
+
+    :param round_data: Flag that indicates whether the mantissa of the
+                       independent and dependent variables is rounded
+                       (True) or not (False).
+                       See :py:attr:`pplot.CsvSource.round_data`
+    :type  round_data: boolean
+
     :rtype: :py:class:`pplot.CsvSource`
 
     .. note:: The row where data starts in the comma-separated file is
               auto-detected as the first row that has a number (integer or
               float) in at least one of its columns
 
+    .. note:: Files compressed in the gzip, bzip2 or xz formats (for
+              example :code:`data.csv.gz`) are detected by their content and
+              decompressed on the fly while they are parsed
+
+    .. note:: When the file is streamed the processing function is called
+              once per block with the range-bounded data of the block, and
+              when the data is decimated on the fly (every time the data
+              kept in memory exceeds twice the :code:`decimate` points)
+              buckets span a varying number of points
+
+    .. note:: In follow mode the independent variable has to be strictly
+              increasing, a last line that is not terminated by a newline
+              character is taken to be partially written and it is not read
+              until it is, and processed data is not cached to disk. Only
+              uncompressed files read with the 'NUMPY' engine are tailed,
+              otherwise the whole file is read again when it changes
+
     .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc(exclude=exclude_list)) ]]]
     .. Auto-generated exceptions documentation for
     .. pplot.csv_source.CsvSource.__init__
@@ -118,12 +287,22 @@ class CsvSource(DataSource):
     :raises:
      * OSError (File *[fname]* could not be found)
 
+     * RuntimeError (Argument \`cache_dir\` is not valid)
+
+     * RuntimeError (Argument \`chunk_size\` is not valid)
+
+     * RuntimeError (Argument \`decimate\` is not valid)
+
      * RuntimeError (Argument \`dep_col_label\` is not valid)
 
      * RuntimeError (Argument \`dep_var\` is not valid)
 
+     * RuntimeError (Argument \`engine\` is not valid)
+
      * RuntimeError (Argument \`fname\` is not valid)
 
+     * RuntimeError (Argument \`follow\` is not valid)
+
      * RuntimeError (Argument \`fproc_eargs\` is not valid)
 
      * RuntimeError (Argument \`fproc\` (function *[func_name]*) returned
@@ -139,10 +318,24 @@ class CsvSource(DataSource):
 
      * RuntimeError (Argument \`indep_var\` is not valid)
 
+     * RuntimeError (Argument \`lazy\` is not valid)
+
+     * RuntimeError (Argument \`memoize\` is not valid)
+
      * RuntimeError (Argument \`rfilter\` is not valid)
 
+     * RuntimeError (Argument \`round_data\` is not valid)
+
+     * RuntimeError (Argument \`workers\` is not valid)
+
      * RuntimeError (Column headers are not unique in file *[fname]*)
 
+     * RuntimeError (Compressed file *[fname]* has quoted fields or rows
+       with different number of columns)
+
+     * RuntimeError (Compression format of file *[fname]* is not
+       supported)
+
      * RuntimeError (File *[fname]* has no valid data)
 
      * RuntimeError (File *[fname]* is empty)
@@ -160,6 +353,9 @@ class CsvSource(DataSource):
 
      * TypeError (Processed independent variable is not valid)
 
+     * ValueError (Argument \`engine\` is not one of ['NUMPY', 'PCSV']
+       (case insensitive))
+
      * ValueError (Argument \`fproc\` (function *[func_name]*) does not
        have at least 2 arguments)
 
@@ -213,17 +409,51 @@ class CsvSource(DataSource):
         indep_max=None,
         fproc=None,
         fproc_eargs=None,
+        engine="numpy",
+        lazy=False,
+        cache_dir=None,
+        chunk_size=None,
+        decimate=None,
+        follow=False,
+        workers=None,
+        memoize=False,
+        round_data=True,
     ):  # noqa
         # Private attributes
         super(CsvSource, self).__init__()
+        _exh().addex(
+            RuntimeError, "Argument `lazy` is not valid", not isinstance(lazy, bool)
+        )
+        _exh().addex(
+            RuntimeError,
+            "Argument `follow` is not valid",
+            not isinstance(follow, bool),
+        )
+        self._lazy = lazy
+        self._follow = follow
+        self._file_key = None
+        self._tail_offset = None
+        self._tail_header = None
+        self._tail_bufs = None
+        self._tail_size = 0
+        self._batch_depth = 0
+        self._pending = 0
         self._raw_indep_var = None
         self._raw_dep_var = None
         self._min_indep_var_index = None
         self._max_indep_var_index = None
         self._indep_var_indexes = None
         self._csv_obj = None
+        self._row_mask = None
         self._reverse_data = False
         # Public attributes
+        self._cache_dir = None
+        self._chunk_size = None
+        self._decimate = None
+        self._workers = None
+        self._memoize = False
+        self._round_data = True
+        self._engine = None
         self._indep_min = None
         self._indep_max = None
         self._fname = None
@@ -233,6 +463,13 @@ class CsvSource(DataSource):
         self._fproc = None
         self._fproc_eargs = None
         # Assignment of arguments to attributes.
+        self._set_cache_dir(cache_dir)
+        self._set_chunk_size(chunk_size)
+        self._set_decimate(decimate)
+        self._set_workers(workers)
+        self._set_memoize(memoize)
+        self._set_round_data(round_data)
+        self._set_engine(engine)
         self._set_fproc(fproc)
         self._set_fproc_eargs(fproc_eargs)
         self._set_rfilter(rfilter)
@@ -335,20 +572,657 @@ class CsvSource(DataSource):
         ret += super(CsvSource, self).__str__()
         return ret
 
+    @contextlib.contextmanager
+    def batch_update(self):
+        """
+        Apply several property changes with a single data re-computation.
+
+        Property assignments within the context only store (and validate) the
+        new values. File reading, row filtering and data processing are done
+        once, when the context exits. If an exception is raised within the
+        context or by the data re-computation all properties are restored to
+        the values they had when the context was entered. Contexts can be
+        nested, data is re-computed when the outermost context exits
+
+        .. note:: Within the context the independent and dependent variables
+                  are those before the context was entered
+
+        For example:
+
+        .. code-block:: python
+
+            >>> import os, docs.support, pplot
+            >>> fname = os.path.join(
+            ...     os.path.dirname(docs.support.__file__), "data.csv"
+            ... )
+            >>> obj = pplot.CsvSource(fname, "value2", "value3", {"value1": 0})
+            >>> obj.dep_var.tolist()
+            [3.0, 3.0]
+            >>> with obj.batch_update():
+            ...     obj.rfilter = {"value1": 1}
+            ...     obj.indep_min = 2
+            ...     obj.dep_col_label = "case"
+            >>> obj.dep_var.tolist()
+            [3.0, 4.0, 5.0]
+        """
+        outer = not self._batch_depth
+        state = self.__dict__.copy() if outer else None
+        self._batch_depth += 1
+        try:
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            if outer:
+                self._flush()
+        except Exception:
+            if outer:
+                self.__dict__.clear()
+                self.__dict__.update(state)
+            raise
+
+    @classmethod
+    @pexdoc.pcontracts.contract(fproc="function")
+    def from_columns(
+        cls,
+        fname,
+        indep_col_label,
+        dep_col_labels,
+        rfilter=None,
+        indep_min=None,
+        indep_max=None,
+        fproc=None,
+        fproc_eargs=None,
+        engine="numpy",
+    ):
+        r"""
+        Create one data source per dependent column of a CSV file.
+
+        The file is read and the row filter is applied only once. When no
+        processing function is given the independent variable Numpy vector is
+        shared by all the sources (and it is read-only)
+
+        :param dep_col_labels: Dependent variable column labels
+                               (case insensitive)
+        :type  dep_col_labels: list of strings
+
+        All other arguments are as in the :py:class:`pplot.CsvSource` class
+        constructor
+
+        :rtype: list of :py:class:`pplot.CsvSource` objects, in the same
+                order as the :code:`dep_col_labels` argument
+
+        For example:
+
+        .. code-block:: python
+
+            >>> import os, docs.support, pplot
+            >>> fname = os.path.join(
+            ...     os.path.dirname(docs.support.__file__), "data.csv"
+            ... )
+            >>> obj1, obj2 = pplot.CsvSource.from_columns(
+            ...     fname, "case", ["value2", "value3"], indep_min=6
+            ... )
+            >>> obj1.dep_var.tolist(), obj2.dep_var.tolist()
+            ([1.0, 2.0], [1.0, 3.0])
+            >>> obj1.indep_var is obj2.indep_var
+            True
+
+        .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc(exclude=exclude_list)) ]]]
+        .. Auto-generated exceptions documentation for
+        .. pplot.csv_source.CsvSource.from_columns
+
+        :raises:
+         * OSError (File *[fname]* could not be found)
+
+         * RuntimeError (Argument \`dep_col_label\` is not valid)
+
+         * RuntimeError (Argument \`dep_col_labels\` is not valid)
+
+         * RuntimeError (Argument \`dep_var\` is not valid)
+
+         * RuntimeError (Argument \`engine\` is not valid)
+
+         * RuntimeError (Argument \`fname\` is not valid)
+
+         * RuntimeError (Argument \`fproc_eargs\` is not valid)
+
+         * RuntimeError (Argument \`fproc\` (function *[func_name]*) returned
+           an illegal number of values)
+
+         * RuntimeError (Argument \`fproc\` is not valid)
+
+         * RuntimeError (Argument \`indep_col_label\` is not valid)
+
+         * RuntimeError (Argument \`indep_max\` is not valid)
+
+         * RuntimeError (Argument \`indep_min\` is not valid)
+
+         * RuntimeError (Argument \`indep_var\` is not valid)
+
+         * RuntimeError (Argument \`rfilter\` is not valid)
+
+         * RuntimeError (Column headers are not unique in file *[fname]*)
+
+         * RuntimeError (Compressed file *[fname]* has quoted fields or rows
+           with different number of columns)
+
+         * RuntimeError (Compression format of file *[fname]* is not
+           supported)
+
+         * RuntimeError (File *[fname]* has no valid data)
+
+         * RuntimeError (File *[fname]* is empty)
+
+         * RuntimeError (Processing function *[func_name]* raised an exception
+           when called with the following arguments: ``\n`` indep_var:
+           *[indep_var_value]* ``\n`` dep_var: *[dep_var_value]* ``\n``
+           fproc_eargs: *[fproc_eargs_value]* ``\n`` Exception error:
+           *[exception_error_message]*)
+
+         * TypeError (Argument \`fproc\` (function *[func_name]*) return value
+           is not valid)
+
+         * TypeError (Processed dependent variable is not valid)
+
+         * TypeError (Processed independent variable is not valid)
+
+         * ValueError (Argument \`engine\` is not one of ['NUMPY', 'PCSV']
+           (case insensitive))
+
+         * ValueError (Argument \`fproc\` (function *[func_name]*) does not
+           have at least 2 arguments)
+
+         * ValueError (Argument \`indep_min\` is greater than argument
+           \`indep_max\`)
+
+         * ValueError (Argument \`indep_var\` is empty after
+           \`indep_min\`/\`indep_max\` range bounding)
+
+         * ValueError (Argument \`rfilter\` is empty)
+
+         * ValueError (Arguments \`indep_var\` and \`dep_var\` must have the
+           same number of elements)
+
+         * ValueError (Column *[col_name]* (dependent column label) could not
+           be found in comma-separated file *[fname]* header)
+
+         * ValueError (Column *[col_name]* (independent column label) could not
+           be found in comma-separated file *[fname]* header)
+
+         * ValueError (Column *[col_name]* in row filter not found in comma-
+           separated file *[fname]* header)
+
+         * ValueError (Column *[column_identifier]* not found)
+
+         * ValueError (Extra argument \`*[arg_name]*\` not found in argument
+           \`fproc\` (function *[func_name]*) definition)
+
+         * ValueError (Filtered dependent variable is empty)
+
+         * ValueError (Filtered independent variable is empty)
+
+         * ValueError (Processed dependent variable is empty)
+
+         * ValueError (Processed independent and dependent variables are of
+           different length)
+
+         * ValueError (Processed independent variable is empty)
+
+        .. [[[end]]]
+        """
+        _exh().addex(
+            RuntimeError,
+            "Argument `dep_col_labels` is not valid",
+            (not isinstance(dep_col_labels, list))
+            or (not dep_col_labels)
+            or any(not isinstance(item, str) for item in dep_col_labels),
+        )
+        # Template source holds the filtered file data before processing
+        tobj = cls(
+            fname,
+            indep_col_label,
+            dep_col_labels[0],
+            rfilter=rfilter,
+            indep_min=indep_min,
+            indep_max=indep_max,
+            fproc_eargs=fproc_eargs,
+            engine=engine,
+        )
+        if isinstance(tobj._csv_obj, CsvTable):
+            # Only the template columns have been parsed
+            tobj._csv_obj = _read_csv(
+                fname, engine, tobj._columns() + dep_col_labels[1:], tobj.workers
+            )
+        tobj._check_fproc(fproc)
+        tobj._fproc = fproc
+        tobj._check_fproc_eargs()
+        tobj._fproc = None
+        if fproc is None:
+            tobj._raw_indep_var.flags.writeable = False
+        ret = []
+        for num, dep_col_label in enumerate(dep_col_labels):
+            obj = copy.copy(tobj)
+            if num:
+                obj._dep_col_label = dep_col_label
+                obj._get_dep_var_from_file()
+            obj._fproc = fproc
+            obj._process_data()
+            ret.append(obj)
+        return ret
+
+    def refresh(self):
+        """
+        Read the file again if it changed since it was last read.
+
+        In follow mode only the complete rows appended to the file since it
+        was last read are parsed, row filtered, range bounded and processed,
+        and they are added to the independent and dependent variables. The
+        whole file is read again if it is not tailed or if it is shorter
+        than the data already read (for example when it is re-written)
+
+        :rtype: boolean, True if new data was read, False otherwise
+
+        For example:
+
+        .. code-block:: python
+
+            >>> import pmisc, pplot
+            >>> with pmisc.TmpFile() as fname:
+            ...     with open(fname, "w") as fobj:
+            ...         _ = fobj.write("Time,Value\\n1,10\\n2,20\\n")
+            ...     obj = pplot.CsvSource(fname, "Time", "Value", follow=True)
+            ...     with open(fname, "a") as fobj:
+            ...         _ = fobj.write("3,30\\n4,")
+            ...     print(obj.refresh(), obj.dep_var.tolist())
+            ...     print(obj.refresh(), obj.dep_var.tolist())
+            True [10.0, 20.0, 30.0]
+            False [10.0, 20.0, 30.0]
+        """
+        self._flush()
+        if (self._tail_offset is not None) and (
+            os.path.getsize(self.fname) >= self._tail_offset
+        ):
+            offset = self._tail_offset
+            try:
+                self._stream(self._tail_tables(), append=True)
+            except _CsvFallback:
+                self._reload()
+                return True
+            if self._tail_offset == offset:
+                return False
+            self._decimate_data()
+            return True
+        if _cache_key(self.fname) == self._file_key:
+            return False
+        self._csv_obj = None
+        self._reload()
+        return True
+
+    @classmethod
+    @pexdoc.pcontracts.contract(
+        fname="file_name_exists",
+        group_col=str,
+        rfilter="row_filter",
+        engine="csv_engine_option",
+    )
+    def split_by(
+        cls,
+        fname,
+        group_col,
+        indep_col_label,
+        dep_col_label,
+        rfilter=None,
+        indep_min=None,
+        indep_max=None,
+        fproc=None,
+        fproc_eargs=None,
+        engine="numpy",
+    ):
+        r"""
+        Create one data source per distinct value of a CSV file column.
+
+        This is typically used with parametric sweeps stored in a single file,
+        where a column holds the parameter value of each curve. Each source
+        is equivalent to a source created with a row filter that selects
+        one value of the group column (in addition to the rows selected by
+        the :code:`rfilter` argument), but the file is read once and the rows
+        are grouped in a single pass
+
+        :param group_col: Group column label (case insensitive)
+        :type  group_col: string
+
+        All other arguments are as in the :py:class:`pplot.CsvSource` class
+        constructor
+
+        :rtype: dictionary of :py:class:`pplot.CsvSource` objects keyed by
+                group column value. Empty group column values are ignored
+
+        For example:
+
+        .. code-block:: python
+
+            >>> import os, docs.support, pplot
+            >>> fname = os.path.join(
+            ...     os.path.dirname(docs.support.__file__), "data.csv"
+            ... )
+            >>> objs = pplot.CsvSource.split_by(
+            ...     fname, "value1", "value2", "value3"
+            ... )
+            >>> sorted(objs.keys())
+            [0, 1, 2]
+            >>> objs[1].dep_var.tolist()
+            [3.5, 5.75, 10.11, 8.88]
+            >>> objs[1].rfilter
+            {'value1': 1}
+
+        .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc(exclude=exclude_list)) ]]]
+        .. Auto-generated exceptions documentation for
+        .. pplot.csv_source.CsvSource.split_by
+
+        :raises:
+         * OSError (File *[fname]* could not be found)
+
+         * RuntimeError (Argument \`dep_col_label\` is not valid)
+
+         * RuntimeError (Argument \`dep_var\` is not valid)
+
+         * RuntimeError (Argument \`engine\` is not valid)
+
+         * RuntimeError (Argument \`fname\` is not valid)
+
+         * RuntimeError (Argument \`fproc_eargs\` is not valid)
+
+         * RuntimeError (Argument \`fproc\` (function *[func_name]*) returned
+           an illegal number of values)
+
+         * RuntimeError (Argument \`fproc\` is not valid)
+
+         * RuntimeError (Argument \`group_col\` is not valid)
+
+         * RuntimeError (Argument \`indep_col_label\` is not valid)
+
+         * RuntimeError (Argument \`indep_max\` is not valid)
+
+         * RuntimeError (Argument \`indep_min\` is not valid)
+
+         * RuntimeError (Argument \`indep_var\` is not valid)
+
+         * RuntimeError (Argument \`rfilter\` is not valid)
+
+         * RuntimeError (Column headers are not unique in file *[fname]*)
+
+         * RuntimeError (Compressed file *[fname]* has quoted fields or rows
+           with different number of columns)
+
+         * RuntimeError (Compression format of file *[fname]* is not
+           supported)
+
+         * RuntimeError (File *[fname]* has no valid data)
+
+         * RuntimeError (File *[fname]* is empty)
+
+         * RuntimeError (Processing function *[func_name]* raised an exception
+           when called with the following arguments: ``\n`` indep_var:
+           *[indep_var_value]* ``\n`` dep_var: *[dep_var_value]* ``\n``
+           fproc_eargs: *[fproc_eargs_value]* ``\n`` Exception error:
+           *[exception_error_message]*)
+
+         * TypeError (Argument \`fproc\` (function *[func_name]*) return value
+           is not valid)
+
+         * TypeError (Processed dependent variable is not valid)
+
+         * TypeError (Processed independent variable is not valid)
+
+         * ValueError (Argument \`engine\` is not one of ['NUMPY', 'PCSV']
+           (case insensitive))
+
+         * ValueError (Argument \`fproc\` (function *[func_name]*) does not
+           have at least 2 arguments)
+
+         * ValueError (Argument \`indep_min\` is greater than argument
+           \`indep_max\`)
+
+         * ValueError (Argument \`indep_var\` is empty after
+           \`indep_min\`/\`indep_max\` range bounding)
+
+         * ValueError (Argument \`rfilter\` is empty)
+
+         * ValueError (Arguments \`indep_var\` and \`dep_var\` must have the
+           same number of elements)
+
+         * ValueError (Column *[col_name]* (dependent column label) could not
+           be found in comma-separated file *[fname]* header)
+
+         * ValueError (Column *[col_name]* (group column label) could not be
+           found in comma-separated file *[fname]* header)
+
+         * ValueError (Column *[col_name]* (independent column label) could not
+           be found in comma-separated file *[fname]* header)
+
+         * ValueError (Column *[col_name]* in row filter not found in comma-
+           separated file *[fname]* header)
+
+         * ValueError (Column *[column_identifier]* not found)
+
+         * ValueError (Extra argument \`*[arg_name]*\` not found in argument
+           \`fproc\` (function *[func_name]*) definition)
+
+         * ValueError (Filtered dependent variable is empty)
+
+         * ValueError (Filtered independent variable is empty)
+
+         * ValueError (Processed dependent variable is empty)
+
+         * ValueError (Processed independent and dependent variables are of
+           different length)
+
+         * ValueError (Processed independent variable is empty)
+
+        .. [[[end]]]
+        """
+        group_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* (group column label) could not be found "
+            "in comma-separated file *[fname]* header",
+        )
+        rfilter_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* in row filter not found "
+            "in comma-separated file *[fname]* header",
+        )
+        csv_obj = _read_csv(
+            fname,
+            engine,
+            [
+                label
+                for label in [group_col, indep_col_label, dep_col_label]
+                + list(rfilter or {})
+                if isinstance(label, str)
+            ],
+        )
+        group_ex(
+            group_col not in csv_obj.header(),
+            _MF("col_name", group_col, "fname", fname),
+        )
+        for key in rfilter or {}:
+            rfilter_ex(
+                key not in csv_obj.header(), _MF("col_name", key, "fname", fname)
+            )
+        if isinstance(csv_obj, CsvTable):
+            groups = csv_obj.groups(group_col, csv_obj.row_mask(rfilter))
+        else:
+            # Row filtering is done by the pcsv module for each group
+            data = _pcsv_data(csv_obj, group_col, rfilter)
+            groups = [(key, None) for key in collections.OrderedDict.fromkeys(data)]
+        ret = {}
+        tobj = None
+        for key, rows in groups:
+            grfilter = dict(rfilter or {})
+            grfilter[group_col] = key
+            if (tobj is None) or (rows is None):
+                tobj = cls(
+                    fname,
+                    indep_col_label,
+                    dep_col_label,
+                    rfilter=grfilter,
+                    indep_min=indep_min,
+                    indep_max=indep_max,
+                    fproc=fproc,
+                    fproc_eargs=fproc_eargs,
+                    engine=engine,
+                )
+                ret[key] = tobj
+                continue
+            # Sources other than the first one share the parsed table and
+            # only need to retrieve their rows
+            obj = copy.copy(tobj)
+            obj._rfilter = grfilter
+            obj._row_mask = rows
+            obj._reverse_data = False
+            obj._raw_indep_var = None
+            obj._raw_dep_var = None
+            obj._indep_var_indexes = None
+            obj._get_indep_var_from_file()
+            obj._get_dep_var_from_file()
+            obj._process_data()
+            ret[key] = obj
+        return ret
+
+    def _append_data(self, indep_var, dep_var):
+        """
+        Append range-bounded data to the tail buffers.
+
+        The buffers capacity is doubled when they are full, so appending data
+        takes amortized time proportional to the size of the appended data
+        """
+        indep_ex = _exh().addex(RuntimeError, "Argument `indep_var` is not valid")
+        indep_var = _round_vector(indep_var, self.round_data)
+        dep_var = _round_vector(dep_var, self.round_data)
+        size = self._tail_size
+        indep_ex(
+            bool((np.diff(indep_var) <= 0).any())
+            or bool(size and (indep_var[0] <= self._tail_bufs[0][size - 1]))
+        )
+        new_size = size + indep_var.size
+        if (self._tail_bufs is None) or (new_size > self._tail_bufs[0].size):
+            bufs = (np.empty(2 * new_size), np.empty(2 * new_size))
+            if size:
+                bufs[0][:size] = self._tail_bufs[0][:size]
+                bufs[1][:size] = self._tail_bufs[1][:size]
+            self._tail_bufs = bufs
+        self._tail_bufs[0][size:new_size] = indep_var
+        self._tail_bufs[1][size:new_size] = dep_var
+        self._tail_size = new_size
+        if _C(self.decimate) and (new_size > 2 * self.decimate):
+            indep_var, dep_var = _minmax_decimate(
+                self._tail_bufs[0][:new_size],
+                self._tail_bufs[1][:new_size],
+                self.decimate,
+            )
+            self._tail_size = indep_var.size
+            self._tail_bufs[0][: indep_var.size] = indep_var
+            self._tail_bufs[1][: dep_var.size] = dep_var
+
     def _apply_rfilter(self):
         """Apply row filters to loaded data."""
         # pylint: disable=C1801
         self._check_rfilter()
-        if _C(self.rfilter, self._csv_obj) and len(self.rfilter):
-            self._csv_obj.rfilter = self.rfilter
-        elif _C(self._csv_obj):
-            self._csv_obj.reset_dfilter()
+        if isinstance(self._csv_obj, CsvTable):
+            self._row_mask = self._csv_obj.row_mask(self.rfilter)
         self._get_indep_var_from_file()
         self._get_dep_var_from_file()
 
+    def _call_fproc(self, indep_var, dep_var):
+        """Process data through call-back function, validate processed data."""
+        # pylint: disable=R0914,W0110,W0141,W0703
+        invalid_ret_ex = _exh().addex(
+            TypeError,
+            "Argument `fproc` (function *[func_name]*) " "return value is not valid",
+        )
+        illegal_ret_ex = _exh().addex(
+            RuntimeError,
+            "Argument `fproc` (function *[func_name]*) "
+            "returned an illegal number of values",
+        )
+        length_ex = _exh().addex(
+            ValueError,
+            "Processed independent and dependent variables " "are of different length",
+        )
+        empty_indep_ex = _exh().addex(
+            ValueError, "Processed independent variable is empty"
+        )
+        illegal_indep_ex = _exh().addex(
+            TypeError, "Processed independent variable is not valid"
+        )
+        empty_dep_ex = _exh().addex(ValueError, "Processed dependent variable is empty")
+        illegal_dep_ex = _exh().addex(
+            TypeError, "Processed dependent variable is not valid"
+        )
+        proc_fun_ex = _exh().addex(
+            RuntimeError,
+            "Processing function *[func_name]* raised an exception when "
+            "called with the following arguments:\n"
+            "indep_var: *[indep_var_value]*\n"
+            "dep_var: *[dep_var_value]*\n"
+            "fproc_eargs: *[fproc_eargs_value]*\n"
+            "Exception error: *[exception_error_message]*",
+        )
+        key = None
+        if self.memoize:
+            key = _fproc_key(self.fproc, self.fproc_eargs, indep_var, dep_var)
+        if key is not None:
+            ret = _memo_get(key, self.cache_dir)
+            if ret is not None:
+                return ret
+        fproc_eargs = self.fproc_eargs or {}
+        runner = getattr(_FPROC, "runner", None)
+        try:
+            if runner is None:
+                ret = self.fproc(indep_var, dep_var, **fproc_eargs)
+            else:
+                ret = runner(self.fproc, indep_var, dep_var, fproc_eargs)
+        except Exception as error_msg:
+            if fproc_eargs:
+                eamsg = "\n"
+                template = "   {key}: {value}\n"
+                for key, value in self.fproc_eargs.items():
+                    eamsg += template.format(key=key, value=value)
+            eamsg = eamsg.rstrip() if fproc_eargs else "None"
+            proc_fun_ex(
+                True,
+                edata=_MF(
+                    "func_name",
+                    self.fproc.__name__,
+                    "indep_var_value",
+                    pprint(indep_var, limit=10),
+                    "dep_var_value",
+                    pprint(indep_var, limit=10),
+                    "fproc_eargs_value",
+                    eamsg,
+                    "exception_error_message",
+                    str(error_msg),
+                ),
+            )
+        invalid_ret_ex(
+            not isinstance(ret, (list, tuple)), _MF("func_name", self.fproc.__name__)
+        )
+        illegal_ret_ex(len(ret) != 2, _MF("func_name", self.fproc.__name__))
+        indep_var = ret[0]
+        dep_var = ret[1]
+        empty_indep_ex(_check_empty_numpy_vector(indep_var))
+        illegal_indep_ex(_check_increasing_real_numpy_vector(indep_var))
+        empty_dep_ex(_check_empty_numpy_vector(dep_var))
+        illegal_dep_ex(_check_real_numpy_vector(dep_var))
+        length_ex(indep_var.size != dep_var.size)
+        if key is not None:
+            return _memo_put(key, (indep_var, dep_var), self.cache_dir)
+        return indep_var, dep_var
+
     def _check_dep_col_label(self):
         """Check that dependent column label is in CSV file header."""
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Column *[col_name]* (dependent column label) could not be"
             " found in comma-separated file *[fname]* header",
@@ -359,7 +1233,7 @@ class CsvSource(DataSource):
 
     def _check_rfilter(self):
         """Check that columns in filter specification are in CSV file header."""
-        rfilter_ex = pexdoc.exh.addex(
+        rfilter_ex = _exh().addex(
             ValueError,
             "Column *[col_name]* in row filter not found "
             "in comma-separated file *[fname]* header",
@@ -371,9 +1245,23 @@ class CsvSource(DataSource):
                     _MF("col_name", key, "fname", self.fname),
                 )
 
+    def _check_fproc(self, fproc):
+        """Check that the processing function has at least two arguments."""
+        min_args_ex = _exh().addex(
+            ValueError,
+            "Argument `fproc` (function *[func_name]*) "
+            "does not have at least 2 arguments",
+        )
+        if fproc is not None:
+            args = pexdoc.pinspect.get_function_args(fproc)
+            min_args_ex(
+                (len(args) < 2) and ("*args" not in args) and ("**kwargs" not in args),
+                _MF("func_name", fproc.__name__),
+            )
+
     def _check_indep_col_label(self):
         """Check that independent column label is in CSV file header."""
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Column *[col_name]* (independent column label) could not"
             " be found in comma-separated file *[fname]* header",
@@ -384,7 +1272,7 @@ class CsvSource(DataSource):
 
     def _check_fproc_eargs(self):
         """Check that the extra arguments are in the processing function definition."""
-        eargs_ex = pexdoc.exh.addex(
+        eargs_ex = _exh().addex(
             ValueError,
             "Extra argument `*[arg_name]*` not found in argument "
             "`fproc` (function *[func_name]*) definition",
@@ -398,23 +1286,136 @@ class CsvSource(DataSource):
                     _MF("func_name", fname, "arg_name", key),
                 )
 
+    def _columns(self):
+        """Return the labels of the file columns the data set is built from."""
+        labels = [self.indep_col_label, self.dep_col_label] + list(self.rfilter or {})
+        return [label for label in labels if isinstance(label, str)]
+
+    def _decimate_data(self):
+        """Decimate range-bounded data."""
+        if (not _C(self.decimate, self.indep_var, self.dep_var)) or (
+            self.indep_var.size <= self.decimate
+        ):
+            return
+        indep_var, dep_var = _minmax_decimate(
+            self.indep_var, self.dep_var, self.decimate
+        )
+        self._raw_indep_var = None
+        self._raw_dep_var = None
+        self._indep_var_indexes = None
+        self._set_indep_var(indep_var)
+        self._set_dep_var(dep_var)
+
+    def _defer(self, stage):
+        """
+        Flag data (re)computation stage as pending if computation is deferred.
+
+        Return True if computation is deferred (lazy mode or within a batch
+        update), False otherwise
+        """
+        if self._lazy or self._batch_depth:
+            self._pending = max(self._pending, stage)
+            return True
+        return False
+
+    def _disk_cache_names(self):
+        """
+        Return disk cache entry file name and file name pattern of all versions.
+
+        An entry is identified by the data it holds (file, columns, row filter,
+        range bounding, processing function extra arguments, streaming,
+        decimation and rounding); its version changes when the file or the processing
+        function change. None is returned if the processing function or its
+        extra arguments cannot be identified reliably, their data is not cached
+        """
+        try:
+            ident = _digest(
+                (
+                    os.path.realpath(self.fname),
+                    self.indep_col_label,
+                    self.dep_col_label,
+                    self.rfilter,
+                    self.indep_min,
+                    self.indep_max,
+                    self.fproc_eargs,
+                    self.chunk_size,
+                    self.decimate,
+                    self.round_data,
+                ),
+                strict=True,
+            )
+            version = _digest(
+                (_cache_key(self.fname), self.fproc, PRECISION, _DISK_CACHE_VERSION),
+                strict=True,
+            )
+        except TypeError:
+            return None
+        return (
+            os.path.join(self.cache_dir, "{0}_{1}.npy".format(ident, version)),
+            os.path.join(self.cache_dir, "{0}_*.npy".format(ident)),
+        )
+
+    def _flush(self):
+        """Carry out pending data (re)computation, if any."""
+        pending, self._pending = self._pending, 0
+        if not pending:
+            return
+        try:
+            if pending >= _FILE:
+                self._csv_obj = None
+            if pending >= _DATA:
+                self._check_fproc_eargs()
+                self._reload()
+            else:
+                self._update_indep_var()
+                self._update_dep_var()
+        except Exception:
+            self._pending = pending
+            raise
+
+    def _get_cache_dir(self):
+        return self._cache_dir
+
+    def _get_chunk_size(self):
+        return self._chunk_size
+
+    def _get_col_from_file(self, col_label):
+        """Retrieve filtered, non-empty column data from CSV file."""
+        if isinstance(self._csv_obj, CsvTable):
+            return self._csv_obj.data(col_label, self._row_mask)
+        return np.array(_pcsv_data(self._csv_obj, col_label, self.rfilter))
+
+    def _get_complete(self):
+        if not self._batch_depth:
+            self._flush()
+        return super(CsvSource, self)._get_complete()
+
+    def _get_decimate(self):
+        return self._decimate
+
     def _get_dep_col_label(self):
         return self._dep_col_label
 
+    def _get_dep_var(self):
+        if not self._batch_depth:
+            self._flush()
+        return self._dep_var
+
     def _get_dep_var_from_file(self):
         """Retrieve dependent data variable from CSV file."""
-        empty_ex = pexdoc.exh.addex(ValueError, "Filtered dependent variable is empty")
+        empty_ex = _exh().addex(ValueError, "Filtered dependent variable is empty")
         if _C(self._csv_obj, self.dep_col_label):
             # When object is given all arguments at construction the column
             # label checking cannot happen at property assignment because file
             # data is not yet loaded
             self._check_dep_col_label()
-            self._csv_obj.cfilter = self.dep_col_label
-            args = dict(filtered=True, no_empty=True)
-            data = np.array([row[0] for row in self._csv_obj.data(**args)])
+            data = self._get_col_from_file(self.dep_col_label)
             empty_ex(not data.size)
             self._set_dep_var(data[::-1] if self._reverse_data else data)
 
+    def _get_engine(self):
+        return self._engine
+
     def _get_fname(self):
         return self._fname
 
@@ -433,110 +1434,68 @@ class CsvSource(DataSource):
     def _get_indep_min(self):
         return self._indep_min
 
+    def _get_indep_var(self):
+        if not self._batch_depth:
+            self._flush()
+        return self._indep_var
+
     def _get_indep_var_from_file(self):
         """Retrieve independent data variable from CSV file."""
-        empty_ex = pexdoc.exh.addex(
-            ValueError, "Filtered independent variable is empty"
-        )
+        empty_ex = _exh().addex(ValueError, "Filtered independent variable is empty")
         if _C(self._csv_obj, self.indep_col_label):
             # When object is given all arguments at construction the column
             # label checking cannot happen at property assignment because file
             # data is not yet loaded
             self._check_indep_col_label()
-            self._csv_obj.cfilter = self.indep_col_label
-            args = dict(filtered=True, no_empty=True)
-            data = np.array([row[0] for row in self._csv_obj.data(**args)])
+            data = self._get_col_from_file(self.indep_col_label)
             empty_ex(not data.size)
             # Flip data if it is in descending order (affects interpolation)
-            if max(np.diff(data)) < 0:
+            if (data.size > 1) and _increasing(data[::-1]):
                 self._reverse_data = True
                 data = data[::-1]
             self._set_indep_var(data)
 
+    def _get_memoize(self):
+        return self._memoize
+
     def _get_rfilter(self):
         return self._rfilter
 
+    def _get_round_data(self):
+        return self._round_data
+
+    def _get_workers(self):
+        return self._workers
+
+    def _load_disk_cache(self):
+        """Retrieve processed data from disk cache, return True if found."""
+        if not _C(self.cache_dir, self.fname, self.indep_col_label, self.dep_col_label):
+            return False
+        names = self._disk_cache_names()
+        if names is None:
+            return False
+        try:
+            data = np.load(names[0], mmap_mode="r")
+        except (IOError, OSError, ValueError):
+            return False
+        if (data.ndim != 2) or (data.shape[0] != 2) or (data.dtype != np.float64):
+            return False
+        # Cached data is already rounded and validated, it is memory-mapped and
+        # only the range-bounded data is copied to memory
+        self._raw_indep_var, self._raw_dep_var = data[0], data[1]
+        self._update_indep_var()
+        self._update_dep_var()
+        return True
+
     def _process_data(self):
         """Process data through call-back function."""
-        # pylint: disable=R0914,W0110,W0141,W0703
-        invalid_ret_ex = pexdoc.exh.addex(
-            TypeError,
-            "Argument `fproc` (function *[func_name]*) " "return value is not valid",
-        )
-        illegal_ret_ex = pexdoc.exh.addex(
-            RuntimeError,
-            "Argument `fproc` (function *[func_name]*) "
-            "returned an illegal number of values",
-        )
-        length_ex = pexdoc.exh.addex(
-            ValueError,
-            "Processed independent and dependent variables " "are of different length",
-        )
-        empty_indep_ex = pexdoc.exh.addex(
-            ValueError, "Processed independent variable is empty"
-        )
-        illegal_indep_ex = pexdoc.exh.addex(
-            TypeError, "Processed independent variable is not valid"
-        )
-        empty_dep_ex = pexdoc.exh.addex(
-            ValueError, "Processed dependent variable is empty"
-        )
-        illegal_dep_ex = pexdoc.exh.addex(
-            TypeError, "Processed dependent variable is not valid"
-        )
-        proc_fun_ex = pexdoc.exh.addex(
-            RuntimeError,
-            "Processing function *[func_name]* raised an exception when "
-            "called with the following arguments:\n"
-            "indep_var: *[indep_var_value]*\n"
-            "dep_var: *[dep_var_value]*\n"
-            "fproc_eargs: *[fproc_eargs_value]*\n"
-            "Exception error: *[exception_error_message]*",
-        )
         if not _C(self.fproc, self.indep_var, self.dep_var):
             return
-        fproc_eargs = self.fproc_eargs or {}
-        try:
-            ret = self.fproc(self.indep_var, self.dep_var, **fproc_eargs)
-        except Exception as error_msg:
-            if fproc_eargs:
-                eamsg = "\n"
-                template = "   {key}: {value}\n"
-                for key, value in self.fproc_eargs.items():
-                    eamsg += template.format(key=key, value=value)
-            eamsg = eamsg.rstrip() if fproc_eargs else "None"
-            proc_fun_ex(
-                True,
-                edata=_MF(
-                    "func_name",
-                    self.fproc.__name__,
-                    "indep_var_value",
-                    pprint(self.indep_var, limit=10),
-                    "dep_var_value",
-                    pprint(self.indep_var, limit=10),
-                    "fproc_eargs_value",
-                    eamsg,
-                    "exception_error_message",
-                    str(error_msg),
-                ),
-            )
-        invalid_ret_ex(
-            not isinstance(ret, (list, tuple)), _MF("func_name", self.fproc.__name__)
-        )
-        illegal_ret_ex(len(ret) != 2, _MF("func_name", self.fproc.__name__))
-        indep_var = ret[0]
-        dep_var = ret[1]
-        empty_indep_ex(
-            isinstance(indep_var, np.ndarray)
-            and not list(filter(lambda x: x is not None, indep_var))
-        )
-        illegal_indep_ex(_check_increasing_real_numpy_vector(indep_var))
-        empty_dep_ex(
-            isinstance(dep_var, np.ndarray)
-            and not list(filter(lambda x: x is not None, dep_var))
+        # The range-bounded data are read-only views of the data set, the
+        # processing function may modify its arguments in place
+        indep_var, dep_var = self._call_fproc(
+            self.indep_var.copy(), self.dep_var.copy()
         )
-        illegal_dep_ex(_check_real_numpy_vector(dep_var))
-        length_ex(indep_var.size != dep_var.size)
         # The processing function could potentially expand (say, via
         # interpolation) or shorten the data set length. To avoid errors
         # that dependent and independent variables have different number
@@ -549,49 +1508,139 @@ class CsvSource(DataSource):
         self._set_indep_var(indep_var)
         self._set_dep_var(dep_var)
 
+    def _reload(self):
+        """Retrieve data from file and process it."""
+        # The processing function may have changed the data set length, reset
+        # data so that it is not compared against the newly retrieved data
+        self._raw_indep_var = None
+        self._raw_dep_var = None
+        self._indep_var_indexes = None
+        self._reverse_data = False
+        self._tail_offset, self._tail_header = None, None
+        self._tail_bufs, self._tail_size = None, 0
+        self._file_key = None if self.fname is None else _cache_key(self.fname)
+        if (not self._follow) and self._load_disk_cache():
+            return
+        streamed = False
+        if _C(self.fname) and (self.engine == "NUMPY"):
+            try:
+                if self._follow and (_compression(self.fname) is None):
+                    self._tail_offset = 0
+                    self._stream(self._tail_tables())
+                    streamed = True
+                elif self.chunk_size is not None:
+                    self._stream()
+                    streamed = True
+            except _CsvFallback:
+                self._raw_indep_var = None
+                self._raw_dep_var = None
+                self._tail_offset = None
+                self._tail_bufs, self._tail_size = None, 0
+        if not streamed:
+            if (self.fname is not None) and (
+                (self._csv_obj is None)
+                or (
+                    isinstance(self._csv_obj, CsvTable)
+                    and self._csv_obj._missing(self._columns())
+                )
+            ):
+                self._csv_obj = _read_csv(
+                    self.fname, self.engine, self._columns(), self.workers
+                )
+            self._apply_rfilter()  # This also gets indep_var,dep_var from file
+            self._process_data()
+        self._decimate_data()
+        if not self._follow:
+            self._save_disk_cache()
+
+    def _rebound(self):
+        """Apply new independent variable range bounding."""
+        # Decimated, streamed or tailed data does not hold the points that are
+        # outside the previous range, the data has to be read again
+        if (
+            (self.decimate is not None)
+            or (self.chunk_size is not None)
+            or (self._tail_offset is not None)
+        ):
+            if not self._defer(_DATA):
+                self._reload()
+        elif not self._defer(_BOUND):
+            self._update_indep_var()
+            self._update_dep_var()
+
+    def _save_disk_cache(self):
+        """Store processed data in disk cache, replacing outdated versions."""
+        if not _C(self.cache_dir, self.fname, self._raw_indep_var, self._raw_dep_var):
+            return
+        names = self._disk_cache_names()
+        if names is None:
+            return
+        fname, pattern = names
+        data = np.vstack([self._raw_indep_var, self._raw_dep_var]).astype(np.float64)
+        # The cache is an optimization, failing to write it is not an error
+        for old_fname in glob.glob(pattern):
+            try:
+                os.remove(old_fname)
+            except OSError:  # pragma: no cover
+                pass
+        _save_npy(fname, data)
+
+    @pexdoc.pcontracts.contract(cache_dir="None|str")
+    def _set_cache_dir(self, cache_dir):
+        self._cache_dir = cache_dir
+
+    @pexdoc.pcontracts.contract(chunk_size="None|(int,>0)")
+    def _set_chunk_size(self, chunk_size):
+        self._chunk_size = chunk_size
+        if not self._defer(_DATA):
+            self._reload()
+
+    @pexdoc.pcontracts.contract(decimate="None|(int,>=2)")
+    def _set_decimate(self, decimate):
+        self._decimate = decimate
+        if not self._defer(_DATA):
+            self._reload()
+
     @pexdoc.pcontracts.contract(dep_col_label=str)
     def _set_dep_col_label(self, dep_col_label):
         self._dep_col_label = dep_col_label
-        self._check_dep_col_label()
-        self._apply_rfilter()
-        self._process_data()
+        if not self._defer(_DATA):
+            self._check_dep_col_label()
+            self._reload()
 
-    @pexdoc.pcontracts.contract(dep_var="real_numpy_vector")
+    @pexdoc.pcontracts.contract(dep_var="real_vector")
     def _set_dep_var(self, dep_var):
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Arguments `indep_var` and `dep_var`"
             " must have the same number of elements",
             self._raw_indep_var.size != dep_var.size,
         )
-        self._raw_dep_var = round_mantissa(dep_var, PRECISION)
+        self._raw_dep_var = _round_vector(dep_var, self.round_data)
         self._update_dep_var()
 
+    @pexdoc.pcontracts.contract(engine="csv_engine_option")
+    def _set_engine(self, engine):
+        self._engine = engine.upper().strip()
+        if (self.fname is not None) and (not self._defer(_FILE)):
+            self._set_fname(self.fname)
+
     @pexdoc.pcontracts.contract(fname="file_name_exists")
     def _set_fname(self, fname):
         # Windows compatibility: repr() escapes the slashes, but need to take
         # out explicit quotes
         self._fname = fname
-        self._csv_obj = pcsv.CsvFile(fname)
-        self._apply_rfilter()  # This also gets indep_var,dep_var from file
-        self._process_data()
+        if not self._defer(_FILE):
+            self._csv_obj = None
+            self._reload()
 
     @pexdoc.pcontracts.contract(fproc="function")
     def _set_fproc(self, fproc):
-        min_args_ex = pexdoc.exh.addex(
-            ValueError,
-            "Argument `fproc` (function *[func_name]*) "
-            "does not have at least 2 arguments",
-        )
-        if fproc is not None:
-            args = pexdoc.pinspect.get_function_args(fproc)
-            min_args_ex(
-                (len(args) < 2) and ("*args" not in args) and ("**kwargs" not in args),
-                _MF("func_name", fproc.__name__),
-            )
+        self._check_fproc(fproc)
         self._fproc = fproc
         self._check_fproc_eargs()
-        self._process_data()
+        if not self._defer(_DATA):
+            self._reload()
 
     @pexdoc.pcontracts.contract(fproc_eargs="None|dict")
     def _set_fproc_eargs(self, fproc_eargs):
@@ -599,98 +1648,299 @@ class CsvSource(DataSource):
         # they are in the function definition
         self._fproc_eargs = fproc_eargs
         self._check_fproc_eargs()
-        self._process_data()
+        if not self._defer(_DATA):
+            self._reload()
 
     @pexdoc.pcontracts.contract(indep_col_label=str)
     def _set_indep_col_label(self, indep_col_label):
         self._indep_col_label = indep_col_label
-        self._check_indep_col_label()
-        self._apply_rfilter()
-        self._process_data()
+        if not self._defer(_DATA):
+            self._check_indep_col_label()
+            self._reload()
 
     @pexdoc.pcontracts.contract(indep_max="real_num")
     def _set_indep_max(self, indep_max):
-        pexdoc.exh.addex(
-            ValueError,
-            "Argument `indep_min` is greater than argument `indep_max`",
-            _C(self.indep_min, indep_max) and (indep_max < self.indep_min),
-        )
-        self._indep_max = (
-            round_mantissa(indep_max, PRECISION)
-            if not isinstance(indep_max, int)
-            else indep_max
-        )
+        self._set_indep_range(self.indep_min, indep_max)
         # Apply minimum and maximum range bounding and assign it to
         # self._indep_var and thus this is what self.indep_var returns
-        self._update_indep_var()
-        self._update_dep_var()
+        self._rebound()
 
     @pexdoc.pcontracts.contract(indep_min="real_num")
     def _set_indep_min(self, indep_min):
-        pexdoc.exh.addex(
-            ValueError,
-            "Argument `indep_min` is greater than argument `indep_max`",
-            _C(self.indep_max, indep_min) and (self.indep_max < indep_min),
-        )
-        self._indep_min = (
-            round_mantissa(indep_min, PRECISION)
-            if not isinstance(indep_min, int)
-            else indep_min
-        )
+        self._set_indep_range(indep_min, self.indep_max)
         # Apply minimum and maximum range bounding and assign it to
         # self._indep_var and thus this is what self.indep_var returns
-        self._update_indep_var()
-        self._update_dep_var()
+        self._rebound()
 
-    @pexdoc.pcontracts.contract(indep_var="increasing_real_numpy_vector")
+    @pexdoc.pcontracts.contract(indep_var="increasing_real_vector")
     def _set_indep_var(self, indep_var):
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Arguments `indep_var` and `dep_var`"
             " must have the same number of elements",
             _C(indep_var, self._raw_dep_var)
             and (self._raw_dep_var.size != indep_var.size),
         )
-        self._raw_indep_var = round_mantissa(indep_var, PRECISION)
+        self._raw_indep_var = _round_vector(indep_var, self.round_data)
         # Apply minimum and maximum range bounding and assign it to
         # self._indep_var and thus this is what self.indep_var returns
         self._update_indep_var()
         self._update_dep_var()
 
-    @pexdoc.pcontracts.contract(rfilter="csv_row_filter")
+    @pexdoc.pcontracts.contract(memoize=bool)
+    def _set_memoize(self, memoize):
+        # Cached and computed results are the same, data is not re-processed
+        self._memoize = memoize
+
+    @pexdoc.pcontracts.contract(rfilter="row_filter")
     def _set_rfilter(self, rfilter):
         # pcsv is case insensitive and all caps
         self._rfilter = rfilter
-        self._apply_rfilter()
-        self._process_data()
+        if not self._defer(_DATA):
+            self._reload()
+
+    @pexdoc.pcontracts.contract(round_data=bool)
+    def _set_round_data(self, round_data):
+        self._round_data = round_data
+        if not self._defer(_DATA):
+            self._reload()
+
+    @pexdoc.pcontracts.contract(workers="None|(int,>0)")
+    def _set_workers(self, workers):
+        # The data does not depend on how the file is parsed, only files
+        # read from now on are affected
+        self._workers = workers
+
+    def _stream(self, tables=None, append=False):
+        """
+        Read, filter, bound and process the file data one block at a time.
+
+        Only the range-bounded data is kept in memory (decimated on the fly
+        if decimation is requested). When the file is tailed the data is
+        added to the tail buffers; if append is True the tables hold the rows
+        appended to the file since it was last read
+        """
+        # pylint: disable=R0914
+        filter_ex = _exh().addex(ValueError, "Filtered independent variable is empty")
+        bound_ex = _exh().addex(
+            ValueError,
+            "Argument `indep_var` is empty after "
+            "`indep_min`/`indep_max` range bounding",
+        )
+        length_ex = _exh().addex(
+            ValueError,
+            "Arguments `indep_var` and `dep_var`"
+            " must have the same number of elements",
+        )
+        tail = self._tail_offset is not None
+        indep_chunks, dep_chunks = [], []
+        # Blocks are buffered until the data order can be determined, tailed
+        # data has to be in ascending order
+        pending, reverse, found = [], (False if tail else None), False
+        join = lambda chunks: np.concatenate(chunks[::-1] if reverse else chunks)
+
+        def add_block(indep_var, dep_var):
+            if reverse:
+                indep_var, dep_var = indep_var[::-1], dep_var[::-1]
+            indep_var = _round_vector(indep_var, self.round_data)
+            indexes = np.where(
+                (indep_var >= _SEL(self.indep_min, -np.inf))
+                & (indep_var <= _SEL(self.indep_max, np.inf))
+            )
+            indep_var, dep_var = indep_var[indexes], dep_var[indexes]
+            if not indep_var.size:
+                return
+            if self.fproc is not None:
+                indep_var, dep_var = self._call_fproc(indep_var, dep_var)
+            if tail:
+                self._append_data(indep_var, dep_var)
+                return
+            indep_chunks.append(indep_var)
+            dep_chunks.append(dep_var)
+            if _C(self.decimate) and (
+                sum(item.size for item in indep_chunks) > 2 * self.decimate
+            ):
+                indep_var, dep_var = _minmax_decimate(
+                    join(indep_chunks), join(dep_chunks), self.decimate
+                )
+                indep_chunks[:], dep_chunks[:] = [indep_var], [dep_var]
+
+        if tables is None:
+            tables = _iter_csv_tables(self.fname, self.chunk_size, cols=self._columns())
+        for num, table in enumerate(tables):
+            if (not num) and (not append):
+                self._csv_obj = table
+                self._check_indep_col_label()
+                self._check_dep_col_label()
+                self._check_rfilter()
+                self._csv_obj = None
+            mask = table.row_mask(self.rfilter)
+            indep_var = table.data(self.indep_col_label, mask)
+            dep_var = table.data(self.dep_col_label, mask)
+            length_ex(indep_var.size != dep_var.size)
+            if not indep_var.size:
+                continue
+            found = True
+            if reverse is not None:
+                add_block(indep_var, dep_var)
+                continue
+            pending.append((indep_var, dep_var))
+            head = np.concatenate([item[0] for item in pending[:2]])
+            if head.size > 1:
+                # Flip data if it is in descending order (affects
+                # interpolation), blocks are then joined in reverse order
+                reverse = bool(head[1] < head[0])
+                for item in pending:
+                    add_block(*item)
+                pending = []
+        if tail:
+            filter_ex((not append) and (not found))
+            bound_ex((not append) and (not self._tail_size))
+            self._update_tail_data()
+            return
+        filter_ex(not found)
+        reverse = bool(reverse)
+        for item in pending:
+            add_block(*item)
+        bound_ex(not indep_chunks)
+        self._set_indep_var(join(indep_chunks))
+        self._set_dep_var(join(dep_chunks))
+
+    def _tail_tables(self):
+        """
+        Parse the rows appended to the file since it was last read.
+
+        Only complete (newline-terminated) lines are parsed, a table is
+        yielded per block
+        """
+        with io.open(self.fname, "rb") as fobj:
+            fobj.seek(self._tail_offset)
+            data = fobj.read()
+        data = data[: data.rfind(b"\n") + 1]
+        if (not data) and (self._tail_header is not None):
+            return
+        self._tail_offset += len(data)
+        tables = _iter_csv_tables(
+            self.fname,
+            _SEL(self.chunk_size, _BLOCK_SIZE),
+            io.TextIOWrapper(io.BytesIO(data)),
+            self._tail_header,
+            self._columns(),
+        )
+        for table in tables:
+            self._tail_header = table.header()
+            yield table
 
     def _update_dep_var(self):
         """Update dependent variable to match independent variable range bounding."""
         self._dep_var = self._raw_dep_var
         if _C(self._indep_var_indexes, self._raw_dep_var):
-            super(CsvSource, self)._set_dep_var(
-                self._raw_dep_var[self._indep_var_indexes]
-            )
+            self._dep_var = self._raw_dep_var[self._indep_var_indexes]
+            self._dep_var.flags.writeable = False
 
     def _update_indep_var(self):
         """Update independent variable according to its minimum and maximum limits."""
-        empty_ex = pexdoc.exh.addex(
+        empty_ex = _exh().addex(
             ValueError,
             "Argument `indep_var` is empty after "
             "`indep_min`/`indep_max` range bounding",
         )
         if self._raw_indep_var is not None:
-            indep_min = _SEL(self.indep_min, self._raw_indep_var[0])
-            indep_max = _SEL(self.indep_max, self._raw_indep_var[-1])
-            min_indexes = self._raw_indep_var >= indep_min
-            max_indexes = self._raw_indep_var <= indep_max
-            self._indep_var_indexes = np.where(min_indexes & max_indexes)
-            super(CsvSource, self)._set_indep_var(
-                self._raw_indep_var[self._indep_var_indexes]
+            # The independent variable is increasing, the range-bounded data
+            # is a slice (and the variables are views) of the data set
+            self._indep_var_indexes = _bound_slice(
+                self._raw_indep_var, self.indep_min, self.indep_max
             )
+            self._indep_var = self._raw_indep_var[self._indep_var_indexes]
+            self._indep_var.flags.writeable = False
             empty_ex(not self.indep_var.size)
 
+    def _update_tail_data(self):
+        """Set independent and dependent variables to the tail buffers data."""
+        if self._tail_size:
+            self._raw_indep_var = self._tail_bufs[0][: self._tail_size]
+            self._raw_dep_var = self._tail_bufs[1][: self._tail_size]
+            self._indep_var_indexes = None
+            self._indep_var = _readonly_view(self._raw_indep_var)
+            self._dep_var = _readonly_view(self._raw_dep_var)
+
     # Managed attributes
+    cache_dir = property(
+        _get_cache_dir, _set_cache_dir, doc="Processed data cache directory"
+    )
+    r"""
+    Get or set the directory where processed data is cached.
+
+    When set, the filtered and processed data is stored in a Numpy (.npy)
+    file in this directory, and sources created later with the same file,
+    column labels, row filter, range bounding, processing function and
+    processing function extra arguments memory-map it instead of reading and
+    processing the file again. An entry is replaced when the file (its size
+    or modification time) or the processing function (its byte code, default
+    arguments or closure values) change. Global variables read and functions
+    called by the processing function are not tracked, so changing them does
+    not replace cached data. Data of processing functions that cannot be
+    identified reliably (see :py:attr:`pplot.CsvSource.memoize`) is not
+    cached. If :code:`None` processed data is not cached to disk
+
+    :type: string or None
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.cache_dir
+
+    :raises: (when assigned) RuntimeError (Argument \`cache_dir\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
+    chunk_size = property(
+        _get_chunk_size, _set_chunk_size, doc="File streaming block size"
+    )
+    r"""
+    Get or set the size (in characters) of the blocks the file is read in.
+
+    Each block is filtered, range-bounded and processed before the next one
+    is read, so memory use is bounded by the block size plus the size of the
+    data that is plotted. If :code:`None` the whole file is read at once.
+    Streaming is only supported by the 'NUMPY' engine, and files are not
+    shared with other sources via the parsed files cache when streamed
+
+    :type: positive integer or None
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.chunk_size
+
+    :raises: (when assigned) RuntimeError (Argument \`chunk_size\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
+    decimate = property(_get_decimate, _set_decimate, doc="Maximum number of points")
+    r"""
+    Get or set the maximum number of points of the data set.
+
+    Data sets with more points are decimated by splitting them into
+    :code:`decimate`/2 buckets of (about) the same number of points and
+    keeping the points with the minimum and maximum dependent variable value
+    of each bucket, which preserves the envelope of the data. If
+    :code:`None` data is not decimated
+
+    :type: integer greater than one, or None
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.decimate
+
+    :raises: (when assigned) RuntimeError (Argument \`decimate\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
     dep_col_label = property(
         _get_dep_col_label,
         _set_dep_col_label,
@@ -746,13 +1996,37 @@ class CsvSource(DataSource):
     """
 
     # dep_var is read only
-    dep_var = property(
-        DataSource._get_dep_var, doc="Dependent variable Numpy vector (read only)"
-    )
+    dep_var = property(_get_dep_var, doc="Dependent variable Numpy vector (read only)")
     """
     Get the dependent variable Numpy vector.
     """
 
+    engine = property(_get_engine, _set_engine, doc="Parsing engine")
+    r"""
+    Get or set the comma-separated values file parsing engine.
+
+    The 'NUMPY' engine tokenizes the file columns directly into Numpy vectors
+    and is much faster than the 'PCSV' engine for large files. The header,
+    data start row, row filter and empty field semantics of both engines are
+    the same. Files with quoted fields or with rows that have a different
+    number of columns are always read with the 'PCSV' engine
+
+    :type: :ref:`CsvEngineOption`
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc(exclude=exclude_list)) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.engine
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`engine\` is not valid)
+
+     * ValueError (Argument \`engine\` is not one of ['NUMPY', 'PCSV']
+       (case insensitive))
+
+    .. [[[end]]]
+    """
+
     fname = property(_get_fname, _set_fname, doc="Comma-separated file name")
     r"""
     Get or set the comma-separated values file from which data is to be extracted.
@@ -783,6 +2057,12 @@ class CsvSource(DataSource):
 
      * RuntimeError (Column headers are not unique in file *[fname]*)
 
+     * RuntimeError (Compressed file *[fname]* has quoted fields or rows
+       with different number of columns)
+
+     * RuntimeError (Compression format of file *[fname]* is not
+       supported)
+
      * RuntimeError (File *[fname]* has no valid data)
 
      * RuntimeError (File *[fname]* is empty)
@@ -1135,20 +2415,54 @@ class CsvSource(DataSource):
 
     # indep_var is read only
     indep_var = property(
-        DataSource._get_indep_var, doc="Independent variable Numpy vector (read only)"
+        _get_indep_var, doc="Independent variable Numpy vector (read only)"
     )
     """
     Get the independent variable Numpy vector.
     """
 
+    memoize = property(
+        _get_memoize, _set_memoize, doc="Processing function results caching flag"
+    )
+    r"""
+    Get or set the processing function results caching flag.
+
+    If True the results of the data processing function are cached, keyed by
+    a digest of the function (module, qualified name, byte code, constants,
+    default arguments and closure values), of its extra arguments and of the
+    content of the data passed to it. Sources that apply the same processing
+    function to the same data share the results, which are computed only
+    once. Results are held in a process-wide, bounded-size, least recently
+    used cache (see :py:func:`pplot.fproc_cache_info` and
+    :py:func:`pplot.set_fproc_cache_size`) and, if :code:`cache_dir` is not
+    None, in that directory. Only deterministic processing functions should
+    be memoized; in particular global variables read by the processing
+    function are not part of the key, so changing them does not invalidate
+    cached results. Results of processing functions that cannot be
+    identified reliably (closure values, default arguments or extra
+    arguments that are callable objects other than functions, whose state is
+    not part of the key, or objects whose representation is the default one,
+    which includes their memory address) are not cached
+
+    :type: boolean
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.memoize
+
+    :raises: (when assigned) RuntimeError (Argument \`memoize\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
     rfilter = property(_get_rfilter, _set_rfilter, doc="Row filter dictionary")
     r"""
     Get or set the row filter.
 
     If :code:`None` no row filtering is performed
 
-    :type: `CsvRowFilter <https://pcsv.readthedocs.io/en/stable/
-           api.html#csvrowfilter>`_ or None
+    :type: :ref:`RowFilter` or None
 
     .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
     .. Auto-generated exceptions documentation for
@@ -1192,3 +2506,60 @@ class CsvSource(DataSource):
 
     .. [[[end]]]
     """
+
+    round_data = property(
+        _get_round_data, _set_round_data, doc="Data mantissa rounding flag"
+    )
+    r"""
+    Get or set the data mantissa rounding flag.
+
+    If True the mantissa of the independent and dependent variables is
+    rounded to 10 digits after the file is read and after the data is
+    processed, otherwise the data is used as is (which is faster for files
+    whose data is already clean). The data is read again from the file when
+    the flag changes
+
+    :type: boolean
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.round_data
+
+    :raises: (when assigned) RuntimeError (Argument \`round_data\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
+    workers = property(
+        _get_workers, _set_workers, doc="Number of file parsing worker processes"
+    )
+    r"""
+    Get or set the number of worker processes that parse the file.
+
+    The file is split into newline-aligned byte ranges that are parsed in
+    parallel, one per worker process, and the column data of the ranges is
+    joined in file order; header checks, row filtering and data processing
+    are then done as usual. Parallel parsing is only done by the 'NUMPY'
+    engine when the whole file is read at once (:code:`chunk_size` is
+    :code:`None` and the file is not tailed), and only for plain files large
+    enough to be split (a few tens of megabytes per worker). If :code:`None`
+    the file is parsed by the calling process
+
+    :type: positive integer or None
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.csv_source.CsvSource.workers
+
+    :raises: (when assigned) RuntimeError (Argument \`workers\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
+    _complete = property(
+        _get_complete,
+        doc="Flag that indicates whether the series "
+        "is plottable (True) or not (False)",
+    )
@@ -0,0 +1,452 @@
+"""
+Define derived source class.
+
+[[[cog
+import os, sys
+if sys.hexversion < 0x03000000:
+    import __builtin__
+else:
+    import builtins as __builtin__
+sys.path.append(os.environ['TRACER_DIR'])
+import trace_ex_plot_derived_source
+exobj_plot = trace_ex_plot_derived_source.trace_module(no_print=True)
+]]]
+[[[end]]]
+"""
+# derived_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,E1101,E1103,R0913,W0105,W0212
+
+# Standard library imports
+import functools
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+
+# Intra-package imports
+from .functions import (
+    _MF,
+    DataSource,
+    _as_float,
+    _check_real_numpy_vector,
+    _exh,
+    _pprint,
+)
+
+
+###
+# Functions
+###
+def _align(indeps, deps, align):
+    """Align dependent variables to a common independent variable."""
+    overlap_ex = _exh().addex(
+        ValueError, "Independent variable ranges of data sources do not overlap"
+    )
+    common_ex = _exh().addex(
+        ValueError, "Data sources do not have independent variable points in common"
+    )
+    if all([np.array_equal(indeps[0], indep_var) for indep_var in indeps[1:]]):
+        # Same independent variable, nothing to align
+        return indeps[0], deps
+    if align == "INTERSECT":
+        indep_var = functools.reduce(
+            lambda x, y: np.intersect1d(x, y, assume_unique=True), indeps
+        )
+        common_ex(not indep_var.size)
+        return (
+            indep_var,
+            [
+                dep_var[np.searchsorted(item, indep_var)]
+                for item, dep_var in zip(indeps, deps)
+            ],
+        )
+    start = max([indep_var[0] for indep_var in indeps])
+    stop = min([indep_var[-1] for indep_var in indeps])
+    overlap_ex(bool(start > stop))
+    # Merge of all the independent variable points in the common range, all
+    # independent variables are sorted so each one is a contiguous slice
+    slices = [
+        slice(np.searchsorted(item, start), np.searchsorted(item, stop, "right"))
+        for item in indeps
+    ]
+    indep_var = np.unique(
+        np.concatenate([item[slc] for item, slc in zip(indeps, slices)])
+    )
+    return (
+        indep_var,
+        [np.interp(indep_var, item, dep_var) for item, dep_var in zip(indeps, deps)],
+    )
+
+
+###
+# Class
+###
+class DerivedSource(DataSource):
+    r"""
+    Hold a data set computed from other data sources intended for plotting.
+
+    The dependent variables of the data sources are aligned to a common
+    independent variable and then combined by a function, for example to
+    obtain the difference or ratio of two curves or a normalized curve. The
+    alignment and the function are evaluated with whole-vector Numpy
+    operations. The result is computed when the independent or dependent
+    variables are needed and cached until the independent or dependent
+    variable of a data source changes (data sources replace their vectors
+    when their data changes, modifying a data source vector in place is not
+    detected), or until an attribute of the derived source is set
+
+    :param sources: Data sources. Each data source has to have an
+                    :code:`indep_var` attribute that contains a Numpy vector
+                    of increasing real numbers and a :code:`dep_var`
+                    attribute that contains a Numpy vector of real numbers,
+                    like the data sources of a series. Derived sources can
+                    be data sources of other derived sources
+    :type  sources: list of data source objects
+
+    :param func: Function that combines the data sources. It is called with
+                 the aligned dependent variables of the data sources (Numpy
+                 vectors, in the same order as the data sources) as
+                 positional arguments, and has to return a Numpy vector of
+                 the same size, for example :code:`lambda x, y: x - y`
+    :type  func: callable
+
+    :param align: Alignment of the independent variables of the data
+                  sources, :code:`'INTERP'` for linear interpolation of all
+                  the data sources on the merged independent variable points
+                  that are within the range common to all data sources, or
+                  :code:`'INTERSECT'` for only the independent variable
+                  points common to all data sources. If all the data sources
+                  have the same independent variable it is used as is
+    :type  align: :ref:`AlignOption`
+
+    :rtype: :py:class:`pplot.DerivedSource`
+
+    .. note:: Like memory-mapped sources, and unlike other data sources,
+              data is not rounded
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.derived_source.DerivedSource.__init__
+
+    :raises:
+     * RuntimeError (Argument \`align\` is not valid)
+
+     * RuntimeError (Argument \`func\` is not valid)
+
+     * RuntimeError (Argument \`sources\` is not valid)
+
+     * ValueError (Argument \`align\` is not one of ['INTERP', 'INTERSECT']
+       (case insensitive))
+
+    .. [[[end]]]
+    """
+
+    # pylint: disable=R0902,R0903
+    def __init__(self, sources, func, align="interp"):  # noqa
+        # Private attributes
+        super(DerivedSource, self).__init__()
+        self._inputs = None
+        # Public attributes
+        self._sources = None
+        self._func = None
+        self._align = None
+        # Assignment of arguments to attributes
+        self._set_sources(sources)
+        self._set_func(func)
+        self._set_align(align)
+
+    def __str__(self):
+        """
+        Print source information.
+
+        For example:
+
+        .. =[=cog
+        .. import pmisc
+        .. pmisc.incfile('plot_example_12.py', cog.out)
+        .. =]=
+        .. code-block:: python
+
+            # plot_example_12.py
+            import numpy as np
+            import pplot
+
+            def diff(minuend, subtrahend):
+                return minuend - subtrahend
+
+            def create_derived_source():
+                minuend = pplot.BasicSource(
+                    indep_var=np.array([1, 2, 3, 4]),
+                    dep_var=np.array([10, 20, 30, 40]),
+                )
+                subtrahend = pplot.BasicSource(
+                    indep_var=np.array([1.5, 2.5, 3.5]),
+                    dep_var=np.array([1, 2, 3]),
+                )
+                return pplot.DerivedSource(
+                    sources=[minuend, subtrahend], func=diff, align="interp"
+                )
+
+        .. =[=end=]=
+
+        .. code-block:: python
+
+            >>> from __future__ import print_function
+            >>> import docs.support.plot_example_12
+            >>> obj = docs.support.plot_example_12.create_derived_source()
+            >>> print(obj)
+            Number of sources: 2
+            Function: diff
+            Alignment: INTERP
+            Independent variable: [ 1.5, 2.0, 2.5, 3.0, 3.5 ]
+            Dependent variable: [ 14.0, 18.5, 23.0, 27.5, 32.0 ]
+        """
+        ret = ""
+        ret += "Number of sources: {0}\n".format(len(self.sources))
+        ret += "Function: {0}\n".format(self._func_name())
+        ret += "Alignment: {0}\n".format(self.align)
+        ret += "Independent variable: {0}\n".format(
+            _pprint(self.indep_var, indent=len("Independent variable: "))
+        )
+        ret += "Dependent variable: {0}".format(
+            _pprint(self.dep_var, indent=len("Dependent variable: "))
+        )
+        return ret
+
+    def _func_name(self):
+        return getattr(self.func, "__name__", str(self.func))
+
+    def _get_align(self):
+        return self._align
+
+    def _get_dep_var(self):
+        self._update()
+        return self._dep_var
+
+    def _get_func(self):
+        return self._func
+
+    def _get_indep_var(self):
+        self._update()
+        return self._indep_var
+
+    def _get_sources(self):
+        return self._sources
+
+    def _reset(self):
+        """Discard cached data, it is computed again when needed."""
+        self._inputs = None
+        self._indep_var, self._dep_var = None, None
+
+    @pexdoc.pcontracts.contract(align="align_option")
+    def _set_align(self, align):
+        self._align = align.strip().upper()
+        self._reset()
+
+    def _set_dep_var(self, dep_var):
+        self._dep_var = _as_float(dep_var)
+
+    def _set_func(self, func):
+        _exh().addai("func", not callable(func))
+        self._func = func
+        self._reset()
+
+    def _set_indep_var(self, indep_var):
+        self._indep_var = _as_float(indep_var)
+
+    def _set_sources(self, sources):
+        _exh().addai(
+            "sources",
+            (not isinstance(sources, list))
+            or (not sources)
+            or any(
+                [
+                    ("indep_var" not in dir(item)) or ("dep_var" not in dir(item))
+                    for item in sources
+                ]
+            ),
+        )
+        self._sources = sources
+        self._reset()
+
+    def _update(self):
+        """Compute derived data if any data source changed."""
+        # pylint: disable=W0703
+        specified_ex = _exh().addex(
+            RuntimeError, "Argument `sources` is not fully specified"
+        )
+        fun_ex = _exh().addex(
+            RuntimeError,
+            "Argument `func` (function *[func_name]*) raised an exception: "
+            "*[exception_error_message]*",
+        )
+        ret_ex = _exh().addex(
+            TypeError,
+            "Argument `func` (function *[func_name]*) return value is not valid",
+        )
+        if (self.sources is None) or (self.func is None) or (self.align is None):
+            return
+        inputs = [(item.indep_var, item.dep_var) for item in self.sources]
+        if (self._inputs is not None) and all(
+            [
+                (indep_var is cindep_var) and (dep_var is cdep_var)
+                for (indep_var, dep_var), (cindep_var, cdep_var) in zip(
+                    inputs, self._inputs
+                )
+            ]
+        ):
+            return
+        specified_ex(
+            any(
+                [
+                    (indep_var is None)
+                    or (dep_var is None)
+                    or (indep_var.size != dep_var.size)
+                    for indep_var, dep_var in inputs
+                ]
+            )
+        )
+        indep_var, deps = _align(
+            [np.asarray(item[0], dtype=float) for item in inputs],
+            [np.asarray(item[1], dtype=float) for item in inputs],
+            self.align,
+        )
+        try:
+            dep_var = self.func(*deps)
+        except Exception as error_msg:
+            fun_ex(
+                True,
+                _MF(
+                    "func_name",
+                    self._func_name(),
+                    "exception_error_message",
+                    str(error_msg),
+                ),
+            )
+        ret_ex(
+            _check_real_numpy_vector(dep_var) or (dep_var.size != indep_var.size),
+            _MF("func_name", self._func_name()),
+        )
+        self._set_indep_var(indep_var)
+        self._set_dep_var(dep_var)
+        self._inputs = inputs
+
+    # Managed attributes
+    align = property(
+        _get_align, _set_align, doc="Alignment of data source independent variables"
+    )
+    r"""
+    Get or set the alignment of the data source independent variables.
+
+    :type: :ref:`AlignOption`
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.derived_source.DerivedSource.align
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`align\` is not valid)
+
+     * ValueError (Argument \`align\` is not one of ['INTERP', 'INTERSECT']
+       (case insensitive))
+
+    .. [[[end]]]
+    """
+
+    dep_var = property(_get_dep_var, doc="Dependent variable Numpy vector (read only)")
+    r"""
+    Get the dependent variable Numpy vector, the function value at the
+    aligned data source points.
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.derived_source.DerivedSource.dep_var
+
+    :raises: (when retrieved)
+
+     * RuntimeError (Argument \`func\` (function *[func_name]*) raised an
+       exception: *[exception_error_message]*)
+
+     * RuntimeError (Argument \`sources\` is not fully specified)
+
+     * TypeError (Argument \`func\` (function *[func_name]*) return value
+       is not valid)
+
+     * ValueError (Data sources do not have independent variable points in
+       common)
+
+     * ValueError (Independent variable ranges of data sources do not
+       overlap)
+
+    .. [[[end]]]
+    """
+
+    func = property(_get_func, _set_func, doc="Function that combines data sources")
+    r"""
+    Get or set the function that combines the data sources.
+
+    :type: callable
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.derived_source.DerivedSource.func
+
+    :raises: (when assigned) RuntimeError (Argument \`func\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
+    indep_var = property(
+        _get_indep_var, doc="Independent variable Numpy vector (read only)"
+    )
+    r"""
+    Get the independent variable Numpy vector, the aligned data source
+    points.
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.derived_source.DerivedSource.indep_var
+
+    :raises: (when retrieved)
+
+     * RuntimeError (Argument \`func\` (function *[func_name]*) raised an
+       exception: *[exception_error_message]*)
+
+     * RuntimeError (Argument \`sources\` is not fully specified)
+
+     * TypeError (Argument \`func\` (function *[func_name]*) return value
+       is not valid)
+
+     * ValueError (Data sources do not have independent variable points in
+       common)
+
+     * ValueError (Independent variable ranges of data sources do not
+       overlap)
+
+    .. [[[end]]]
+    """
+
+    sources = property(_get_sources, _set_sources, doc="Data sources")
+    r"""
+    Get or set the data sources.
+
+    :type: list of data source objects
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.derived_source.DerivedSource.sources
+
+    :raises: (when assigned) RuntimeError (Argument \`sources\` is not
+     valid)
+
+    .. [[[end]]]
+    """
@@ -36,14 +36,12 @@ if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
         from matplotlib.backends.backend_agg import FigureCanvasAgg
         from matplotlib.transforms import Bbox
 import pmisc
-import pexdoc.exh
 import pexdoc.pcontracts
-import peng
 
 # Intra-package imports
 from .constants import TITLE_FONT_SIZE
 from .panel import Panel
-from .functions import _F, _MF, _intelligent_ticks
+from .functions import _F, _MF, _exh, _intelligent_ticks, _round_mantissa
 
 
 ###
@@ -163,7 +161,7 @@ class Figure(object):
         log_indep_axis=False,
         dpi=100.0,
     ):  # noqa
-        pexdoc.exh.addai(
+        _exh().addai(
             "indep_axis_ticks",
             (indep_axis_ticks is not None)
             and (
@@ -171,7 +169,7 @@ class Figure(object):
                 and (not isinstance(indep_axis_ticks, np.ndarray))
             ),
         )
-        pexdoc.exh.addai(
+        _exh().addai(
             "indep_axis_tick_labels",
             (indep_axis_tick_labels is not None)
             and (
@@ -479,7 +477,7 @@ class Figure(object):
 
     def _check_figure_spec(self, fig_width=None, fig_height=None):
         """Validate given figure size against minimum dimension."""
-        small_ex = pexdoc.exh.addex(
+        small_ex = _exh().addex(
             RuntimeError,
             "Figure size is too small: minimum width *[min_width]*, "
             "minimum height *[min_height]*",
@@ -498,7 +496,7 @@ class Figure(object):
     def _create_figure(self, raise_exception=False):
         """Create and resize figure."""
         if raise_exception:
-            specified_ex = pexdoc.exh.addex(
+            specified_ex = _exh().addex(
                 RuntimeError, "Figure object is not fully specified"
             )
             specified_ex(raise_exception and (not self._complete))
@@ -578,6 +576,7 @@ class Figure(object):
                 "indep_axis_unit_scale": indep_axis_ticks.unit_scale,
             }
             self._scaling_done = True
+        self._resample_series()
         # Create required number of panels
         self._draw_panels()
         # Draw figure otherwise some bounding boxes return NaN
@@ -689,13 +688,13 @@ class Figure(object):
         return self._fig_width
 
     def _get_global_xaxis(self):
-        log_ex = pexdoc.exh.addex(
+        log_ex = _exh().addex(
             ValueError,
             "Figure cannot be plotted with a logarithmic "
             "independent axis because panel *[panel_num]*, series "
             "*[series_num]* contains negative independent data points",
         )
-        ticks_num_ex = pexdoc.exh.addex(
+        ticks_num_ex = _exh().addex(
             RuntimeError, "Number of tick locations and number of tick labels mismatch"
         )
         glob_indep_var = []
@@ -708,12 +707,7 @@ class Figure(object):
                 glob_indep_var = np.unique(
                     np.append(
                         glob_indep_var,
-                        np.array(
-                            [
-                                peng.round_mantissa(element, 10)
-                                for element in series_obj.indep_var
-                            ]
-                        ),
+                        _round_mantissa(series_obj.indep_var, 10),
                     )
                 )
         indep_axis_ticks = _intelligent_ticks(
@@ -757,6 +751,25 @@ class Figure(object):
     def _get_title(self):
         return self._title
 
+    def _resample_series(self):
+        """
+        Sample series data sources at the figure display range and resolution.
+
+        Function data sources are sampled over their whole independent
+        variable range when the independent axis is scaled, so it does not
+        change. The dependent axes of the panels with resampled series are
+        scaled again, before the panels are drawn
+        """
+        fig_width, _ = self._fig_dims()
+        if not fig_width:
+            # Figure size not known yet (first minimum size calculation pass)
+            return
+        num_pixels = int(round(fig_width * self.dpi))
+        indep_min = self._indep_axis_dict["indep_var_min"] * self._indep_var_div
+        indep_max = self._indep_axis_dict["indep_var_max"] * self._indep_var_div
+        for panel_obj in self.panels:
+            panel_obj._resample(indep_min, indep_max, num_pixels, self.log_indep_axis)
+
     @pexdoc.pcontracts.contract(dpi="None|positive_real_num")
     def _set_dpi(self, dpi):
         self._dpi = float(dpi)
@@ -821,8 +834,8 @@ class Figure(object):
 
     def _validate_panels(self):
         """Verify elements of panel list are of the right type and fully specified."""
-        invalid_ex = pexdoc.exh.addai("panels")
-        specified_ex = pexdoc.exh.addex(
+        invalid_ex = _exh().addai("panels")
+        specified_ex = _exh().addex(
             TypeError, "Panel *[panel_num]* is not fully specified"
         )
         for num, obj in enumerate(self.panels):
@@ -879,11 +892,11 @@ class Figure(object):
 
         .. [[[end]]]
         """
-        unsupported_ex = pexdoc.exh.addex(
+        unsupported_ex = _exh().addex(
             RuntimeError, "Unsupported file type: *[file_type]*"
         )
-        no_ftype_ex = pexdoc.exh.addex(RuntimeError, "Could not determine file type")
-        incongruent_ftype = pexdoc.exh.addex(
+        no_ftype_ex = _exh().addex(RuntimeError, "Could not determine file type")
+        incongruent_ftype = _exh().addex(
             RuntimeError, "Incongruent file type and file extension"
         )
         sup_ftypes = ["png", "eps", "pdf"]
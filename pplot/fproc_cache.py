@@ -0,0 +1,151 @@
+# fproc_cache.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0413,E1101,W0105,W0212
+
+# Standard library imports
+import collections
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+
+# Intra-package imports
+from .functions import _LruCache, _digest, _save_npy
+
+
+###
+# Global variables
+###
+# Processing function results cache. Results are keyed by a digest of the
+# processing function, its extra arguments and the input data
+_CACHE = _LruCache(2 ** 27, lambda value: sum(item.nbytes for item in value))
+
+FprocCacheInfo = collections.namedtuple(
+    "FprocCacheInfo", ["hits", "misses", "entries", "size", "max_size"]
+)
+
+
+###
+# Functions
+###
+def _disk_name(key, cache_dir):
+    """Return disk cache entry file name of processing function results."""
+    return os.path.join(cache_dir, "fproc_{0}.npy".format(key))
+
+
+def _fproc_key(fproc, fproc_eargs, indep_var, dep_var):
+    """
+    Compute processing function results cache key.
+
+    The function is identified by its module, qualified name, byte code,
+    constants, default arguments and closure values (see
+    :py:func:`pplot.functions._digest`), and the input data by its content.
+    Return None if the function or its extra arguments cannot be identified
+    reliably (for example closure values or extra arguments that are stateful
+    callable objects, or objects identified only by their memory address),
+    their results are not cached
+    """
+    try:
+        return _digest((fproc, fproc_eargs or {}, indep_var, dep_var), strict=True)
+    except TypeError:
+        return None
+
+
+def _memo_get(key, cache_dir=None):
+    """
+    Retrieve processing function results from the cache.
+
+    The in-memory cache is looked up first and then, if cache_dir is not
+    None, the disk cache. Return an (indep_var, dep_var) tuple, or None if
+    the results are not cached
+    """
+    ret = _CACHE.get(key, record=False)
+    if (ret is None) and (cache_dir is not None):
+        # The cache is an optimization, unreadable entries are not an error
+        try:
+            data = np.load(_disk_name(key, cache_dir))
+            if (data.ndim == 2) and (data.shape[0] == 2):
+                ret = _memo_put(key, (data[0], data[1]))
+        except (IOError, OSError, ValueError):
+            pass
+    with _CACHE.lock:
+        if ret is None:
+            _CACHE.misses += 1
+        else:
+            _CACHE.hits += 1
+    return ret
+
+
+def _memo_put(key, ret, cache_dir=None):
+    """
+    Store processing function results in the cache.
+
+    Results are copied and made read-only, as they are shared by all the
+    sources that compute them. If cache_dir is not None the results are also
+    stored in the disk cache. Return the cached results
+    """
+    indep_var, dep_var = [np.array(item) for item in ret]
+    indep_var.flags.writeable = False
+    dep_var.flags.writeable = False
+    _CACHE.put(key, (indep_var, dep_var))
+    if cache_dir is not None:
+        data = np.vstack([indep_var, dep_var]).astype(np.float64)
+        _save_npy(_disk_name(key, cache_dir), data)
+    return indep_var, dep_var
+
+
+def clear_fproc_cache():
+    """
+    Remove all processing function results from the in-memory results cache.
+
+    Sources created with the :code:`memoize` argument set to True (see
+    :py:class:`pplot.CsvSource`) share the results of processing functions
+    called with the same input data and extra arguments. Disk cache entries
+    are not removed
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import pplot
+        >>> pplot.clear_fproc_cache()
+        >>> pplot.fproc_cache_info().entries
+        0
+    """
+    _CACHE.clear()
+
+
+def fproc_cache_info():
+    """
+    Return in-memory processing function results cache statistics.
+
+    :rtype: named tuple with fields :code:`hits` (number of times results
+            were retrieved from the cache, in memory or on disk),
+            :code:`misses` (number of times a processing function had to be
+            called), :code:`entries` (number of results in the in-memory
+            cache), :code:`size` (in-memory cache size in bytes) and
+            :code:`max_size` (maximum in-memory cache size in bytes)
+    """
+    return FprocCacheInfo(*_CACHE.info())
+
+
+@pexdoc.pcontracts.contract(max_size="int,>=0")
+def set_fproc_cache_size(max_size):
+    r"""
+    Set the maximum size of the in-memory processing function results cache.
+
+    Least recently used results are evicted from the cache when the cache size
+    exceeds the maximum. A maximum size of zero disables in-memory caching
+
+    :param max_size: Maximum cache size in bytes
+    :type  max_size: non-negative integer
+
+    :raises: RuntimeError (Argument \`max_size\` is not valid)
+    """
+    _CACHE.set_max_size(max_size)
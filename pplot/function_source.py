@@ -0,0 +1,461 @@
+"""
+Define function source class.
+
+[[[cog
+import os, sys
+if sys.hexversion < 0x03000000:
+    import __builtin__
+else:
+    import builtins as __builtin__
+sys.path.append(os.environ['TRACER_DIR'])
+import trace_ex_plot_function_source
+exobj_plot = trace_ex_plot_function_source.trace_module(no_print=True)
+]]]
+[[[end]]]
+"""
+# function_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,E1101,E1103,R0913,W0105,W0212
+
+# Standard library imports
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+
+# Intra-package imports
+from .functions import (
+    _C,
+    _MF,
+    _SEL,
+    DataSource,
+    _as_float,
+    _check_real_numpy_vector,
+    _exh,
+    _pprint,
+)
+
+
+###
+# Global variables
+###
+# Spacing, in pixels, of the uniform grid adaptive sampling starts from.
+# Intervals are bisected at most until they are one pixel wide, so features
+# narrower than this spacing may be missed
+_COARSE_PIXELS = 8
+
+
+###
+# Class
+###
+class FunctionSource(DataSource):
+    r"""
+    Hold a data set sampled from a function intended for plotting.
+
+    The function is not evaluated until the independent or dependent
+    variables are needed, and then it is sampled on a uniform grid spanning
+    the independent variable range. When a figure is drawn the function is
+    sampled again on the displayed part of the range, at the resolution of
+    the figure: sampling starts from a coarse uniform grid and intervals
+    whose midpoint deviates from a straight line by more than half a pixel
+    are bisected (down to one pixel), so samples are densest where the
+    curvature is highest and the number of function evaluations is at most
+    about the figure width in pixels. All the points of a sampling pass are
+    evaluated with a single function call
+
+    :param func: Function to sample. It is called with a Numpy vector of
+                 independent variable values and has to return a Numpy
+                 vector of the same size with the dependent variable values,
+                 for example a Numpy universal function such as
+                 :code:`numpy.sin`
+    :type  func: callable
+
+    :param indep_min: Minimum independent variable value
+    :type  indep_min: integer or float
+
+    :param indep_max: Maximum independent variable value
+    :type  indep_max: integer or float
+
+    :param num_points: Number of points of the uniform grid the function is
+                       sampled on before a figure is drawn. The dependent
+                       axis range of a panel and the independent axis range
+                       and ticks of a figure are computed from these points
+    :type  num_points: integer
+
+    :rtype: :py:class:`pplot.FunctionSource`
+
+    .. note:: Like memory-mapped sources, and unlike other data sources,
+              data is not rounded
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.__init__
+
+    :raises:
+     * RuntimeError (Argument \`func\` is not valid)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * RuntimeError (Argument \`num_points\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+    .. [[[end]]]
+    """
+
+    # pylint: disable=R0902,R0903
+    def __init__(self, func, indep_min, indep_max, num_points=100):  # noqa
+        # Private attributes
+        super(FunctionSource, self).__init__()
+        self._sample_key = None
+        # Public attributes
+        self._func = None
+        self._indep_min = None
+        self._indep_max = None
+        self._num_points = None
+        # Assignment of arguments to attributes
+        self._set_func(func)
+        self._set_indep_min(indep_min)
+        self._set_indep_max(indep_max)
+        self._set_num_points(num_points)
+
+    def __str__(self):
+        """
+        Print source information.
+
+        For example:
+
+        .. =[=cog
+        .. import pmisc
+        .. pmisc.incfile('plot_example_11.py', cog.out)
+        .. =]=
+        .. code-block:: python
+
+            # plot_example_11.py
+            import pplot
+
+            def square(indep_var):
+                return indep_var ** 2
+
+            def create_function_source():
+                return pplot.FunctionSource(
+                    func=square, indep_min=0, indep_max=10, num_points=11
+                )
+
+        .. =[=end=]=
+
+        .. code-block:: python
+
+            >>> from __future__ import print_function
+            >>> import docs.support.plot_example_11
+            >>> obj = docs.support.plot_example_11.create_function_source()
+            >>> print(obj)
+            Function: square
+            Independent variable minimum: 0
+            Independent variable maximum: 10
+            Number of points: 11
+            Independent variable: [ 0.0, 1.0, 2.0, ..., 8.0, 9.0, 10.0 ]
+            Dependent variable: [ 0.0, 1.0, 4.0, ..., 64.0, 81.0, 100.0 ]
+        """
+        ret = ""
+        ret += "Function: {0}\n".format(self._func_name())
+        ret += "Independent variable minimum: {0}\n".format(self.indep_min)
+        ret += "Independent variable maximum: {0}\n".format(self.indep_max)
+        ret += "Number of points: {0}\n".format(self.num_points)
+        ret += "Independent variable: {0}\n".format(
+            _pprint(self.indep_var, indent=len("Independent variable: "))
+        )
+        ret += "Dependent variable: {0}".format(
+            _pprint(self.dep_var, indent=len("Dependent variable: "))
+        )
+        return ret
+
+    def _adaptive_sample(self, indep_min, indep_max, num_pixels, log_axis):
+        """Sample function on a display range, densest where curvature is highest."""
+        # Sampling is done in display coordinates, the logarithm of the
+        # independent variable if the axis is logarithmic
+        if log_axis:
+            fwd, inv = np.log10, lambda pos: np.power(10.0, pos)
+        else:
+            fwd = inv = lambda pos: pos
+        start, stop = fwd(float(indep_min)), fwd(float(indep_max))
+        num_intervals = max(1, num_pixels // _COARSE_PIXELS)
+        pos = np.linspace(start, stop, num_intervals + 1)
+        dep_var = self._evaluate(inv(pos))
+        pixel = (stop - start) / float(num_pixels)
+        width = (stop - start) / float(num_intervals)
+        refine = np.ones(num_intervals, dtype=bool)
+        # Bisect while the halves are (about) one pixel wide or wider
+        while refine.any() and (width > 1.5 * pixel):
+            mid = 0.5 * (pos[:-1][refine] + pos[1:][refine])
+            dep_mid = self._evaluate(inv(mid))
+            finite = dep_var[np.isfinite(dep_var)]
+            tol = 0.5 * (np.ptp(finite) if finite.size else 0) / num_pixels
+            err = np.abs(dep_mid - 0.5 * (dep_var[:-1][refine] + dep_var[1:][refine]))
+            idx = np.nonzero(refine)[0] + 1
+            pos = np.insert(pos, idx, mid)
+            dep_var = np.insert(dep_var, idx, dep_mid)
+            width = 0.5 * width
+            # Index of the left half of each bisected interval, shifted by the
+            # number of midpoints inserted before it
+            left = (idx - 1 + np.arange(idx.size))[err > tol]
+            refine = np.zeros(pos.size - 1, dtype=bool)
+            refine[left] = True
+            refine[left + 1] = True
+        indep_var = inv(pos)
+        indep_var[0], indep_var[-1] = indep_min, indep_max
+        return indep_var, dep_var
+
+    def _evaluate(self, indep_var):
+        """Evaluate function, validating its return value."""
+        # pylint: disable=W0703
+        fun_ex = _exh().addex(
+            RuntimeError,
+            "Argument `func` (function *[func_name]*) raised an exception: "
+            "*[exception_error_message]*",
+        )
+        ret_ex = _exh().addex(
+            TypeError,
+            "Argument `func` (function *[func_name]*) return value is not valid",
+        )
+        try:
+            ret = self.func(indep_var)
+        except Exception as error_msg:
+            fun_ex(
+                True,
+                _MF(
+                    "func_name",
+                    self._func_name(),
+                    "exception_error_message",
+                    str(error_msg),
+                ),
+            )
+        ret_ex(
+            _check_real_numpy_vector(ret) or (ret.size != indep_var.size),
+            _MF("func_name", self._func_name()),
+        )
+        return _as_float(ret)
+
+    def _func_name(self):
+        return getattr(self.func, "__name__", str(self.func))
+
+    def _get_dep_var(self):
+        self._sample()
+        return self._dep_var
+
+    def _get_func(self):
+        return self._func
+
+    def _get_indep_max(self):
+        return self._indep_max
+
+    def _get_indep_min(self):
+        return self._indep_min
+
+    def _get_indep_var(self):
+        self._sample()
+        return self._indep_var
+
+    def _get_num_points(self):
+        return self._num_points
+
+    def _reset(self):
+        """Discard samples, the function is sampled again when needed."""
+        self._sample_key = None
+        self._indep_var, self._dep_var = None, None
+
+    def _sample(self, indep_min=None, indep_max=None, num_pixels=None, log_axis=False):
+        """
+        Sample function.
+
+        If the number of pixels is None the function is sampled on a uniform
+        grid of num_points points that spans the independent variable range,
+        otherwise it is sampled adaptively on the part of the independent
+        variable range that is displayed. Returns True if the independent and
+        dependent variables changed
+        """
+        if not _C(self.func, self.indep_min, self.indep_max, self.num_points):
+            return False
+        if num_pixels is None:
+            start, stop = self.indep_min, self.indep_max
+        else:
+            start = max(self.indep_min, _SEL(indep_min, self.indep_min))
+            stop = min(self.indep_max, _SEL(indep_max, self.indep_max))
+            if start > stop:
+                start, stop = self.indep_min, self.indep_max
+        key = (start, stop, num_pixels, bool(log_axis and (start > 0)))
+        if (key == self._sample_key) or ((num_pixels is None) and _C(self._sample_key)):
+            return False
+        if start == stop:
+            indep_var = np.array([float(start)])
+            dep_var = self._evaluate(indep_var)
+        elif num_pixels is None:
+            indep_var = np.linspace(start, stop, self.num_points)
+            dep_var = self._evaluate(indep_var)
+        else:
+            indep_var, dep_var = self._adaptive_sample(
+                start, stop, int(num_pixels), key[-1]
+            )
+        self._set_indep_var(indep_var)
+        self._set_dep_var(dep_var)
+        self._sample_key = key
+        return True
+
+    def _set_dep_var(self, dep_var):
+        self._dep_var = _as_float(dep_var)
+
+    def _set_func(self, func):
+        _exh().addai("func", not callable(func))
+        self._func = func
+        self._reset()
+
+    def _set_indep_var(self, indep_var):
+        self._indep_var = _as_float(indep_var)
+
+    @pexdoc.pcontracts.contract(indep_max="int|float")
+    def _set_indep_max(self, indep_max):
+        self._set_indep_range(self.indep_min, indep_max, rounded=False)
+        self._reset()
+
+    @pexdoc.pcontracts.contract(indep_min="int|float")
+    def _set_indep_min(self, indep_min):
+        self._set_indep_range(indep_min, self.indep_max, rounded=False)
+        self._reset()
+
+    @pexdoc.pcontracts.contract(num_points="int,>=2")
+    def _set_num_points(self, num_points):
+        self._num_points = num_points
+        self._reset()
+
+    # Managed attributes
+    dep_var = property(_get_dep_var, doc="Dependent variable Numpy vector (read only)")
+    r"""
+    Get the dependent variable Numpy vector, the function values at the
+    independent variable points.
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.dep_var
+
+    :raises: (when retrieved)
+
+     * RuntimeError (Argument \`func\` (function *[func_name]*) raised an
+       exception: *[exception_error_message]*)
+
+     * TypeError (Argument \`func\` (function *[func_name]*) return value
+       is not valid)
+
+    .. [[[end]]]
+    """
+
+    func = property(_get_func, _set_func, doc="Function to sample")
+    r"""
+    Get or set the function to sample.
+
+    :type: callable
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.func
+
+    :raises: (when assigned) RuntimeError (Argument \`func\` is not
+     valid)
+
+    .. [[[end]]]
+    """
+
+    indep_max = property(
+        _get_indep_max, _set_indep_max, doc="Maximum of independent variable"
+    )
+    r"""
+    Get or set the maximum independent variable value.
+
+    :type: integer or float
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.indep_max
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+    .. [[[end]]]
+    """
+
+    indep_min = property(
+        _get_indep_min, _set_indep_min, doc="Minimum of independent variable"
+    )
+    r"""
+    Get or set the minimum independent variable value.
+
+    :type: integer or float
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.indep_min
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+    .. [[[end]]]
+    """
+
+    indep_var = property(
+        _get_indep_var, doc="Independent variable Numpy vector (read only)"
+    )
+    r"""
+    Get the independent variable Numpy vector, the points the function is
+    sampled at.
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.indep_var
+
+    :raises: (when retrieved)
+
+     * RuntimeError (Argument \`func\` (function *[func_name]*) raised an
+       exception: *[exception_error_message]*)
+
+     * TypeError (Argument \`func\` (function *[func_name]*) return value
+       is not valid)
+
+    .. [[[end]]]
+    """
+
+    num_points = property(
+        _get_num_points,
+        _set_num_points,
+        doc="Number of points of the initial uniform sampling grid",
+    )
+    r"""
+    Get or set the number of points of the uniform grid the function is
+    sampled on before a figure is drawn.
+
+    :type: integer
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.function_source.FunctionSource.num_points
+
+    :raises: (when assigned) RuntimeError (Argument \`num_points\` is not
+     valid)
+
+    .. [[[end]]]
+    """
@@ -21,10 +21,15 @@ exobj_plot = trace_ex_plot_functions.trace_module(no_print=True)
 # Standard library imports
 import abc
 import collections
+import functools
+import hashlib
 import itertools
 import math
 import os
 import sys
+import tempfile
+import threading
+import types
 import warnings
 
 # PyPI imports
@@ -50,6 +55,11 @@ TickProps = collections.namedtuple(
     "TickProps", ["locs", "labels", "min", "max", "div", "unit_scale"]
 )
 
+# Trusted input mode state. The contracts item records whether contracts were
+# disabled when trusted input mode was turned on, so that turning it off does
+# not enable contracts that were disabled by someone else
+_TRUSTED = {"enabled": False, "contracts": False}
+
 
 ###
 # Functions
@@ -72,17 +82,17 @@ def _intelligent_ticks(
     elif len(series) == 1:
         # Handle 1-point series
         series_min = series_max = series[0]
-        tick_spacing = peng.round_mantissa(0.1 * series[0], PRECISION)
+        tick_spacing = _round_mantissa(0.1 * series[0], PRECISION)
         tick_list = np.array(
             [series[0] - tick_spacing, series[0], series[0] + tick_spacing]
         )
-        tick_spacing = peng.round_mantissa(0.1 * series[0], PRECISION)
+        tick_spacing = _round_mantissa(0.1 * series[0], PRECISION)
         tight = tight_left = tight_right = log_axis = False
     else:
         min_series = min(series)
         max_series = max(series)
-        rounded_min_series = peng.round_mantissa(min_series, PRECISION)
-        rounded_max_series = peng.round_mantissa(max_series, PRECISION)
+        rounded_min_series = _round_mantissa(min_series, PRECISION)
+        rounded_max_series = _round_mantissa(max_series, PRECISION)
         if log_axis:
             dec_start = int(math.log10(min_series))
             dec_stop = int(math.ceil(math.log10(max_series)))
@@ -94,7 +104,7 @@ def _intelligent_ticks(
             # Try to find the tick spacing that will have the most number of
             # data points on grid. Otherwise, place max_ticks uniformly
             # distributed across the data rage
-            series_delta = peng.round_mantissa(max_series - min_series, PRECISION)
+            series_delta = _round_mantissa(max_series - min_series, PRECISION)
             working_series = np.array(series[:])
             tick_list = list()
             num_ticks = SUGGESTED_MAX_TICKS
@@ -141,7 +151,7 @@ def _intelligent_ticks(
                 if len(tick_list) > 0
                 else np.linspace(min_series, max_series, SUGGESTED_MAX_TICKS).tolist()
             )
-            tick_spacing = peng.round_mantissa(tick_list[1] - tick_list[0], PRECISION)
+            tick_spacing = _round_mantissa(tick_list[1] - tick_list[0], PRECISION)
             # Account for interpolations, whose curves might have values above
             # or below the data points. Only add an extra tick, otherwise let
             # curve go above/below panel
@@ -178,11 +188,11 @@ def _intelligent_ticks(
     # label marks (aesthetic decision)
     if log_axis and not tight:
         if not tight_left:
-            opt["min"] = peng.round_mantissa(0.9 * opt["loc"][0], PRECISION)
+            opt["min"] = _round_mantissa(0.9 * opt["loc"][0], PRECISION)
             opt["loc"].insert(0, opt["min"])
             opt["labels"].insert(0, "")
         if not tight_right:
-            opt["max"] = peng.round_mantissa(1.1 * opt["loc"][-1], PRECISION)
+            opt["max"] = _round_mantissa(1.1 * opt["loc"][-1], PRECISION)
             opt["loc"].append(opt["max"])
             opt["labels"].append("")
     return TickProps(
@@ -233,11 +243,9 @@ def _scale_ticks(tick_list, mode):
     rollback = (above_1k_sum > below_1k_sum) and last_tick_below_10k
     scale = float(scale) * 1e-3 if rollback else scale
     unit = peng.peng_suffix_math(unit, +1) if rollback else unit
-    tick_list = np.array(
-        [peng.round_mantissa(element / scale, PRECISION) for element in tick_list]
-    )
-    tick_min = peng.round_mantissa(tick_min / scale, PRECISION)
-    tick_max = peng.round_mantissa(tick_max / scale, PRECISION)
+    tick_list = _round_mantissa(np.asarray(tick_list) / scale, PRECISION)
+    tick_min = _round_mantissa(tick_min / scale, PRECISION)
+    tick_max = _round_mantissa(tick_max / scale, PRECISION)
     loc, labels = _uniquify_tick_labels(tick_list, tick_min, tick_max)
     count = len("".join(labels))
     return {
@@ -259,7 +267,7 @@ def _uniquify_tick_labels(tick_list, tmin, tmax):
     while (mant < 11) and (len(set(labels)) != len(labels)):
         mant += 1
         loc, labels = _process_ticks(tick_list, tmin, tmax, mant)
-    return ([peng.round_mantissa(element, PRECISION) for element in loc], labels)
+    return (_round_mantissa(np.array(loc, dtype=float), PRECISION).tolist(), labels)
 
 
 @pexdoc.pcontracts.contract(
@@ -355,38 +363,511 @@ def parameterized_color_space(param_list, offset=0, color_space="binary"):
     ]
 
 
-def _check_real_numpy_vector(obj):
+@pexdoc.pcontracts.contract(flag=bool)
+def set_trusted_mode(flag):
+    r"""
+    Turn trusted input mode on or off.
+
+    In trusted input mode the arguments of the data source, series, panel and
+    figure classes are not checked against their contracts, and exceptions
+    are raised directly instead of being registered in the `Pexdoc
+    <https://pexdoc.readthedocs.io>`_ exception handler first, which makes
+    object creation considerably faster. Contracts are disabled through
+    PyContracts, so the contracts of other packages that use it are disabled
+    as well. Invalid arguments may go undetected or raise less descriptive
+    exceptions, the mode is meant for programs that create many objects from
+    data known to be valid. Trusted input mode is off by default, it is
+    turned on when the package is imported if the :code:`PPLOT_TRUSTED_MODE`
+    environment variable is :code:`1`
+
+    :param flag: Flag that indicates whether trusted input mode is on (True)
+                 or off (False)
+    :type  flag: boolean
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import pplot
+        >>> pplot.set_trusted_mode(True)
+        >>> pplot.trusted_mode()
+        True
+        >>> pplot.set_trusted_mode(False)
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.functions.set_trusted_mode
+
+    :raises: RuntimeError (Argument \`flag\` is not valid)
+
+    .. [[[end]]]
+    """
+    if flag == _TRUSTED["enabled"]:
+        return
+    if flag:
+        _TRUSTED["contracts"] = not pexdoc.pcontracts.all_disabled()
+        if _TRUSTED["contracts"]:
+            pexdoc.pcontracts.disable_all()
+    elif _TRUSTED["contracts"]:
+        pexdoc.pcontracts.enable_all()
+    _TRUSTED["enabled"] = flag
+
+
+def trusted_mode():
+    """
+    Return whether trusted input mode is on (True) or off (False).
+
+    See :py:func:`pplot.set_trusted_mode`
+
+    :rtype: boolean
+    """
+    return _TRUSTED["enabled"]
+
+
+def _exh():
+    """
+    Return exception registration functions.
+
+    These are the :code:`pexdoc.exh` module functions, or in trusted input
+    mode functions with the same interface that raise exceptions without
+    registering them. The functions are called at the point where the
+    exception is defined so that Pexdoc attributes the exception to the
+    right callable
+    """
+    return _TRUSTED_EXH if _TRUSTED["enabled"] else pexdoc.exh
+
+
+def _trusted_addex(extype, exmsg, condition=None, edata=None):
+    """Trusted input mode version of :code:`pexdoc.exh.addex`."""
+
+    def craise(condition, edata=None):
+        if condition:
+            msg = exmsg
+            edata = [] if edata is None else edata
+            for fdict in edata if isinstance(edata, list) else [edata]:
+                msg = msg.replace(
+                    "*[{0}]*".format(fdict["field"]), "{0}".format(fdict["value"])
+                )
+            raise extype(msg)
+
+    if condition is None:
+        return craise
+    return craise(condition, edata)
+
+
+def _trusted_addai(argname, condition=None):
+    """Trusted input mode version of :code:`pexdoc.exh.addai`."""
+    return _trusted_addex(
+        RuntimeError, "Argument `{0}` is not valid".format(argname), condition
+    )
+
+
+_TRUSTED_EXH = collections.namedtuple("TrustedExh", ["addex", "addai"])(
+    _trusted_addex, _trusted_addai
+)
+if os.environ.get("PPLOT_TRUSTED_MODE", "").strip() == "1":  # pragma: no cover
+    set_trusted_mode(True)
+
+
+def _bound_slice(vector, vmin=None, vmax=None):
+    """
+    Return slice of an increasing vector that spans the [vmin, vmax] range.
+
+    The slice limits are found by binary search, so only O(log n) elements of
+    the vector are accessed (which is important for memory-mapped vectors)
+    """
+    start = 0 if vmin is None else int(np.searchsorted(vector, vmin, side="left"))
+    stop = (
+        vector.size
+        if vmax is None
+        else int(np.searchsorted(vector, vmax, side="right"))
+    )
+    return slice(start, max(start, stop))
+
+
+def _increasing(obj):
+    """
+    Return True if the elements of a Numpy vector are strictly increasing.
+
+    Adjacent elements are compared element-wise, without computing the
+    differences (which can overflow for integer vectors) or looping in Python
+    """
+    return bool(np.all(obj[1:] > obj[:-1]))
+
+
+def _minmax_decimate(indep_var, dep_var, npoints):
+    """
+    Decimate a data set to at most npoints points, preserving its envelope.
+
+    The data set is split into npoints/2 buckets of (about) the same number of
+    points, and the points with the minimum and maximum dependent variable
+    value of each bucket are kept (in their original order)
+    """
+    if indep_var.size <= npoints:
+        return indep_var, dep_var
+    nbuckets = npoints // 2
+    edges = np.linspace(0, indep_var.size, nbuckets + 1).astype(int)
+    bucket = np.repeat(np.arange(nbuckets), np.diff(edges))
+    # Sort by bucket and then by value, the first and last element of each
+    # bucket are its minimum and maximum
+    order = np.lexsort((dep_var, bucket))
+    keep = np.unique(np.concatenate([order[edges[:-1]], order[edges[1:] - 1]]))
+    return indep_var[keep], dep_var[keep]
+
+
+def _round_mantissa(arg, decimals=0, out=None):
+    """
+    Round floating point number(s) mantissa to given number of digits.
+
+    Vectorized version of :code:`peng.round_mantissa` with the same results.
+    Each number is split into its decimal exponent and an integer with the
+    digits to keep (numbers whose last kept digit is too close to a tie to be
+    decided from their binary representation are rounded by
+    :code:`peng.round_mantissa`), and the rounded number is the correctly
+    rounded product of that integer and a power of ten. If out is not None
+    the rounded numbers are stored in it (it can be arg itself, for in-place
+    rounding of float vectors) and it is returned
+    """
+    # pylint: disable=R0914
     if (
+        (arg is None)
+        or isinstance(arg, int)
+        or (not isinstance(arg, (float, np.number, np.ndarray)))
+        or (isinstance(arg, np.ndarray) and (arg.dtype.kind not in "iuf"))
+        or (not 0 < decimals < 15)
+    ):
+        ret = peng.round_mantissa(arg, decimals)
+        if out is not None:
+            out[...] = ret
+            return out
+        return ret
+    if not isinstance(arg, np.ndarray):
+        return float(_round_mantissa(np.array([arg]), decimals)[0])
+    if (arg.dtype.kind == "f") and (arg.dtype != np.float64):
+        # Numbers are rounded from their shortest representation in their own
+        # precision, as peng does
+        data = arg.astype(str).astype(np.float64)
+    else:
+        data = np.asarray(arg, dtype=np.float64)
+    with np.errstate(all="ignore"):
+        # peng rounds infinities as if they were +/- 1E+20
+        mag = np.where(np.isinf(data), 1e20, np.abs(data))
+        exp = np.floor(np.log10(mag))
+        exp -= mag < 10.0 ** exp
+        exp += mag >= 10.0 ** (exp + 1)
+        shift = decimals - exp
+        scaled = np.copysign(mag, data) * 10.0 ** shift
+        digits = np.rint(scaled)
+        fallback = (mag > 0) & (
+            (
+                np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+                <= 16 * np.spacing(np.abs(scaled))
+            )
+            | ((np.abs(exp) > 22) & (np.abs(mag * 10.0 ** -exp - 5.5) > 4.5 - 1e-12))
+            | ((arg.dtype.kind in "iu") & (mag >= 2.0 ** 53))
+            | ~np.isfinite(scaled)
+        )
+        exact = np.abs(shift) <= 22
+        ret = np.where(shift >= 0, digits / 10.0 ** shift, digits * 10.0 ** -shift)
+    # Powers of ten are not exact beyond 1E+22, the product is computed from
+    # its decimal representation
+    inexact = (mag > 0) & ~(exact | fallback)
+    if inexact.any():
+        ret[inexact] = np.char.add(
+            np.char.add(digits[inexact].astype(np.int64).astype(str), "e"),
+            (-shift[inexact]).astype(np.int64).astype(str),
+        ).astype(np.float64)
+    # Zeros lose their sign and not-a-number values are kept
+    zeros = ~(mag > 0)
+    ret[zeros] = data[zeros] + 0.0
+    if fallback.any():
+        ret[fallback] = [
+            float(peng.to_scientific_string(item, decimals)) for item in arg[fallback]
+        ]
+    if out is not None:
+        out[...] = ret
+        return out
+    return ret
+
+
+def _round_vector(vector, round_data=True, out=None):
+    """
+    Round the mantissa of a data source vector to PRECISION digits.
+
+    If round_data is False the vector is only converted to floating point
+    (data that is already clean does not need to be rounded)
+    """
+    if round_data:
+        return _round_mantissa(vector, PRECISION, out=out)
+    if out is not None:
+        out[...] = vector
+        return out
+    return np.array(vector, dtype=np.float64)
+
+
+def _as_vector(obj):
+    """
+    Return a Numpy array that references the data of an object.
+
+    Objects that define the Numpy array interface or that expose the buffer
+    protocol are referenced without a copy, other objects are returned as is
+    """
+    if isinstance(obj, np.ndarray):
+        return obj
+    if hasattr(obj, "__array__") or hasattr(obj, "__array_interface__"):
+        return np.asarray(obj)
+    try:
+        return np.asarray(memoryview(obj))
+    except TypeError:
+        return obj
+
+
+def _readonly_view(vector, float_only=True):
+    """
+    Return a read-only view of a Numpy vector.
+
+    If float_only is True None is returned if the vector cannot be referenced
+    as a data source vector, that is, if it is not a C-contiguous vector of
+    64-bit floating point numbers
+    """
+    if float_only and ((vector.dtype != np.float64) or (not vector.flags.c_contiguous)):
+        return None
+    view = vector.view()
+    view.flags.writeable = False
+    return view
+
+
+def _as_float(vector):
+    """
+    Return a Numpy vector as a floating point vector.
+
+    Floating point vectors are not copied, for data sources that do not
+    modify their vectors in place
+    """
+    return vector.astype(float, copy=False)
+
+
+def _pprint(vector, indent):
+    """Pretty-print a vector, showing only its first and last elements if long."""
+    if vector.size <= 6:
+        return peng.pprint_vector(vector, width=50, indent=indent)
+    return "{0}, ..., {1}".format(
+        peng.pprint_vector(vector[:3])[:-2], peng.pprint_vector(vector[-3:])[2:]
+    )
+
+
+def _check_empty_numpy_vector(obj):
+    """Return True if object is a Numpy array with no elements or only None ones."""
+    if (not isinstance(obj, np.ndarray)) or (not obj.ndim):
+        return False
+    if not obj.shape[0]:
+        return True
+    return (
+        (obj.ndim == 1) and (obj.dtype.kind == "O") and bool(np.equal(obj, None).all())
+    )
+
+
+def _check_real_numpy_vector(obj):
+    return not (
         isinstance(obj, np.ndarray)
-        and (len(obj.shape) == 1)
-        and (obj.shape[0] > 0)
+        and (obj.ndim == 1)
+        and (obj.size > 0)
         and (
             (obj.dtype.type == np.array([0]).dtype.type)
             or (obj.dtype.type == np.array([0.0]).dtype.type)
         )
-    ):
-        return False
-    return True
+    )
 
 
 def _check_increasing_real_numpy_vector(obj):
     # pylint: disable=C0103
-    if (not isinstance(obj, np.ndarray)) or (
-        isinstance(obj, np.ndarray)
-        and ((len(obj.shape) > 1) or ((len(obj.shape) == 1) and (obj.shape[0] == 0)))
-    ):
-        return True
-    if (
-        (obj.dtype.type == np.array([0]).dtype.type)
-        or (obj.dtype.type == np.array([0.0]).dtype.type)
-    ) and ((obj.shape[0] == 1) or ((obj.shape[0] > 1) and (min(np.diff(obj)) > 0))):
-        return False
-    return True
+    return _check_real_numpy_vector(obj) or (not _increasing(obj))
+
+
+def _digest(obj, strict=False):
+    """
+    Compute a digest of an object that is stable across interpreter sessions.
+
+    Containers are traversed recursively, Numpy arrays are hashed by content
+    and functions by module, name, byte code, constants, default arguments and
+    closure values. Other objects are hashed by their representation (so
+    objects whose representation includes their memory address never match
+    across sessions). Global variables read by functions are not part of the
+    digest. If strict is True a TypeError exception is raised for objects that
+    cannot be identified reliably: callable objects that are not functions or
+    methods (their state is not part of the digest) and objects with the
+    default representation (their memory address can be reused by another
+    object)
+    """
+    hobj = hashlib.sha1()
+    _update_digest(hobj, obj, strict)
+    return hobj.hexdigest()
+
+
+def _update_digest(hobj, obj, strict=False):
+    """Feed an object to a hash object (see _digest)."""
+    # pylint: disable=R0912
+    upd = lambda x: hobj.update(x.encode("utf-8") if isinstance(x, str) else x)
+    rec = lambda x: _update_digest(hobj, x, strict)
+    upd(type(obj).__name__)
+    if isinstance(obj, np.ndarray):
+        upd(repr((obj.dtype.str, obj.shape)))
+        upd(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            rec(key)
+            rec(obj[key])
+    elif isinstance(obj, (list, tuple)):
+        upd(str(len(obj)))
+        for item in obj:
+            rec(item)
+    elif isinstance(obj, types.FunctionType):
+        upd(repr((obj.__module__, getattr(obj, "__qualname__", obj.__name__))))
+        rec(obj.__code__)
+        rec(obj.__defaults__)
+        for cell in obj.__closure__ or ():
+            try:
+                rec(cell.cell_contents)
+            except ValueError:  # pragma: no cover
+                # Empty cell
+                upd("<empty>")
+    elif isinstance(obj, types.CodeType):
+        upd(obj.co_code)
+        upd(repr(obj.co_names))
+        rec(obj.co_consts)
+    elif isinstance(obj, types.MethodType):
+        rec(obj.__func__)
+        rec(obj.__self__)
+    elif isinstance(obj, functools.partial):
+        rec((obj.func, obj.args, obj.keywords or {}))
+    else:
+        # Classes, built-in functions and Numpy universal functions are
+        # identified reliably by their representation
+        text, stable = repr(obj), (type, types.BuiltinFunctionType, np.ufunc)
+        if strict and (
+            (callable(obj) and not isinstance(obj, stable))
+            or (text == object.__repr__(obj))
+        ):
+            raise TypeError("Object {0} cannot be digested reliably".format(text))
+        upd(text)
+
+
+def _save_npy(fname, data):
+    """
+    Save Numpy array to file, creating its directory if needed.
+
+    The array is written to a temporary file first so that other processes
+    never see a partially written file. Files are caches, so errors are
+    ignored
+    """
+    dname = os.path.dirname(fname)
+    try:
+        if not os.path.isdir(dname):
+            os.makedirs(dname)
+        fdesc, tmp_fname = tempfile.mkstemp(suffix=".tmp", dir=dname)
+        with os.fdopen(fdesc, "wb") as fobj:
+            np.save(fobj, data)
+        try:
+            os.rename(tmp_fname, fname)
+        except OSError:  # pragma: no cover
+            # File written by another process in the meantime (Windows)
+            os.remove(tmp_fname)
+    except (IOError, OSError):  # pragma: no cover
+        pass
 
 
 ###
 # Classes
 ###
+class _LruCache(object):
+    """
+    Thread-safe, bounded-size, least recently used cache.
+
+    The size of each entry is computed by the sizeof function (entries count
+    as one by default). Entries larger than the maximum size are not cached.
+    The lock attribute can be held to make several cache operations atomic
+    """
+
+    def __init__(self, max_size, sizeof=lambda value: 1):  # noqa
+        self._data = collections.OrderedDict()
+        self._sizeof = sizeof
+        self.lock = threading.RLock()
+        self.hits = self.misses = self.size = 0
+        self.max_size = max_size
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self._data
+
+    def __len__(self):
+        with self.lock:
+            return len(self._data)
+
+    def _shrink(self):
+        """Evict least recently used entries until the cache fits its maximum size."""
+        while self._data and (self.size > self.max_size):
+            _, (_, size) = self._data.popitem(last=False)
+            self.size -= size
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+        with self.lock:
+            self._data.clear()
+            self.hits = self.misses = self.size = 0
+
+    def get(self, key, default=None, record=True):
+        """
+        Retrieve entry and mark it as the most recently used one.
+
+        Return default if the key is not in the cache. If record is True the
+        look-up is recorded in the hits and misses statistics
+        """
+        with self.lock:
+            if key not in self._data:
+                self.misses += int(record)
+                return default
+            self.hits += int(record)
+            # Re-insert entry to mark it as the most recently used one
+            self._data[key] = self._data.pop(key)
+            return self._data[key][0]
+
+    def info(self):
+        """Return (hits, misses, entries, size, max_size) tuple."""
+        with self.lock:
+            return (self.hits, self.misses, len(self._data), self.size, self.max_size)
+
+    def put(self, key, value):
+        """Store entry, evicting least recently used entries if needed."""
+        size = self._sizeof(value)
+        with self.lock:
+            if key in self._data:
+                self.size -= self._data.pop(key)[1]
+            if size <= self.max_size:
+                self._data[key] = (value, size)
+                self.size += size
+                self._shrink()
+
+    def resize(self, key):
+        """Update size of an entry whose value changed in place."""
+        with self.lock:
+            if key in self._data:
+                value, size = self._data[key]
+                self._data[key] = (value, self._sizeof(value))
+                self.size += self._data[key][1] - size
+                self._shrink()
+
+    def set_max_size(self, max_size):
+        """Set maximum cache size, evicting least recently used entries."""
+        with self.lock:
+            self.max_size = max_size
+            self._shrink()
+
+    def values(self):
+        """Return list of cached values, least recently used first."""
+        with self.lock:
+            return [value for value, _ in self._data.values()]
+
+
 @six.add_metaclass(abc.ABCMeta)
 class DataSource(object):  # noqa
     """
@@ -488,7 +969,7 @@ class DataSource(object):  # noqa
             >>> repr(obj.dep_var).replace(' ', '')
             'array([-1.,1.,-1.])'
         """
-        self._dep_var = dep_var.astype(float)
+        self._dep_var = _as_float(dep_var)
 
     @abc.abstractmethod
     def _set_indep_var(self, indep_var):
@@ -506,11 +987,11 @@ class DataSource(object):  # noqa
             >>> repr(obj.indep_var).replace(' ', '')
             'array([1.,2.,3.])'
         """
-        self._indep_var = indep_var.astype(float)
+        self._indep_var = _as_float(indep_var)
 
     def _get_complete(self):
         """Return True if object is fully specified, otherwise returns False."""
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "Arguments `indep_var` and `dep_var` must have "
             "the same number of elements",
@@ -520,6 +1001,26 @@ class DataSource(object):  # noqa
         )
         return (self.indep_var is not None) and (self.dep_var is not None)
 
+    def _set_indep_range(self, indep_min, indep_max, rounded=True):
+        """
+        Validate and store the independent variable range limits.
+
+        Limits that are not integers are rounded like the data set vectors
+        (unless rounded is False), so that range bounding compares numbers
+        with the same precision
+        """
+        _exh().addex(
+            ValueError,
+            "Argument `indep_min` is greater than argument `indep_max`",
+            _C(indep_min, indep_max) and (indep_max < indep_min),
+        )
+        limit = lambda x: (
+            _round_mantissa(x, PRECISION)
+            if rounded and _C(x) and (not isinstance(x, int))
+            else x
+        )
+        self._indep_min, self._indep_max = limit(indep_min), limit(indep_max)
+
     indep_var = abc.abstractproperty(
         _get_indep_var, _set_indep_var, doc="Independent variable Numpy vector"
     )
@@ -0,0 +1,144 @@
+"""
+Define concurrent data source loading functions.
+
+[[[cog
+import os, sys
+if sys.hexversion < 0x03000000:
+    import __builtin__
+else:
+    import builtins as __builtin__
+sys.path.append(os.environ['TRACER_DIR'])
+import trace_ex_plot_loader
+exobj_plot = trace_ex_plot_loader.trace_module(no_print=True)
+]]]
+[[[end]]]
+"""
+# loader.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,W0105,W0212
+
+# Standard library imports
+import multiprocessing
+import multiprocessing.pool
+
+# PyPI imports
+import pexdoc.pcontracts
+
+# Intra-package imports
+from .csv_source import CsvSource, _fproc_runner
+
+
+###
+# Functions
+###
+def _load_source(spec):
+    """Create data source in a worker thread."""
+    return CsvSource(**spec)
+
+
+def _run_fproc(fproc, indep_var, dep_var, fproc_eargs):
+    """Call data source processing function in a worker process."""
+    return fproc(indep_var, dep_var, **fproc_eargs)
+
+
+@pexdoc.pcontracts.contract(
+    specs="list(dict)", workers="None|(int,>0)", executor="executor_option"
+)
+def load_sources(specs, workers=None, executor="thread"):
+    r"""
+    Create several comma-separated values file data sources concurrently.
+
+    :param specs: Data sources specification, each list item is a dictionary
+                  with the :py:class:`pplot.CsvSource` class constructor
+                  arguments (by keyword) of a data source
+    :type  specs: list of dictionaries
+
+    :param workers: Number of worker threads or processes. If None the number
+                    of CPUs of the computer is used
+    :type  workers: positive integer or None
+
+    :param executor: Type of workers for the processing functions (case
+                     insensitive), either 'THREAD' (processing functions are
+                     called in the thread that reads and parses the file) or
+                     'PROCESS' (processing functions are called in a process
+                     pool, which suits processing functions that spend most
+                     of their time in Python code). Files are always read and
+                     parsed in a thread pool; in process mode only the
+                     processing function arguments and results are sent
+                     between processes, and the processing functions have to
+                     be picklable (defined at the top level of a module)
+    :type  executor: :ref:`ExecutorOption`
+
+    :rtype: list of :py:class:`pplot.CsvSource` objects, in the same
+            order as the :code:`specs` argument
+
+    .. note:: Exceptions raised when a source is created are re-raised with
+              the same type and message they have when the source is created
+              directly. If several sources cannot be created the exception
+              of the first one (in :code:`specs` order) is raised
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import os, docs.support, pplot
+        >>> fname = os.path.join(
+        ...     os.path.dirname(docs.support.__file__), "data.csv"
+        ... )
+        >>> specs = [
+        ...     dict(
+        ...         fname=fname,
+        ...         indep_col_label="value2",
+        ...         dep_col_label="value3",
+        ...         rfilter={"value1": value},
+        ...     )
+        ...     for value in [0, 1]
+        ... ]
+        >>> obj1, obj2 = pplot.load_sources(specs, workers=2)
+        >>> obj1.dep_var.tolist(), obj2.dep_var.tolist()
+        ([3.0, 3.0], [3.5, 5.75, 10.11, 8.88])
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc()) ]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.loader.load_sources
+
+    :raises:
+     * RuntimeError (Argument \`executor\` is not valid)
+
+     * RuntimeError (Argument \`specs\` is not valid)
+
+     * RuntimeError (Argument \`workers\` is not valid)
+
+     * ValueError (Argument \`executor\` is not one of ['PROCESS',
+       'THREAD'] (case insensitive))
+
+    .. [[[end]]]
+    """
+    if not specs:
+        return []
+    workers = min(workers or multiprocessing.cpu_count(), len(specs))
+    func, pools = _load_source, [multiprocessing.pool.ThreadPool(workers)]
+    if executor.strip().upper() == "PROCESS":
+        proc_pool = multiprocessing.Pool(workers)
+        pools.append(proc_pool)
+
+        def func(spec):  # pylint: disable=E0102
+            with _fproc_runner(lambda *args: proc_pool.apply(_run_fproc, args)):
+                return CsvSource(**spec)
+
+    try:
+        # Results are retrieved in order, the exception of the first failed
+        # source is the one raised
+        ret = list(pools[0].imap(func, specs))
+    except Exception:
+        for pool in pools:
+            pool.terminate()
+        raise
+    else:
+        for pool in pools:
+            pool.close()
+    finally:
+        for pool in pools:
+            pool.join()
+    return ret
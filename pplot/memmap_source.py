@@ -0,0 +1,497 @@
+"""
+Define memory-mapped binary file source class.
+
+[[[cog
+import os, sys
+if sys.hexversion < 0x03000000:
+    import __builtin__
+else:
+    import builtins as __builtin__
+sys.path.append(os.environ['TRACER_DIR'])
+import trace_ex_plot_memmap_source
+exobj_plot = trace_ex_plot_memmap_source.trace_module(no_print=True)
+]]]
+[[[end]]]
+"""
+# memmap_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,E1101,E1103,R0913,W0105,W0212
+
+# Standard library imports
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+
+# Intra-package imports
+from .functions import (
+    _C,
+    _MF,
+    _SEL,
+    DataSource,
+    _as_float,
+    _bound_slice,
+    _exh,
+    _pprint,
+)
+
+
+###
+# Class
+###
+class MemmapSource(DataSource):
+    r"""
+    Hold a data set from a memory-mapped binary file intended for plotting.
+
+    The file is either a Numpy (.npy) file that holds a structured array or a
+    two-dimensional array (one column per variable), or a raw binary file of
+    fixed-size records. The file is memory-mapped, so opening it is
+    independent of its size; independent variable range bounding is done by
+    binary search and the independent and dependent variables are views
+    (slices) of the file data, so only the range-bounded data is read from
+    disk. Fields that are not of float type are converted to float, which
+    copies (only) the range-bounded data
+
+    :param fname: Binary file name
+    :type  fname: `FileNameExists <https://pexdoc.readthedocs.io/en/stable/
+                  ptypes.html#filenameexists>`_
+
+    :param indep_field: Independent variable field name or column number
+                        (zero-based)
+    :type  indep_field: string or integer
+
+    :param dep_field: Dependent variable field name or column number
+                      (zero-based)
+    :type  dep_field: string or integer
+
+    :param dtype: Record data type of raw binary files, either a structured
+                  data type or a scalar data type (in which case the
+                  :code:`fields` argument gives the names of the record
+                  fields). If None the file is a Numpy (.npy) file
+    :type  dtype: `Numpy data type <https://docs.scipy.org/doc/numpy/
+                  reference/arrays.dtypes.html>`_ *or None*
+
+    :param fields: Field names of raw binary files with scalar data type
+                   records, or column names of Numpy files that hold a
+                   two-dimensional array. If None fields are referred to by
+                   their data type names or by column number
+    :type  fields: list of strings or None
+
+    :param offset: Number of bytes at the start of raw binary files that
+                   are not part of the records (file header)
+    :type  offset: non-negative integer
+
+    :param indep_min: Minimum independent variable value. If None no minimum
+                      thresholding is applied to the data
+    :type  indep_min: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                      ptypes.html#realnum>`_ *or None*
+
+    :param indep_max: Maximum independent variable value. If None no maximum
+                      thresholding is applied to the data
+    :type  indep_max: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                      ptypes.html#realnum>`_ *or None*
+
+    :rtype: :py:class:`pplot.MemmapSource`
+
+    .. note:: The independent variable is expected to be strictly
+              increasing, only the range-bounded data is checked. Unlike
+              other data sources data is not rounded
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.memmap_source.MemmapSource.__init__
+
+    :raises:
+     * OSError (File *[fname]* could not be found)
+
+     * RuntimeError (Argument \`dep_field\` is not valid)
+
+     * RuntimeError (Argument \`dtype\` is not valid)
+
+     * RuntimeError (Argument \`fields\` is not valid)
+
+     * RuntimeError (Argument \`fname\` is not valid)
+
+     * RuntimeError (Argument \`indep_field\` is not valid)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * RuntimeError (Argument \`offset\` is not valid)
+
+     * TypeError (Field *[field]* in file *[fname]* is not real-valued)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Field *[field]* not found in file *[fname]*)
+
+     * ValueError (File *[fname]* does not hold a structured or
+       two-dimensional array)
+
+     * ValueError (File *[fname]* is empty)
+
+     * ValueError (File *[fname]* is not a valid Numpy array file)
+
+     * ValueError (File *[fname]* size is not a multiple of the record
+       size)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+    .. [[[end]]]
+    """
+
+    # pylint: disable=R0902,R0903
+    def __init__(
+        self,
+        fname,
+        indep_field,
+        dep_field,
+        dtype=None,
+        fields=None,
+        offset=0,
+        indep_min=None,
+        indep_max=None,
+    ):  # noqa
+        # Private attributes
+        super(MemmapSource, self).__init__()
+        self._data = None
+        self._fields = None
+        self._raw_indep_var = None
+        self._raw_dep_var = None
+        # Public attributes
+        self._fname = None
+        self._indep_field = None
+        self._dep_field = None
+        self._indep_min = None
+        self._indep_max = None
+        # Assignment of arguments to attributes
+        self._set_indep_min(indep_min)
+        self._set_indep_max(indep_max)
+        self._open(fname, indep_field, dep_field, dtype, fields, offset)
+
+    def __str__(self):
+        """
+        Print source information.
+
+        For example:
+
+        .. =[=cog
+        .. import pmisc
+        .. pmisc.incfile('plot_example_8.py', cog.out)
+        .. =]=
+        .. code-block:: python
+
+            # plot_example_8.py
+            import numpy as np
+            import pplot
+
+            def create_memmap_source(fname):
+                # Write 1,000 records with a 64-bit float time stamp and
+                # a 32-bit float voltage sample
+                dtype = [("time", "<f8"), ("volt", "<f4")]
+                data = np.zeros(1000, dtype=dtype)
+                data["time"] = 1e-3 * np.arange(1000)
+                data["volt"] = 0.5 * np.arange(1000)
+                data.tofile(fname)
+                obj = pplot.MemmapSource(
+                    fname=fname,
+                    indep_field="time",
+                    dep_field="volt",
+                    dtype=dtype,
+                    indep_min=0.1,
+                    indep_max=0.2,
+                )
+                return obj
+
+        .. =[=end=]=
+
+        .. code-block:: python
+
+            >>> from __future__ import print_function
+            >>> import pmisc
+            >>> import docs.support.plot_example_8
+            >>> with pmisc.TmpFile() as fname:
+            ...     obj = docs.support.plot_example_8.create_memmap_source(fname)
+            ...     print(obj) # doctest: +ELLIPSIS
+            File name: ...
+            Independent field: time
+            Dependent field: volt
+            Independent variable minimum: 0.1
+            Independent variable maximum: 0.2
+            Independent variable: [ 0.1, 0.101, 0.102, ..., 0.198, 0.199, 0.2 ]
+            Dependent variable: [ 50.0, 50.5, 51.0, ..., 99.0, 99.5, 100.0 ]
+        """
+        ret = ""
+        ret += "File name: {0}\n".format(self.fname)
+        ret += "Independent field: {0}\n".format(self.indep_field)
+        ret += "Dependent field: {0}\n".format(self.dep_field)
+        ret += "Independent variable minimum: {0}\n".format(
+            _SEL(self.indep_min, "-inf")
+        )
+        ret += "Independent variable maximum: {0}\n".format(
+            _SEL(self.indep_max, "+inf")
+        )
+        ret += "Independent variable: {0}\n".format(
+            _pprint(self.indep_var, indent=len("Independent variable: "))
+        )
+        ret += "Dependent variable: {0}".format(
+            _pprint(self.dep_var, indent=len("Dependent variable: "))
+        )
+        return ret
+
+    def _get_column(self, field):
+        """Return view of the file data of a field."""
+        field_ex = _exh().addex(
+            ValueError, "Field *[field]* not found in file *[fname]*"
+        )
+        real_ex = _exh().addex(
+            TypeError, "Field *[field]* in file *[fname]* is not real-valued"
+        )
+        edata = _MF("field", field, "fname", self.fname)
+        names = self._fields or self._data.dtype.names or []
+        if isinstance(field, int):
+            ncols = len(names) if self._data.dtype.names else self._data.shape[1]
+            field_ex((field < 0) or (field >= ncols), edata)
+            num = field
+        else:
+            field_ex(field not in names, edata)
+            num = names.index(field)
+        if self._data.dtype.names:
+            col = self._data[self._data.dtype.names[num]]
+        else:
+            col = self._data[:, num]
+        real_ex(
+            not (
+                np.issubdtype(col.dtype, np.integer)
+                or np.issubdtype(col.dtype, np.floating)
+            ),
+            edata,
+        )
+        return col
+
+    def _get_dep_field(self):
+        return self._dep_field
+
+    def _get_fname(self):
+        return self._fname
+
+    def _get_indep_field(self):
+        return self._indep_field
+
+    def _get_indep_max(self):
+        return self._indep_max
+
+    def _get_indep_min(self):
+        return self._indep_min
+
+    @pexdoc.pcontracts.contract(
+        fname="file_name_exists",
+        indep_field="str|int",
+        dep_field="str|int",
+        fields="None|list(str)",
+        offset="int,>=0",
+    )
+    def _open(self, fname, indep_field, dep_field, dtype, fields, offset):
+        """Memory-map file and retrieve independent and dependent variables."""
+        dtype_ex = _exh().addex(RuntimeError, "Argument `dtype` is not valid")
+        fields_ex = _exh().addex(RuntimeError, "Argument `fields` is not valid")
+        array_ex = _exh().addex(
+            ValueError,
+            "File *[fname]* does not hold a structured or two-dimensional array",
+        )
+        empty_ex = _exh().addex(ValueError, "File *[fname]* is empty")
+        npy_ex = _exh().addex(
+            ValueError, "File *[fname]* is not a valid Numpy array file"
+        )
+        size_ex = _exh().addex(
+            ValueError, "File *[fname]* size is not a multiple of the record size"
+        )
+        edata = _MF("fname", fname)
+        if dtype is None:
+            try:
+                data = np.load(fname, mmap_mode="r")
+            except (EOFError, ValueError):
+                data = None
+            if hasattr(data, "files"):
+                # Numpy .npz archive
+                data.close()
+                data = None
+            npy_ex(data is None, edata)
+            array_ex((data.ndim != 1 or not data.dtype.names) and data.ndim != 2, edata)
+        else:
+            try:
+                dtype = np.dtype(dtype)
+            except TypeError:
+                dtype_ex(True)
+            dtype_ex(dtype.names is None and not fields)
+            if fields:
+                fields_ex(dtype.names is not None)
+                dtype = np.dtype([(name, dtype) for name in fields])
+                fields = None
+            size = os.path.getsize(fname) - offset
+            empty_ex(size <= 0, edata)
+            size_ex(bool(size % dtype.itemsize), edata)
+            data = np.memmap(fname, dtype=dtype, mode="r", offset=offset)
+        fields_ex(
+            _C(fields)
+            and ((data.ndim != 2) or (len(set(fields)) != len(fields)))
+            or (_C(fields) and (len(fields) != data.shape[1]))
+        )
+        empty_ex(not data.shape[0], edata)
+        self._fname = fname
+        self._data = data
+        self._fields = fields
+        self._indep_field = indep_field
+        self._dep_field = dep_field
+        self._raw_indep_var = self._get_column(indep_field)
+        self._raw_dep_var = self._get_column(dep_field)
+        self._update_vars()
+
+    def _set_dep_var(self, dep_var):
+        self._dep_var = _as_float(dep_var)
+
+    def _set_indep_var(self, indep_var):
+        self._indep_var = _as_float(indep_var)
+
+    @pexdoc.pcontracts.contract(indep_max="real_num")
+    def _set_indep_max(self, indep_max):
+        self._set_indep_range(self.indep_min, indep_max)
+        self._update_vars()
+
+    @pexdoc.pcontracts.contract(indep_min="real_num")
+    def _set_indep_min(self, indep_min):
+        self._set_indep_range(indep_min, self.indep_max)
+        self._update_vars()
+
+    def _update_vars(self):
+        """Update variables according to independent variable limits."""
+        empty_ex = _exh().addex(
+            ValueError,
+            "Argument `indep_var` is empty after `indep_min`/`indep_max`"
+            " range bounding",
+        )
+        increasing_ex = _exh().addex(
+            ValueError, "Independent variable is not strictly increasing"
+        )
+        if self._raw_indep_var is not None:
+            slc = _bound_slice(self._raw_indep_var, self.indep_min, self.indep_max)
+            indep_var = self._raw_indep_var[slc]
+            empty_ex(not indep_var.size)
+            increasing_ex(bool((np.diff(indep_var) <= 0).any()))
+            self._set_indep_var(indep_var)
+            self._set_dep_var(self._raw_dep_var[slc])
+
+    # Managed attributes
+    dep_field = property(_get_dep_field, doc="Dependent variable field (read only)")
+    """
+    Get the dependent variable field name or column number.
+
+    :type: string or integer
+    """
+
+    dep_var = property(
+        DataSource._get_dep_var, doc="Dependent variable Numpy vector (read only)"
+    )
+    """
+    Get the dependent variable Numpy vector.
+
+    The vector is a read-only view of the file data if the field is of
+    float type
+    """
+
+    fname = property(_get_fname, doc="Binary file name (read only)")
+    """
+    Get the binary file name.
+
+    :type: string
+    """
+
+    indep_field = property(
+        _get_indep_field, doc="Independent variable field (read only)"
+    )
+    """
+    Get the independent variable field name or column number.
+
+    :type: string or integer
+    """
+
+    indep_max = property(
+        _get_indep_max, _set_indep_max, doc="Maximum of independent variable"
+    )
+    r"""
+    Get or set the maximum independent variable limit.
+
+    If :code:`None` no maximum thresholding is applied to the data
+
+    :type: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+           ptypes.html#realnum>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.memmap_source.MemmapSource.indep_max
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+    .. [[[end]]]
+    """
+
+    indep_min = property(
+        _get_indep_min, _set_indep_min, doc="Minimum of independent variable"
+    )
+    r"""
+    Get or set the minimum independent variable limit.
+
+    If :code:`None` no minimum thresholding is applied to the data
+
+    :type: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+           ptypes.html#realnum>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.memmap_source.MemmapSource.indep_min
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+    .. [[[end]]]
+    """
+
+    indep_var = property(
+        DataSource._get_indep_var, doc="Independent variable Numpy vector (read only)"
+    )
+    """
+    Get the independent variable Numpy vector.
+
+    The vector is a read-only view of the file data if the field is of
+    float type
+    """
@@ -33,12 +33,11 @@ if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
         from matplotlib.text import Text
         from matplotlib.transforms import Bbox
 import pmisc
-import pexdoc.exh
 import pexdoc.pcontracts
 
 # Intra-package imports
 from .series import Series
-from .functions import _F, _intelligent_ticks, _uniquify_tick_labels
+from .functions import _F, _exh, _intelligent_ticks, _uniquify_tick_labels
 from .constants import AXIS_LABEL_FONT_SIZE, AXIS_TICKS_FONT_SIZE, LEGEND_SCALE
 
 
@@ -530,6 +529,7 @@ class Panel(object):
         self._secondary_axis_units = None
         self._primary_axis_ticks = None
         self._secondary_axis_ticks = None
+        self._given_axis_ticks = (None, None)
         self._log_dep_axis = None
         self._recalculate_series = False
         self._legend_props = {"pos": "BEST", "cols": 1}
@@ -593,8 +593,8 @@ class Panel(object):
             "CENTER",
         ]
         # Exceptions definition
-        invalid_prim_ex = pexdoc.exh.addai("primary_axis_ticks")
-        invalid_sec_ex = pexdoc.exh.addai("secondary_axis_ticks")
+        invalid_prim_ex = _exh().addai("primary_axis_ticks")
+        invalid_sec_ex = _exh().addai("secondary_axis_ticks")
         invalid_prim_ex(
             (primary_axis_ticks is not None)
             and (
@@ -617,6 +617,10 @@ class Panel(object):
         self._secondary_axis_ticks = (
             secondary_axis_ticks if not self.log_dep_axis else None
         )
+        self._given_axis_ticks = (
+            self._primary_axis_ticks,
+            self._secondary_axis_ticks,
+        )
         self._set_series(series)
         self._set_primary_axis_label(primary_axis_label)
         self._set_primary_axis_units(primary_axis_units)
@@ -1083,17 +1087,15 @@ class Panel(object):
 
     @pexdoc.pcontracts.contract(legend_props="None|dict")
     def _set_legend_props(self, legend_props):
-        invalid_ex = pexdoc.exh.addex(
-            ValueError, "Illegal legend property `*[prop_name]*`"
-        )
-        illegal_ex = pexdoc.exh.addex(
+        invalid_ex = _exh().addex(ValueError, "Illegal legend property `*[prop_name]*`")
+        illegal_ex = _exh().addex(
             TypeError,
             "Legend property `pos` is not one of ['BEST', 'UPPER RIGHT', "
             "'UPPER LEFT', 'LOWER LEFT', 'LOWER RIGHT', 'RIGHT', "
             "'CENTER LEFT', 'CENTER RIGHT', 'LOWER CENTER', "
             "'UPPER CENTER', 'CENTER'] (case insensitive)",
         )
-        cols_ex = pexdoc.exh.addex(RuntimeError, "Legend property `cols` is not valid")
+        cols_ex = _exh().addex(RuntimeError, "Legend property `cols` is not valid")
         self._legend_props = (
             legend_props if legend_props is not None else {"pos": "BEST", "cols": 1}
         )
@@ -1193,11 +1195,11 @@ class Panel(object):
 
     def _validate_series(self):
         """Verify elements of series list are of the right type and fully specified."""
-        invalid_ex = pexdoc.exh.addai("series")
-        incomplete_ex = pexdoc.exh.addex(
+        invalid_ex = _exh().addai("series")
+        incomplete_ex = _exh().addex(
             RuntimeError, "Series item *[number]* is not fully specified"
         )
-        log_ex = pexdoc.exh.addex(
+        log_ex = _exh().addex(
             ValueError,
             "Series item *[number]* cannot be plotted in a logarithmic "
             "axis because it contains negative data points",
@@ -1213,6 +1215,22 @@ class Panel(object):
         """Return True if panel is fully specified, otherwise returns False."""
         return (self.series is not None) and (len(self.series) > 0)
 
+    def _resample(self, indep_min, indep_max, num_pixels, log_axis):
+        """
+        Sample series data sources at a display range and resolution.
+
+        The dependent axes are scaled again if the data of any series changed
+        (tick locations given when the panel was created are kept)
+        """
+        changed = [
+            series_obj._resample(indep_min, indep_max, num_pixels, log_axis)
+            for series_obj in self.series
+        ]
+        if any(changed):
+            ticks = self._given_axis_ticks
+            self._primary_axis_ticks, self._secondary_axis_ticks = ticks
+            self._set_series(self._series)
+
     def _scale_indep_var(self, scaling_factor):
         """Scale independent variable of panel series."""
         for series_obj in self.series:
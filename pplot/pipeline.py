@@ -0,0 +1,481 @@
+# pipeline.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0413,E1101,R0205,R0903,W0105,W0212
+
+# Standard library imports
+import abc
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+import six
+
+# Intra-package imports
+from .functions import (
+    DataSource,
+    _LruCache,
+    _as_float,
+    _digest,
+    _exh,
+    _minmax_decimate,
+    _pprint,
+)
+
+
+###
+# Classes
+###
+@six.add_metaclass(abc.ABCMeta)
+class Stage(object):
+    """
+    Base class for data processing pipeline stages.
+
+    A stage is a callable that takes the independent and dependent variables
+    and returns the processed (independent, dependent) variables tuple.
+    Stages that can modify their input in place do so when the inplace
+    argument is True; a pipeline only does that with data it created and
+    did not cache. Child classes have to define the :code:`_process` method
+    and pass their parameters (which identify the stage results in the
+    pipeline cache) to the base class constructor
+    """
+
+    def __init__(self, **params):  # noqa
+        self._params = params
+
+    def __call__(self, indep_var, dep_var, inplace=False):
+        return self._process(indep_var, dep_var, inplace)
+
+    def __repr__(self):
+        return "{0}({1})".format(
+            type(self).__name__,
+            ", ".join(
+                "{0}={1!r}".format(key, self._params[key])
+                for key in sorted(self._params)
+            ),
+        )
+
+    def _key(self):
+        """Return digest of the stage type and parameters."""
+        return _digest((type(self).__module__, type(self).__name__, self._params))
+
+    @abc.abstractmethod
+    def _process(self, indep_var, dep_var, inplace):
+        """
+        Process data.
+
+        Return the processed (independent, dependent) variables tuple. The
+        input vectors can be modified in place only if inplace is True
+        """
+
+
+class Decimate(Stage):
+    r"""
+    Decimate data keeping the minimum and maximum of equal-size point buckets.
+
+    See :py:attr:`pplot.CsvSource.decimate`
+
+    :param npoints: Maximum number of points
+    :type  npoints: integer greater than one
+
+    :raises: RuntimeError (Argument \`npoints\` is not valid)
+    """
+
+    @pexdoc.pcontracts.contract(npoints="int,>=2")
+    def __init__(self, npoints):  # noqa
+        super(Decimate, self).__init__(npoints=npoints)
+
+    def _process(self, indep_var, dep_var, inplace):
+        return _minmax_decimate(indep_var, dep_var, self._params["npoints"])
+
+
+class Differentiate(Stage):
+    """
+    Differentiate the dependent variable with respect to the independent one.
+
+    Second-order accurate central differences are used in the interior
+    points and first-order differences at the boundaries (see
+    :code:`numpy.gradient`), so the data set length does not change
+    """
+
+    def __init__(self):  # noqa
+        super(Differentiate, self).__init__()
+
+    def _process(self, indep_var, dep_var, inplace):
+        if indep_var.size < 2:
+            return indep_var, np.zeros(dep_var.size)
+        return indep_var, np.gradient(dep_var.astype(float), indep_var)
+
+
+class Offset(Stage):
+    r"""
+    Add constants to the independent and dependent variables.
+
+    :param dep: Dependent variable offset
+    :type  dep: integer or float
+
+    :param indep: Independent variable offset
+    :type  indep: integer or float
+
+    :raises:
+     * RuntimeError (Argument \`dep\` is not valid)
+
+     * RuntimeError (Argument \`indep\` is not valid)
+    """
+
+    @pexdoc.pcontracts.contract(dep="int|float", indep="int|float")
+    def __init__(self, dep=0, indep=0):  # noqa
+        super(Offset, self).__init__(dep=dep, indep=indep)
+
+    def _process(self, indep_var, dep_var, inplace):
+        return (
+            _apply(np.add, indep_var, self._params["indep"], inplace),
+            _apply(np.add, dep_var, self._params["dep"], inplace),
+        )
+
+
+class Scale(Stage):
+    r"""
+    Multiply the independent and dependent variables by constants.
+
+    :param dep: Dependent variable scale factor
+    :type  dep: integer or float
+
+    :param indep: Independent variable scale factor
+    :type  indep: positive integer or float
+
+    :raises:
+     * RuntimeError (Argument \`dep\` is not valid)
+
+     * RuntimeError (Argument \`indep\` is not valid)
+    """
+
+    @pexdoc.pcontracts.contract(dep="int|float", indep="(int|float),>0")
+    def __init__(self, dep=1, indep=1):  # noqa
+        super(Scale, self).__init__(dep=dep, indep=indep)
+
+    def _process(self, indep_var, dep_var, inplace):
+        return (
+            _apply(np.multiply, indep_var, self._params["indep"], inplace),
+            _apply(np.multiply, dep_var, self._params["dep"], inplace),
+        )
+
+
+class Smooth(Stage):
+    r"""
+    Smooth the dependent variable with a centered moving average.
+
+    Points closer to the data set edges than half the window are averaged
+    over the points of the window that are in the data set
+
+    :param window: Number of points averaged
+    :type  window: positive odd integer
+
+    :raises: RuntimeError (Argument \`window\` is not valid)
+    """
+
+    @pexdoc.pcontracts.contract(window="int,>0")
+    def __init__(self, window):  # noqa
+        _exh().addex(RuntimeError, "Argument `window` is not valid", not window % 2)
+        super(Smooth, self).__init__(window=window)
+
+    def _process(self, indep_var, dep_var, inplace):
+        size = dep_var.size
+        kernel = np.ones(min(self._params["window"], size - 1 + size % 2))
+        total = np.convolve(dep_var.astype(float), kernel, mode="same")
+        count = np.convolve(np.ones(dep_var.size), kernel, mode="same")
+        return indep_var, total / count
+
+
+class Pipeline(object):
+    r"""
+    Chain data processing stages.
+
+    A pipeline is called with the independent and dependent variables and
+    returns the processed (independent, dependent) variables tuple. It can
+    be used as the data processing function of a :py:class:`pplot.CsvSource`
+    object (see :py:attr:`pplot.Pipeline.fproc`) or attached to any data
+    source with the :py:meth:`pplot.Pipeline.apply` method.
+
+    The results of each stage are cached (keyed by a digest of the input
+    data and of the type and parameters of the stage and of the stages before
+    it), so when a stage is changed only that stage and the ones after it
+    are computed again. Cached results are read-only; if caching is disabled
+    stages after the first one process the data in place when they can
+
+    :param stages: Processing stages, applied in list order. Built-in stages
+                   are :py:class:`pplot.pipeline.Decimate`,
+                   :py:class:`pplot.pipeline.Differentiate`,
+                   :py:class:`pplot.pipeline.Offset`,
+                   :py:class:`pplot.pipeline.Scale` and
+                   :py:class:`pplot.pipeline.Smooth`; custom stages are
+                   :py:class:`pplot.pipeline.Stage` sub-classes
+    :type  stages: list of :py:class:`pplot.pipeline.Stage` objects
+
+    :param cache_size: Maximum number of stage results cached. If zero
+                       stage results are not cached
+    :type  cache_size: non-negative integer
+
+    :raises:
+     * RuntimeError (Argument \`cache_size\` is not valid)
+
+     * RuntimeError (Argument \`stages\` is not valid)
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> import pplot
+        >>> from pplot.pipeline import Offset, Scale
+        >>> obj = pplot.Pipeline([Scale(dep=2), Offset(dep=1)])
+        >>> obj(np.array([1.0, 2.0]), np.array([3.0, 4.0]))[1].tolist()
+        [7.0, 9.0]
+        >>> obj.stages[-1] = Offset(dep=-1)
+        >>> obj(np.array([1.0, 2.0]), np.array([3.0, 4.0]))[1].tolist()
+        [5.0, 7.0]
+    """
+
+    @pexdoc.pcontracts.contract(stages=list, cache_size="int,>=0")
+    def __init__(self, stages, cache_size=16):  # noqa
+        self._check_stages(stages)
+        self._cache = _LruCache(cache_size)
+        self.stages = stages
+
+    def __call__(self, indep_var, dep_var):
+        self._check_stages(self.stages)
+        key = _digest((indep_var, dep_var)) if self._cache.max_size else None
+        inputs, owned = (indep_var, dep_var), False
+        for stage in self.stages:
+            if key is not None:
+                key = _digest((key, stage._key()))
+                ret = self._cache.get(key)
+                if ret is not None:
+                    indep_var, dep_var = ret
+                    continue
+            indep_var, dep_var = stage(indep_var, dep_var, inplace=owned)
+            if key is None:
+                # Data can be modified in place from now on if it does not
+                # share memory with the pipeline input
+                owned = not any(
+                    np.shares_memory(item, ref)
+                    for item in (indep_var, dep_var)
+                    for ref in inputs
+                )
+                continue
+            indep_var, dep_var = np.array(indep_var), np.array(dep_var)
+            indep_var.flags.writeable = False
+            dep_var.flags.writeable = False
+            self._cache.put(key, (indep_var, dep_var))
+        return indep_var, dep_var
+
+    def __repr__(self):
+        return "Pipeline({0!r})".format(self.stages)
+
+    def _check_stages(self, stages):
+        _exh().addex(
+            RuntimeError,
+            "Argument `stages` is not valid",
+            any(not isinstance(stage, Stage) for stage in stages),
+        )
+
+    def apply(self, source):
+        r"""
+        Attach the pipeline to a data source.
+
+        :param source: Data source
+        :type  source: :py:class:`pplot.DataSource` object
+
+        :rtype: :py:class:`pplot.pipeline.ProcessedSource` object, which
+                processes the data of the data source again when it changes
+
+        :raises: RuntimeError (Argument \`source\` is not valid)
+        """
+        return ProcessedSource(source, self)
+
+    def _get_fproc(self):
+        def fproc(indep_var, dep_var):
+            return self(indep_var, dep_var)
+
+        return fproc
+
+    fproc = property(_get_fproc, doc="Data processing function")
+    """
+    Get a data processing function that applies the pipeline.
+
+    The function can be used as the :code:`fproc` argument of a
+    :py:class:`pplot.CsvSource` object. It is identified by the pipeline
+    stages (type and parameters), so it can be memoized
+
+    :type: function
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import os, docs.support, pplot
+        >>> from pplot.pipeline import Offset
+        >>> fname = os.path.join(
+        ...     os.path.dirname(docs.support.__file__), "data.csv"
+        ... )
+        >>> obj = pplot.CsvSource(
+        ...     fname,
+        ...     "value2",
+        ...     "value3",
+        ...     rfilter={"value1": 0},
+        ...     fproc=pplot.Pipeline([Offset(dep=-3)]).fproc,
+        ... )
+        >>> obj.dep_var.tolist()
+        [0.0, 0.0]
+    """
+
+
+class ProcessedSource(DataSource):
+    r"""
+    Hold the data of a data source processed by a pipeline.
+
+    The data is processed when the independent or dependent variables are
+    needed, and processed again when the independent or dependent variable
+    of the data source changes (data sources replace their vectors when their
+    data changes, modifying a data source vector in place is not detected) or
+    when a stage of the pipeline changes. Stage results are retrieved from
+    the pipeline cache when possible, see :py:class:`pplot.Pipeline`
+
+    :param source: Data source
+    :type  source: :py:class:`pplot.DataSource` object
+
+    :param pipeline: Pipeline
+    :type  pipeline: :py:class:`pplot.Pipeline` object
+
+    :raises:
+     * RuntimeError (Argument \`pipeline\` is not valid)
+
+     * RuntimeError (Argument \`source\` is not valid)
+
+     * RuntimeError (Argument \`stages\` is not valid)
+
+    For example:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> import pplot
+        >>> from pplot.pipeline import Offset
+        >>> source = pplot.BasicSource(np.array([1, 2]), np.array([3, 4]))
+        >>> obj = pplot.Pipeline([Offset(dep=1)]).apply(source)
+        >>> obj.dep_var.tolist()
+        [4.0, 5.0]
+        >>> source.dep_var = np.array([5, 6])
+        >>> obj.dep_var.tolist()
+        [6.0, 7.0]
+    """
+
+    def __init__(self, source, pipeline):  # noqa
+        super(ProcessedSource, self).__init__()
+        _exh().addai("source", not isinstance(source, DataSource))
+        _exh().addai("pipeline", not isinstance(pipeline, Pipeline))
+        self._inputs = None
+        self._source = source
+        self._pipeline = pipeline
+
+    def __str__(self):
+        ret = ""
+        ret += "Source: {0}\n".format(type(self.source).__name__)
+        ret += "Pipeline: {0!r}\n".format(self.pipeline)
+        ret += "Independent variable: {0}\n".format(
+            _pprint(self.indep_var, indent=len("Independent variable: "))
+        )
+        ret += "Dependent variable: {0}".format(
+            _pprint(self.dep_var, indent=len("Dependent variable: "))
+        )
+        return ret
+
+    def _get_dep_var(self):
+        self._update()
+        return self._dep_var
+
+    def _get_indep_var(self):
+        self._update()
+        return self._indep_var
+
+    def _get_pipeline(self):
+        return self._pipeline
+
+    def _get_source(self):
+        return self._source
+
+    def _set_dep_var(self, dep_var):
+        self._dep_var = _as_float(dep_var)
+
+    def _set_indep_var(self, indep_var):
+        self._indep_var = _as_float(indep_var)
+
+    def _update(self):
+        """Process data if the data source data or the pipeline stages changed."""
+        self.pipeline._check_stages(self.pipeline.stages)
+        inputs = (
+            self.source.indep_var,
+            self.source.dep_var,
+            [stage._key() for stage in self.pipeline.stages],
+        )
+        if (
+            (self._inputs is not None)
+            and (inputs[0] is self._inputs[0])
+            and (inputs[1] is self._inputs[1])
+            and (inputs[2] == self._inputs[2])
+        ):
+            return
+        indep_var, dep_var = self.pipeline(inputs[0], inputs[1])
+        self._set_indep_var(indep_var)
+        self._set_dep_var(dep_var)
+        self._inputs = inputs
+
+    # Managed attributes
+    dep_var = property(_get_dep_var, doc="Dependent variable Numpy vector (read only)")
+    r"""
+    Get the dependent variable Numpy vector, the processed data source
+    dependent variable.
+
+    :raises: (when retrieved) RuntimeError (Argument \`stages\` is not
+     valid)
+    """
+
+    indep_var = property(
+        _get_indep_var, doc="Independent variable Numpy vector (read only)"
+    )
+    r"""
+    Get the independent variable Numpy vector, the processed data source
+    independent variable.
+
+    :raises: (when retrieved) RuntimeError (Argument \`stages\` is not
+     valid)
+    """
+
+    pipeline = property(_get_pipeline, doc="Pipeline (read only)")
+    """
+    Get the pipeline.
+
+    :type: :py:class:`pplot.Pipeline` object
+    """
+
+    source = property(_get_source, doc="Data source (read only)")
+    """
+    Get the data source.
+
+    :type: :py:class:`pplot.DataSource` object
+    """
+
+
+###
+# Functions
+###
+def _apply(func, data, value, inplace):
+    """Apply binary Numpy function to data and a constant, in place if possible."""
+    if inplace and (data.dtype == np.float64) and data.flags.writeable:
+        return func(data, value, out=data)
+    return func(data, value)
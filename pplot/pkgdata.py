@@ -119,12 +119,21 @@ PKG_PIPELINE_ID = 8
 PKG_DOC_SUBMODULES = [
     "basic_source",
     "constants",
+    "csv_engine",
     "csv_source",
+    "derived_source",
     "figure",
+    "fproc_cache",
+    "function_source",
     "functions",
+    "loader",
+    "memmap_source",
     "panel",
+    "pipeline",
     "ptypes",
     "series",
+    "sqlite_source",
+    "table_source",
 ]
 
 
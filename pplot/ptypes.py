@@ -6,10 +6,47 @@
 # PyPI imports
 import pexdoc.pcontracts
 
+# Intra-package imports
+from .functions import _check_increasing_real_numpy_vector, _check_real_numpy_vector
+
 
 ###
 # Functions
 ###
+@pexdoc.pcontracts.new_contract(
+    argument_invalid="Argument `*[argument_name]*` is not valid",
+    argument_bad_choice=(
+        ValueError,
+        "Argument `*[argument_name]*` is not one of ['INTERP', 'INTERSECT'] "
+        "(case insensitive)",
+    ),
+)
+def align_option(obj):
+    r"""
+    Validate if an object is an AlignOption pseudo-type object.
+
+    :param obj: Object
+    :type  obj: any
+
+    :raises:
+     * RuntimeError (Argument \`*[argument_name]*\` is not valid). The token
+       \*[argument_name]\* is replaced by the name of the argument the contract
+       is attached to
+
+     * RuntimeError (Argument \`*[argument_name]*\` is not one of ['INTERP',
+       'INTERSECT'] (case insensitive)). The token \*[argument_name]\* is
+       replaced by the name of the argument the contract is attached to
+
+    :rtype: None
+    """
+    exdesc = pexdoc.pcontracts.get_exdesc()
+    if not isinstance(obj, str):
+        raise ValueError(exdesc["argument_invalid"])
+    if any([item.lower() == obj.strip().lower() for item in ["INTERP", "INTERSECT"]]):
+        return None
+    raise ValueError(exdesc["argument_bad_choice"])
+
+
 @pexdoc.pcontracts.new_contract(
     argument_invalid="Argument `*[argument_name]*` is not valid",
     argument_bad_choice=(
@@ -78,6 +115,92 @@ def color_space_option(obj):
     raise ValueError(exdesc["argument_bad_choice"])
 
 
+@pexdoc.pcontracts.new_contract(
+    argument_invalid="Argument `*[argument_name]*` is not valid",
+    argument_bad_choice=(
+        ValueError,
+        "Argument `*[argument_name]*` is not one of ['NUMPY', 'PCSV'] "
+        "(case insensitive)",
+    ),
+)
+def csv_engine_option(obj):
+    r"""
+    Validate if an object is a CsvEngineOption pseudo-type object.
+
+    :param obj: Object
+    :type  obj: any
+
+    :raises:
+     * RuntimeError (Argument \`*[argument_name]*\` is not valid). The token
+       \*[argument_name]\* is replaced by the name of the argument the contract
+       is attached to
+
+     * RuntimeError (Argument \`*[argument_name]*\` is not one of ['NUMPY',
+       'PCSV'] (case insensitive)). The token \*[argument_name]\* is replaced
+       by the name of the argument the contract is attached to
+
+    :rtype: None
+    """
+    exdesc = pexdoc.pcontracts.get_exdesc()
+    if not isinstance(obj, str):
+        raise ValueError(exdesc["argument_invalid"])
+    if any([item.lower() == obj.strip().lower() for item in ["NUMPY", "PCSV"]]):
+        return None
+    raise ValueError(exdesc["argument_bad_choice"])
+
+
+@pexdoc.pcontracts.new_contract(
+    argument_invalid="Argument `*[argument_name]*` is not valid",
+    argument_bad_choice=(
+        ValueError,
+        "Argument `*[argument_name]*` is not one of ['PROCESS', 'THREAD'] "
+        "(case insensitive)",
+    ),
+)
+def executor_option(obj):
+    r"""
+    Validate if an object is an ExecutorOption pseudo-type object.
+
+    :param obj: Object
+    :type  obj: any
+
+    :raises:
+     * RuntimeError (Argument \`*[argument_name]*\` is not valid). The token
+       \*[argument_name]\* is replaced by the name of the argument the contract
+       is attached to
+
+     * RuntimeError (Argument \`*[argument_name]*\` is not one of ['PROCESS',
+       'THREAD'] (case insensitive)). The token \*[argument_name]\* is
+       replaced by the name of the argument the contract is attached to
+
+    :rtype: None
+    """
+    exdesc = pexdoc.pcontracts.get_exdesc()
+    if not isinstance(obj, str):
+        raise ValueError(exdesc["argument_invalid"])
+    if any([item.lower() == obj.strip().lower() for item in ["PROCESS", "THREAD"]]):
+        return None
+    raise ValueError(exdesc["argument_bad_choice"])
+
+
+@pexdoc.pcontracts.new_contract()
+def increasing_real_vector(obj):
+    r"""
+    Validate if an object is an IncreasingRealVector pseudo-type object.
+
+    :param obj: Object
+    :type  obj: any
+
+    :raises: RuntimeError (Argument \`*[argument_name]*\` is not valid). The
+     token \*[argument_name]\* is replaced by the name of the argument the
+     contract is attached to
+
+    :rtype: None
+    """
+    if _check_increasing_real_numpy_vector(obj):
+        raise ValueError(pexdoc.pcontracts.get_exdesc())
+
+
 @pexdoc.pcontracts.new_contract(
     argument_invalid="Argument `*[argument_name]*` is not valid",
     argument_bad_choice=(
@@ -154,3 +277,73 @@ def line_style_option(obj):
     if obj in [None, "-", "--", "-.", ":"]:
         return None
     raise ValueError(exdesc["argument_bad_choice"])
+
+
+@pexdoc.pcontracts.new_contract()
+def real_vector(obj):
+    r"""
+    Validate if an object is a RealVector pseudo-type object.
+
+    :param obj: Object
+    :type  obj: any
+
+    :raises: RuntimeError (Argument \`*[argument_name]*\` is not valid). The
+     token \*[argument_name]\* is replaced by the name of the argument the
+     contract is attached to
+
+    :rtype: None
+    """
+    if _check_real_numpy_vector(obj):
+        raise ValueError(pexdoc.pcontracts.get_exdesc())
+
+
+@pexdoc.pcontracts.new_contract(
+    argument_invalid="Argument `*[argument_name]*` is not valid",
+    argument_empty=(ValueError, "Argument `*[argument_name]*` is empty"),
+)
+def row_filter(obj):
+    r"""
+    Validate if an object is a RowFilter pseudo-type object.
+
+    :param obj: Object
+    :type  obj: any
+
+    :raises:
+     * RuntimeError (Argument \`*[argument_name]*\` is not valid). The token
+       \*[argument_name]\* is replaced by the name of the argument the contract
+       is attached to
+
+     * ValueError (Argument \`*[argument_name]*\` is empty). The token
+       \*[argument_name]\* is replaced by the name of the argument the contract
+       is attached to
+
+    :rtype: None
+    """
+    exdesc = pexdoc.pcontracts.get_exdesc()
+    if obj is None:
+        return None
+    if not isinstance(obj, dict):
+        raise ValueError(exdesc["argument_invalid"])
+    if not obj:
+        raise ValueError(exdesc["argument_empty"])
+    for key, value in obj.items():
+        if not isinstance(key, (str, int)):
+            raise ValueError(exdesc["argument_invalid"])
+        if isinstance(value, list):
+            values = value
+        elif isinstance(value, dict):
+            if (not value) or any(
+                [item not in ["==", "!=", "<", "<=", ">", ">="] for item in value]
+            ):
+                raise ValueError(exdesc["argument_invalid"])
+            values = list(value.values())
+        else:
+            values = [value]
+        if any(
+            [
+                isinstance(item, bool) or (not isinstance(item, (int, float, str)))
+                for item in values
+            ]
+        ):
+            raise ValueError(exdesc["argument_invalid"])
+    return None
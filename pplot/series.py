@@ -40,7 +40,8 @@ if os.environ.get("READTHEDOCS", "") != "True":
         from scipy.interpolate import InterpolatedUnivariateSpline
 
 # Intra-package imports
-from .functions import _C
+from .function_source import FunctionSource
+from .functions import _C, _exh
 from .constants import LEGEND_SCALE, LINE_WIDTH, MARKER_SIZE
 
 ###
@@ -181,14 +182,14 @@ class Series(object):
 
     def _set_data_source(self, data_source):
         # pylint: disable=W0212
-        indep_ex = pexdoc.exh.addex(
+        indep_ex = _exh().addex(
             RuntimeError,
             "Argument `data_source` does not have an `indep_var` attribute",
         )
-        dep_ex = pexdoc.exh.addex(
+        dep_ex = _exh().addex(
             RuntimeError, "Argument `data_source` does not have an `dep_var` attribute"
         )
-        specified_ex = pexdoc.exh.addex(
+        specified_ex = _exh().addex(
             RuntimeError, "Argument `data_source` is not fully specified"
         )
         if data_source is not None:
@@ -215,7 +216,7 @@ class Series(object):
 
     @pexdoc.pcontracts.contract(color="real_num|str|list|tuple")
     def _set_color(self, color):
-        invalid_ex = pexdoc.exh.addex(TypeError, "Invalid color specification")
+        invalid_ex = _exh().addex(TypeError, "Invalid color specification")
         valid_html_colors = [
             "aliceblue",
             "antiquewhite",
@@ -412,7 +413,7 @@ class Series(object):
         return self._marker
 
     def _set_marker(self, marker):
-        pexdoc.exh.addai("marker", not self._validate_marker(marker))
+        _exh().addai("marker", not self._validate_marker(marker))
         self._marker = marker
         self._marker_spec = (
             self.marker if self.marker not in ["None", None, " ", ""] else ""
@@ -477,7 +478,7 @@ class Series(object):
     def _validate_source_length_cubic_interp(self):
         """Test if data source has minimum length to calculate cubic interpolation."""
         # pylint: disable=C0103
-        pexdoc.exh.addex(
+        _exh().addex(
             ValueError,
             "At least 4 data points are needed for CUBIC interpolation",
             (self.interp == "CUBIC")
@@ -572,6 +573,28 @@ class Series(object):
         self._scale_indep_var(self._scaling_factor_indep_var)
         self._scale_dep_var(self._scaling_factor_dep_var)
 
+    def _resample(self, indep_min, indep_max, num_pixels, log_axis):
+        """
+        Sample data source at a display range and resolution.
+
+        Only function data sources are sampled. The samples are copied to the
+        series and the data source is then reset to its default sampling, as
+        it can be shared by other series or figures. Returns True if the
+        series data changed
+        """
+        source = self.data_source
+        if not (
+            isinstance(source, FunctionSource)
+            and source._sample(indep_min, indep_max, num_pixels, log_axis)
+        ):
+            return False
+        self.indep_var = source.indep_var
+        self.dep_var = source.dep_var
+        source._reset()
+        self._validate_source_length_cubic_interp()
+        self._calculate_curve()
+        return True
+
     def _scale_indep_var(self, scaling_factor):
         """Scale independent variable."""
         self._scaling_factor_indep_var = float(scaling_factor)
@@ -0,0 +1,573 @@
+"""
+Define data source to read a SQLite database table.
+
+[[[cog
+import os, sys
+if sys.hexversion < 0x03000000:
+    import __builtin__
+else:
+    import builtins as __builtin__
+sys.path.append(os.environ['TRACER_DIR'])
+import trace_ex_plot_sqlite_source
+exobj_plot = trace_ex_plot_sqlite_source.trace_module(no_print=True)
+]]]
+[[[end]]]
+"""
+# sqlite_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,E1101,E1103,R0913,W0105,W0212,W0611
+
+# Standard library imports
+import contextlib
+import itertools
+import os
+import sqlite3
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+from pcsv.ptypes import csv_row_filter
+
+# Intra-package imports
+from .constants import PRECISION
+from .functions import _C, _MF, _SEL, DataSource, _bound_slice, _exh, _round_mantissa
+
+
+###
+# Functions
+###
+def _quote(name):
+    """Quote SQL identifier."""
+    return '"{0}"'.format(name.replace('"', '""'))
+
+
+###
+# Class
+###
+class SqliteSource(DataSource):
+    r"""
+    Hold a data set from a SQLite database table intended for plotting.
+
+    Row filtering and independent variable range bounding are done by the
+    database engine: the row filter is mapped to a parameterized
+    :code:`WHERE` clause and the independent variable range to a range
+    condition on the independent column, so only the rows that are plotted
+    are transferred. Queries use an index on the independent column, if
+    there is one. Rows where either the independent or the dependent column
+    is NULL are ignored, and data is sorted by the independent column
+
+    :param fname: SQLite database file name
+    :type  fname: `FileNameExists <https://pexdoc.readthedocs.io/en/stable/
+                  ptypes.html#filenameexists>`_
+
+    :param table: Table (or view) name
+    :type  table: string
+
+    :param indep_col_label: Independent variable column label
+    :type  indep_col_label: string
+
+    :param dep_col_label: Dependent variable column label
+    :type  dep_col_label: string
+
+    :param rfilter: Row filter specification. Keys are column labels and
+                    values are a value or a list of values the column has to
+                    be equal to. If None no row filtering is performed
+    :type  rfilter: `CsvRowFilter <https://pcsv.readthedocs.io/en/stable/
+                    api.html#csvrowfilter>`_ *or None*
+
+    :param indep_min: Minimum independent variable value. If None no minimum
+                      thresholding is applied to the data
+    :type  indep_min: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                      ptypes.html#realnum>`_ *or None*
+
+    :param indep_max: Maximum independent variable value. If None no maximum
+                      thresholding is applied to the data
+    :type  indep_max: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                      ptypes.html#realnum>`_ *or None*
+
+    :rtype: :py:class:`pplot.SqliteSource`
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.sqlite_source.SqliteSource.__init__
+
+    :raises:
+     * OSError (File *[fname]* could not be found)
+
+     * RuntimeError (Argument \`dep_col_label\` is not valid)
+
+     * RuntimeError (Argument \`fname\` is not valid)
+
+     * RuntimeError (Argument \`indep_col_label\` is not valid)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * RuntimeError (Argument \`rfilter\` is not valid)
+
+     * RuntimeError (Argument \`table\` is not valid)
+
+     * RuntimeError (File *[fname]* is not a SQLite database)
+
+     * TypeError (Table *[table]* has non-numeric data in the independent
+       or dependent columns)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Column *[col_name]* (dependent column label) could not
+       be found in table *[table]*)
+
+     * ValueError (Column *[col_name]* (independent column label) could
+       not be found in table *[table]*)
+
+     * ValueError (Column *[col_name]* in row filter not found in table
+       *[table]*)
+
+     * ValueError (Filtered independent variable is empty)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+     * ValueError (Table *[table]* could not be found in SQLite file
+       *[fname]*)
+
+    .. [[[end]]]
+    """
+
+    # pylint: disable=R0902,R0903
+    def __init__(
+        self,
+        fname,
+        table,
+        indep_col_label,
+        dep_col_label,
+        rfilter=None,
+        indep_min=None,
+        indep_max=None,
+    ):  # noqa
+        # Private attributes
+        super(SqliteSource, self).__init__()
+        self._columns = None
+        # Public attributes
+        self._fname = None
+        self._table = None
+        self._indep_col_label = None
+        self._dep_col_label = None
+        self._rfilter = None
+        self._indep_min = None
+        self._indep_max = None
+        # Assignment of arguments to attributes
+        self._set_rfilter(rfilter)
+        self._set_indep_min(indep_min)
+        self._set_indep_max(indep_max)
+        self._open(fname, table, indep_col_label, dep_col_label)
+
+    def __str__(self):
+        """
+        Print source information.
+
+        For example:
+
+        .. =[=cog
+        .. import pmisc
+        .. pmisc.incfile('plot_example_9.py', cog.out)
+        .. =]=
+        .. code-block:: python
+
+            # plot_example_9.py
+            import contextlib, sqlite3
+            import pplot
+
+            def create_sqlite_source(fname):
+                with contextlib.closing(sqlite3.connect(fname)) as conn:
+                    conn.execute(
+                        "CREATE TABLE meas (temp REAL, time REAL, volt REAL)"
+                    )
+                    conn.execute("CREATE INDEX meas_time ON meas (time)")
+                    conn.executemany(
+                        "INSERT INTO meas VALUES (?, ?, ?)",
+                        [
+                            (25, 1, 10.5),
+                            (85, 1, 11.0),
+                            (25, 2, 20.5),
+                            (85, 2, 21.0),
+                            (25, 3, 30.5),
+                            (85, 3, 31.0),
+                        ],
+                    )
+                    conn.commit()
+                obj = pplot.SqliteSource(
+                    fname=fname,
+                    table="meas",
+                    indep_col_label="time",
+                    dep_col_label="volt",
+                    rfilter={"temp": 85},
+                    indep_min=2,
+                )
+                return obj
+
+        .. =[=end=]=
+
+        .. code-block:: python
+
+            >>> from __future__ import print_function
+            >>> import pmisc
+            >>> import docs.support.plot_example_9
+            >>> with pmisc.TmpFile() as fname:
+            ...     obj = docs.support.plot_example_9.create_sqlite_source(fname)
+            ...     print(obj) # doctest: +ELLIPSIS
+            File name: ...
+            Table: meas
+            Row filter:
+               temp: 85
+            Independent column label: time
+            Dependent column label: volt
+            Independent variable minimum: 2
+            Independent variable maximum: +inf
+            Independent variable: [ 2.0, 3.0 ]
+            Dependent variable: [ 21.0, 31.0 ]
+        """
+        ret = ""
+        ret += "File name: {0}\n".format(self.fname)
+        ret += "Table: {0}\n".format(self.table)
+        ret += "Row filter:{0}\n".format(" None" if self.rfilter is None else "")
+        if self.rfilter is not None:
+            for key in sorted(self.rfilter):
+                ret += "   {key}: {value}\n".format(key=key, value=self.rfilter[key])
+        ret += "Independent column label: {0}\n".format(self.indep_col_label)
+        ret += "Dependent column label: {0}\n".format(self.dep_col_label)
+        ret += "Independent variable minimum: {0}\n".format(
+            _SEL(self.indep_min, "-inf")
+        )
+        ret += "Independent variable maximum: {0}\n".format(
+            _SEL(self.indep_max, "+inf")
+        )
+        ret += super(SqliteSource, self).__str__()
+        return ret
+
+    def _check_rfilter(self):
+        """Check that columns in filter specification are in the table."""
+        rfilter_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* in row filter not found in table *[table]*",
+        )
+        if _C(self._columns, self.rfilter):
+            for key in self.rfilter:
+                # Columns are referenced by name, integer keys are not valid
+                rfilter_ex(
+                    (not isinstance(key, str)) or (key.upper() not in self._columns),
+                    _MF("col_name", key, "table", self.table),
+                )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open database connection."""
+        with contextlib.closing(sqlite3.connect(self.fname)) as conn:
+            yield conn
+
+    def _execute(self, query, params=()):
+        """Execute SQL query, return all result rows as a flat list."""
+        with self._connect() as conn:
+            return list(itertools.chain.from_iterable(conn.execute(query, params)))
+
+    def _get_dep_col_label(self):
+        return self._dep_col_label
+
+    def _get_fname(self):
+        return self._fname
+
+    def _get_indep_col_label(self):
+        return self._indep_col_label
+
+    def _get_indep_max(self):
+        return self._indep_max
+
+    def _get_indep_min(self):
+        return self._indep_min
+
+    def _get_rfilter(self):
+        return self._rfilter
+
+    def _get_table(self):
+        return self._table
+
+    def _load(self):
+        """Query independent and dependent variables from the database."""
+        # pylint: disable=R0914
+        data_ex = _exh().addex(
+            TypeError,
+            "Table *[table]* has non-numeric data in the independent "
+            "or dependent columns",
+        )
+        filter_ex = _exh().addex(ValueError, "Filtered independent variable is empty")
+        range_ex = _exh().addex(
+            ValueError,
+            "Argument `indep_var` is empty after "
+            "`indep_min`/`indep_max` range bounding",
+        )
+        increasing_ex = _exh().addex(
+            ValueError, "Independent variable is not strictly increasing"
+        )
+        if self._columns is None:
+            return
+        self._check_rfilter()
+        indep_col = _quote(self.indep_col_label)
+        dep_col = _quote(self.dep_col_label)
+        conds = ["{0} IS NOT NULL".format(indep_col), "{0} IS NOT NULL".format(dep_col)]
+        params = []
+        for key, value in sorted((self.rfilter or {}).items()):
+            values = value if isinstance(value, list) else [value]
+            conds.append(
+                "{0} IN ({1})".format(_quote(key), ", ".join("?" * len(values)))
+            )
+            params.extend(values)
+        # The data is rounded after it is queried, so the query range is
+        # widened to include the values that round to the range limits and
+        # the range is bounded exactly once the data is rounded
+        range_conds = []
+        range_params = []
+        tol = 10.0 ** (1 - PRECISION)
+        for value, oper, sign in [
+            (self.indep_min, ">=", -1),
+            (self.indep_max, "<=", 1),
+        ]:
+            if value is not None:
+                range_conds.append("{0} {1} ?".format(indep_col, oper))
+                range_params.append(value + sign * tol * abs(value))
+        query = "SELECT {0}, {1} FROM {2} WHERE {3} ORDER BY {0}".format(
+            indep_col, dep_col, _quote(self.table), " AND ".join(conds + range_conds)
+        )
+        try:
+            data = np.array(
+                self._execute(query, params + range_params), dtype=float
+            ).reshape(-1, 2)
+        except (TypeError, ValueError):
+            data_ex(True, _MF("table", self.table))
+        if not data.size:
+            # Find out whether the row filter or the range bounding
+            # removed all the data
+            query = "SELECT COUNT(*) FROM {0} WHERE {1}".format(
+                _quote(self.table), " AND ".join(conds)
+            )
+            filter_ex(not self._execute(query, params)[0])
+            range_ex(True)
+        indep_var = _round_mantissa(data[:, 0], PRECISION)
+        increasing_ex(bool((np.diff(indep_var) <= 0).any()))
+        slc = _bound_slice(indep_var, self.indep_min, self.indep_max)
+        range_ex(slc.start == slc.stop)
+        self._set_indep_var(indep_var[slc])
+        self._set_dep_var(_round_mantissa(data[slc, 1], PRECISION))
+
+    @pexdoc.pcontracts.contract(
+        fname="file_name_exists", table=str, indep_col_label=str, dep_col_label=str
+    )
+    def _open(self, fname, table, indep_col_label, dep_col_label):
+        """Check table and columns and query data."""
+        db_ex = _exh().addex(RuntimeError, "File *[fname]* is not a SQLite database")
+        table_ex = _exh().addex(
+            ValueError, "Table *[table]* could not be found in SQLite file *[fname]*"
+        )
+        indep_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* (independent column label) could not be found"
+            " in table *[table]*",
+        )
+        dep_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* (dependent column label) could not be found"
+            " in table *[table]*",
+        )
+        self._fname = fname
+        self._table = table
+        self._indep_col_label = indep_col_label
+        self._dep_col_label = dep_col_label
+        # SQLite table and column names are case insensitive
+        query = (
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"
+            " AND name = ? COLLATE NOCASE"
+        )
+        edata = _MF("table", table, "fname", fname)
+        # Only a file that is not a database is reported as such, other
+        # errors (a locked database for example) are raised as is
+        try:
+            found = self._execute(query, (table,))
+        except sqlite3.OperationalError:
+            raise
+        except sqlite3.DatabaseError:
+            db_ex(True, _MF("fname", fname))
+        table_ex(not found, edata)
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT * FROM {0} LIMIT 0".format(_quote(table)))
+            columns = [item[0].upper() for item in cursor.description]
+        indep_ex(
+            indep_col_label.upper() not in columns,
+            _MF("col_name", indep_col_label, "table", table),
+        )
+        dep_ex(
+            dep_col_label.upper() not in columns,
+            _MF("col_name", dep_col_label, "table", table),
+        )
+        self._columns = columns
+        self._load()
+
+    def _set_dep_var(self, dep_var):
+        self._dep_var = dep_var
+
+    def _set_indep_var(self, indep_var):
+        self._indep_var = indep_var
+
+    @pexdoc.pcontracts.contract(indep_max="real_num")
+    def _set_indep_max(self, indep_max):
+        self._set_indep_range(self.indep_min, indep_max)
+        self._load()
+
+    @pexdoc.pcontracts.contract(indep_min="real_num")
+    def _set_indep_min(self, indep_min):
+        self._set_indep_range(indep_min, self.indep_max)
+        self._load()
+
+    @pexdoc.pcontracts.contract(rfilter="csv_row_filter")
+    def _set_rfilter(self, rfilter):
+        self._rfilter = rfilter
+        self._load()
+
+    # Managed attributes
+    dep_col_label = property(
+        _get_dep_col_label, doc="Dependent variable column label (read only)"
+    )
+    """
+    Get the dependent variable column label.
+
+    :type: string
+    """
+
+    dep_var = property(
+        DataSource._get_dep_var, doc="Dependent variable Numpy vector (read only)"
+    )
+    """
+    Get the dependent variable Numpy vector.
+
+    :type: Numpy vector
+    """
+
+    fname = property(_get_fname, doc="SQLite database file name (read only)")
+    """
+    Get the SQLite database file name.
+
+    :type: string
+    """
+
+    indep_col_label = property(
+        _get_indep_col_label, doc="Independent variable column label (read only)"
+    )
+    """
+    Get the independent variable column label.
+
+    :type: string
+    """
+
+    indep_max = property(
+        _get_indep_max, _set_indep_max, doc="Maximum of independent variable"
+    )
+    r"""
+    Get or set the maximum independent variable limit.
+
+    If :code:`None` no maximum thresholding is applied to the data
+
+    :type: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+           ptypes.html#realnum>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.sqlite_source.SqliteSource.indep_max
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+    .. [[[end]]]
+    """
+
+    indep_min = property(
+        _get_indep_min, _set_indep_min, doc="Minimum of independent variable"
+    )
+    r"""
+    Get or set the minimum independent variable limit.
+
+    If :code:`None` no minimum thresholding is applied to the data
+
+    :type: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+           ptypes.html#realnum>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.sqlite_source.SqliteSource.indep_min
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+    .. [[[end]]]
+    """
+
+    indep_var = property(
+        DataSource._get_indep_var, doc="Independent variable Numpy vector (read only)"
+    )
+    """
+    Get the independent variable Numpy vector.
+
+    :type: Numpy vector
+    """
+
+    rfilter = property(_get_rfilter, _set_rfilter, doc="Row filter dictionary")
+    r"""
+    Get or set the row filter, the data is queried again when assigned.
+
+    If :code:`None` no row filtering is performed
+
+    :type: `CsvRowFilter <https://pcsv.readthedocs.io/en/stable/
+           api.html#csvrowfilter>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.sqlite_source.SqliteSource.rfilter
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`rfilter\` is not valid)
+
+     * ValueError (Column *[col_name]* in row filter not found in table
+       *[table]*)
+
+     * ValueError (Filtered independent variable is empty)
+
+    .. [[[end]]]
+    """
+
+    table = property(_get_table, doc="Table name (read only)")
+    """
+    Get the table (or view) name.
+
+    :type: string
+    """
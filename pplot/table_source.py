@@ -0,0 +1,557 @@
+"""
+Define in-memory table source class.
+
+[[[cog
+import os, sys
+if sys.hexversion < 0x03000000:
+    import __builtin__
+else:
+    import builtins as __builtin__
+sys.path.append(os.environ['TRACER_DIR'])
+import trace_ex_plot_table_source
+exobj_plot = trace_ex_plot_table_source.trace_module(no_print=True)
+]]]
+[[[end]]]
+"""
+# table_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0111,C0302,C0413,E1101,E1103,R0913,W0105,W0212
+
+# Standard library imports
+import os
+import warnings
+
+# PyPI imports
+if os.environ.get("READTHEDOCS", "") != "True":  # pragma: no cover
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        import numpy as np
+import pexdoc.pcontracts
+
+# Intra-package imports
+from .csv_engine import _column_mask
+from .functions import (
+    _MF,
+    _SEL,
+    DataSource,
+    _as_float,
+    _bound_slice,
+    _exh,
+    _increasing,
+    _readonly_view,
+)
+
+
+###
+# Class
+###
+class TableSource(DataSource):
+    r"""
+    Hold a data set from an in-memory table intended for plotting.
+
+    The table is a Numpy structured array or a mapping (typically a
+    dictionary) of column labels to column vectors. Columns are referenced,
+    not copied: when no row filter is given the independent and dependent
+    variables are read-only views of the table columns, range bounding is
+    done by binary search and only the range-bounded data of columns that
+    are not of float type is converted to float. Row filters are evaluated
+    on whole columns and only the filtered independent and dependent
+    variables are copied, so many data sources can be created from a single
+    table cheaply
+
+    :param table: Table
+    :type  table: Numpy structured array or dictionary of Numpy vectors
+                  (or of lists, or of objects that define the Numpy array
+                  interface or expose the buffer protocol), all with the same
+                  number of elements
+
+    :param indep_col_label: Independent variable column label (case
+                            insensitive)
+    :type  indep_col_label: string
+
+    :param dep_col_label: Dependent variable column label (case insensitive)
+    :type  dep_col_label: string
+
+    :param rfilter: Row filter specification. If None no row filtering is
+                    performed
+    :type  rfilter: :ref:`RowFilter` *or None*
+
+    :param indep_min: Minimum independent variable value. If None no minimum
+                      thresholding is applied to the data
+    :type  indep_min: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                      ptypes.html#realnum>`_ *or None*
+
+    :param indep_max: Maximum independent variable value. If None no maximum
+                      thresholding is applied to the data
+    :type  indep_max: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+                      ptypes.html#realnum>`_ *or None*
+
+    :rtype: :py:class:`pplot.TableSource`
+
+    .. note:: Like memory-mapped sources, and unlike other data sources,
+              data is not rounded
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.table_source.TableSource.__init__
+
+    :raises:
+     * RuntimeError (Argument \`dep_col_label\` is not valid)
+
+     * RuntimeError (Argument \`indep_col_label\` is not valid)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * RuntimeError (Argument \`rfilter\` is not valid)
+
+     * RuntimeError (Argument \`table\` is not valid)
+
+     * TypeError (Column *[col_name]* is not real-valued)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Argument \`rfilter\` is empty)
+
+     * ValueError (Column *[col_name]* (dependent column label) could not
+       be found in table)
+
+     * ValueError (Column *[col_name]* (independent column label) could
+       not be found in table)
+
+     * ValueError (Column *[col_name]* in row filter not found in table)
+
+     * ValueError (Filtered independent variable is empty)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+    .. [[[end]]]
+    """
+
+    # pylint: disable=R0902,R0903
+    def __init__(
+        self,
+        table,
+        indep_col_label,
+        dep_col_label,
+        rfilter=None,
+        indep_min=None,
+        indep_max=None,
+    ):  # noqa
+        # Private attributes
+        super(TableSource, self).__init__()
+        self._cols = None
+        self._raw_indep_var = None
+        self._raw_dep_var = None
+        # Public attributes
+        self._table = None
+        self._indep_col_label = None
+        self._dep_col_label = None
+        self._rfilter = None
+        self._indep_min = None
+        self._indep_max = None
+        # Assignment of arguments to attributes. The table is assigned last
+        # so that the data is retrieved only once
+        self._set_indep_col_label(indep_col_label)
+        self._set_dep_col_label(dep_col_label)
+        self._set_rfilter(rfilter)
+        self._set_indep_min(indep_min)
+        self._set_indep_max(indep_max)
+        self._set_table(table)
+
+    def __str__(self):
+        """
+        Print source information.
+
+        For example:
+
+        .. =[=cog
+        .. import pmisc
+        .. pmisc.incfile('plot_example_10.py', cog.out)
+        .. =]=
+        .. code-block:: python
+
+            # plot_example_10.py
+            import numpy as np
+            import pplot
+
+            def create_table_sources():
+                # Sweep of a voltage at three temperatures
+                table = np.zeros(
+                    9, dtype=[("temp", "<i4"), ("time", "<f8"), ("volt", "<f8")]
+                )
+                table["temp"] = [25, 25, 25, 50, 50, 50, 85, 85, 85]
+                table["time"] = [1, 2, 3, 1, 2, 3, 1, 2, 3]
+                table["volt"] = [1.5, 2.5, 3.5, 1.0, 2.0, 3.0, 0.5, 1.5, 2.5]
+                return [
+                    pplot.TableSource(
+                        table,
+                        indep_col_label="time",
+                        dep_col_label="volt",
+                        rfilter={"temp": temp},
+                    )
+                    for temp in [25, 50, 85]
+                ]
+
+        .. =[=end=]=
+
+        .. code-block:: python
+
+            >>> from __future__ import print_function
+            >>> import docs.support.plot_example_10
+            >>> objs = docs.support.plot_example_10.create_table_sources()
+            >>> print(objs[2])
+            Row filter:
+               temp: 85
+            Independent column label: time
+            Dependent column label: volt
+            Independent variable minimum: -inf
+            Independent variable maximum: +inf
+            Independent variable: [ 1.0, 2.0, 3.0 ]
+            Dependent variable: [ 0.5, 1.5, 2.5 ]
+        """
+        ret = ""
+        ret += "Row filter:{0}\n".format(" None" if self.rfilter is None else "")
+        if self.rfilter is not None:
+            for key in sorted(self.rfilter):
+                ret += "   {key}: {value}\n".format(key=key, value=self.rfilter[key])
+        ret += "Independent column label: {0}\n".format(self.indep_col_label)
+        ret += "Dependent column label: {0}\n".format(self.dep_col_label)
+        ret += "Independent variable minimum: {0}\n".format(
+            _SEL(self.indep_min, "-inf")
+        )
+        ret += "Independent variable maximum: {0}\n".format(
+            _SEL(self.indep_max, "+inf")
+        )
+        ret += super(TableSource, self).__str__()
+        return ret
+
+    def _get_column(self, col_label, ex):
+        """Return table column of a label, raising an exception if not found."""
+        ex(col_label.upper() not in self._cols, _MF("col_name", col_label))
+        return self._cols[col_label.upper()]
+
+    def _get_dep_col_label(self):
+        return self._dep_col_label
+
+    def _get_indep_col_label(self):
+        return self._indep_col_label
+
+    def _get_indep_max(self):
+        return self._indep_max
+
+    def _get_indep_min(self):
+        return self._indep_min
+
+    def _get_rfilter(self):
+        return self._rfilter
+
+    def _get_table(self):
+        return self._table
+
+    def _load(self):
+        """Retrieve independent and dependent variables from the table."""
+        indep_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* (independent column label) could not be found"
+            " in table",
+        )
+        dep_ex = _exh().addex(
+            ValueError,
+            "Column *[col_name]* (dependent column label) could not be found"
+            " in table",
+        )
+        rfilter_ex = _exh().addex(
+            ValueError, "Column *[col_name]* in row filter not found in table"
+        )
+        real_ex = _exh().addex(TypeError, "Column *[col_name]* is not real-valued")
+        filter_ex = _exh().addex(ValueError, "Filtered independent variable is empty")
+        increasing_ex = _exh().addex(
+            ValueError, "Independent variable is not strictly increasing"
+        )
+        if self._cols is None:
+            return
+        cols = []
+        for col_label, ex in [
+            (self.indep_col_label, indep_ex),
+            (self.dep_col_label, dep_ex),
+        ]:
+            col = self._get_column(col_label, ex)
+            real_ex(
+                (col.dtype.kind not in "iuf") or (col.ndim != 1),
+                _MF("col_name", col_label),
+            )
+            cols.append(col)
+        indep_var, dep_var = cols
+        if self.rfilter is not None:
+            mask = np.ones(indep_var.size, dtype=bool)
+            for key, value in self.rfilter.items():
+                mask &= _column_mask(self._get_column(str(key), rfilter_ex), value)
+            filter_ex(not mask.any())
+            indep_var, dep_var = indep_var[mask], dep_var[mask]
+        # Range bounding relies on the independent variable being sorted
+        increasing_ex(not _increasing(indep_var))
+        self._raw_indep_var = indep_var
+        self._raw_dep_var = dep_var
+        self._update_vars()
+
+    def _set_dep_var(self, dep_var):
+        self._dep_var = _as_float(dep_var)
+
+    def _set_indep_var(self, indep_var):
+        self._indep_var = _as_float(indep_var)
+
+    @pexdoc.pcontracts.contract(dep_col_label=str)
+    def _set_dep_col_label(self, dep_col_label):
+        self._dep_col_label = dep_col_label
+        self._load()
+
+    @pexdoc.pcontracts.contract(indep_col_label=str)
+    def _set_indep_col_label(self, indep_col_label):
+        self._indep_col_label = indep_col_label
+        self._load()
+
+    @pexdoc.pcontracts.contract(indep_max="real_num")
+    def _set_indep_max(self, indep_max):
+        self._set_indep_range(self.indep_min, indep_max)
+        self._update_vars()
+
+    @pexdoc.pcontracts.contract(indep_min="real_num")
+    def _set_indep_min(self, indep_min):
+        self._set_indep_range(indep_min, self.indep_max)
+        self._update_vars()
+
+    @pexdoc.pcontracts.contract(rfilter="row_filter")
+    def _set_rfilter(self, rfilter):
+        self._rfilter = rfilter
+        self._load()
+
+    def _set_table(self, table):
+        table_ex = _exh().addai("table")
+        if isinstance(table, np.ndarray):
+            table_ex((table.ndim != 1) or (not table.dtype.names) or (not table.size))
+            cols = [(name, table[name]) for name in table.dtype.names]
+        else:
+            table_ex(
+                (not hasattr(table, "items"))
+                or (not table)
+                or any([not isinstance(key, str) for key in table])
+            )
+            try:
+                # Arrays and objects that define the Numpy array interface or
+                # expose the buffer protocol are not copied
+                cols = [(key, np.asarray(value)) for key, value in table.items()]
+            except ValueError:
+                table_ex(True)
+            table_ex(
+                any(
+                    [
+                        (col.ndim != 1) or (col.size != cols[0][1].size)
+                        for _, col in cols
+                    ]
+                )
+                or (not cols[0][1].size)
+            )
+        # Labels are case insensitive, as in comma-separated values files
+        table_ex(len(set([key.upper() for key, _ in cols])) != len(cols))
+        self._table = table
+        self._cols = dict(
+            [(key.upper(), _readonly_view(col, float_only=False)) for key, col in cols]
+        )
+        self._load()
+
+    def _update_vars(self):
+        """Update variables according to independent variable limits."""
+        empty_ex = _exh().addex(
+            ValueError,
+            "Argument `indep_var` is empty after `indep_min`/`indep_max`"
+            " range bounding",
+        )
+        if self._raw_indep_var is not None:
+            slc = _bound_slice(self._raw_indep_var, self.indep_min, self.indep_max)
+            indep_var = self._raw_indep_var[slc]
+            empty_ex(not indep_var.size)
+            self._set_indep_var(indep_var)
+            self._set_dep_var(self._raw_dep_var[slc])
+
+    # Managed attributes
+    dep_col_label = property(
+        _get_dep_col_label,
+        _set_dep_col_label,
+        doc="Dependent variable column label (case insensitive)",
+    )
+    r"""
+    Get or set the dependent variable column label (case insensitive).
+
+    :type: string
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.table_source.TableSource.dep_col_label
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`dep_col_label\` is not valid)
+
+     * TypeError (Column *[col_name]* is not real-valued)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Column *[col_name]* (dependent column label) could not
+       be found in table)
+
+    .. [[[end]]]
+    """
+
+    dep_var = property(
+        DataSource._get_dep_var, doc="Dependent variable Numpy vector (read only)"
+    )
+    """
+    Get the dependent variable Numpy vector.
+
+    The vector is a read-only view of the table column if no row filter is
+    given and the column is of float type
+    """
+
+    indep_col_label = property(
+        _get_indep_col_label,
+        _set_indep_col_label,
+        doc="Independent variable column label (case insensitive)",
+    )
+    r"""
+    Get or set the independent variable column label (case insensitive).
+
+    :type: string
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.table_source.TableSource.indep_col_label
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_col_label\` is not valid)
+
+     * TypeError (Column *[col_name]* is not real-valued)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Column *[col_name]* (independent column label) could
+       not be found in table)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+    .. [[[end]]]
+    """
+
+    indep_max = property(
+        _get_indep_max, _set_indep_max, doc="Maximum of independent variable"
+    )
+    r"""
+    Get or set the maximum independent variable limit.
+
+    If :code:`None` no maximum thresholding is applied to the data
+
+    :type: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+           ptypes.html#realnum>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.table_source.TableSource.indep_max
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_max\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+    .. [[[end]]]
+    """
+
+    indep_min = property(
+        _get_indep_min, _set_indep_min, doc="Minimum of independent variable"
+    )
+    r"""
+    Get or set the minimum independent variable limit.
+
+    If :code:`None` no minimum thresholding is applied to the data
+
+    :type: `RealNum <https://pexdoc.readthedocs.io/en/stable/
+           ptypes.html#realnum>`_ *or None*
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.table_source.TableSource.indep_min
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`indep_min\` is not valid)
+
+     * ValueError (Argument \`indep_min\` is greater than argument
+       \`indep_max\`)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+    .. [[[end]]]
+    """
+
+    indep_var = property(
+        DataSource._get_indep_var, doc="Independent variable Numpy vector (read only)"
+    )
+    """
+    Get the independent variable Numpy vector.
+
+    The vector is a read-only view of the table column if no row filter is
+    given and the column is of float type
+    """
+
+    rfilter = property(_get_rfilter, _set_rfilter, doc="Row filter dictionary")
+    r"""
+    Get or set the row filter.
+
+    If :code:`None` no row filtering is performed. Numbers and strings are
+    never equal, and cannot be compared with the :code:`'<'`, :code:`'<='`,
+    :code:`'>'` and :code:`'>='` operators
+
+    :type: :ref:`RowFilter` or None
+
+    .. [[[cog cog.out(exobj_plot.get_sphinx_autodoc())]]]
+    .. Auto-generated exceptions documentation for
+    .. pplot.table_source.TableSource.rfilter
+
+    :raises: (when assigned)
+
+     * RuntimeError (Argument \`rfilter\` is not valid)
+
+     * ValueError (Argument \`indep_var\` is empty after
+       \`indep_min\`/\`indep_max\` range bounding)
+
+     * ValueError (Argument \`rfilter\` is empty)
+
+     * ValueError (Column *[col_name]* in row filter not found in table)
+
+     * ValueError (Filtered independent variable is empty)
+
+     * ValueError (Independent variable is not strictly increasing)
+
+    .. [[[end]]]
+    """
+
+    table = property(_get_table, doc="Table (read only)")
+    """
+    Get the table.
+
+    :type: Numpy structured array or dictionary of Numpy vectors
+    """
@@ -3,7 +3,11 @@
 # See LICENSE for details
 # pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
 
+# Standard library imports
+import array as pyarray
+
 # PyPI imports
+import numpy as np
 from numpy import array
 from pmisc import AE, AI, APROP, AROPROP
 import pytest
@@ -115,6 +119,26 @@ class TestBasicSource(object):
         #    obj.indep_max = indep_max
         # assert GET_EXMSG(excinfo) == 'Argument `indep_max` is not valid'
 
+    def test_range_bounding(self):
+        """Test that range-bounded data are views of the data set."""
+        obj = FUT(array([1.0, 2.0, 3.0, 4.0, 5.0]), array([10, 20, 30, 40, 50]))
+        obj.indep_min = 1.5
+        obj.indep_max = 4
+        assert obj.indep_var.tolist() == [2.0, 3.0, 4.0]
+        assert obj.dep_var.tolist() == [20.0, 30.0, 40.0]
+        assert obj.indep_var.base is obj._raw_indep_var
+        assert obj.dep_var.base is obj._raw_dep_var
+        # Range-bounded data cannot be used to change the data set
+        for item in [obj.indep_var, obj.dep_var]:
+            with pytest.raises(ValueError):
+                item[0] = 0
+        assert obj._raw_indep_var.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert obj._raw_dep_var.tolist() == [10.0, 20.0, 30.0, 40.0, 50.0]
+        obj.indep_max = None
+        obj.indep_min = 5
+        assert obj.indep_var.tolist() == [5.0]
+        assert obj.dep_var.tolist() == [50.0]
+
     @pytest.mark.basic_source
     def test_indep_min_greater_than_indep_max_exceptions(self):
         """Test behavior when indep_min and indep_max are incongruous."""
@@ -225,8 +249,132 @@ class TestBasicSource(object):
         obj = FUT(RDVAR, array([100, 200, 300]), indep_min=30, indep_max=50)
         APROP(obj, "dep_var", array([10, 20, 30, 40, 50, 60]), ValueError, msg)
 
+    def test_extend(self):
+        """Test append and extend methods behavior."""
+        obj = FUT(RIVAR, RDVAR, indep_min=2, indep_max=5.5)
+        obj.append(4, 40)
+        assert (obj.indep_var == array([2.0, 3.0, 4.0])).all()
+        assert (obj.dep_var == array([20.0, 30.0, 40.0])).all()
+        obj.extend(array([5.0, 6.0, 7.0]), array([50, 60, 70]))
+        assert (obj.indep_var == array([2.0, 3.0, 4.0, 5.0])).all()
+        assert (obj.dep_var == array([20.0, 30.0, 40.0, 50.0])).all()
+        assert obj.indep_var.dtype == float
+        # Range changes apply to the appended points
+        obj.indep_max = None
+        assert (obj.indep_var == array([2.0, 3.0, 4.0, 5.0, 6.0, 7.0])).all()
+        obj.indep_min = None
+        assert (obj.dep_var == array([10, 20, 30, 40, 50, 60, 70])).all()
+        # Many points
+        obj = FUT(array([0]), array([0]))
+        for num in range(1, 1000):
+            obj.append(num, 2 * num)
+        assert (obj.indep_var == array(range(1000))).all()
+        assert (obj.dep_var == 2 * array(range(1000))).all()
+        assert obj._bufs[0].size < 4000
+        # Assignment replaces the data set
+        obj = FUT(RIVAR, RDVAR)
+        obj.append(4, 40)
+        obj.indep_var = array([5, 6, 7, 8])
+        obj.dep_var = array([1, 2, 3, 4])
+        obj.append(8.5, 5)
+        assert (obj.indep_var == array([5.0, 6.0, 7.0, 8.0, 8.5])).all()
+        assert (obj.dep_var == array([1.0, 2.0, 3.0, 4.0, 5.0])).all()
+
+    @pytest.mark.basic_source
+    def test_extend_exceptions(self):
+        """Test append and extend methods exceptions."""
+        obj = FUT(RIVAR, RDVAR)
+        for item in [None, "a", True]:
+            AI(obj.append, "indep_var", item, 1)
+            AI(obj.append, "dep_var", 4, item)
+        AI(obj.append, "indep_var", 3, 1)
+        AI(obj.extend, "indep_var", array([3.0, 4.0]), array([1, 2]))
+        AI(obj.extend, "indep_var", array([5.0, 4.0]), array([1, 2]))
+        AI(obj.extend, "dep_var", array([4.0, 5.0]), [1, 2])
+        msg = (
+            "Arguments `indep_var` and `dep_var` "
+            "must have the same number of elements"
+        )
+        AE(obj.extend, ValueError, msg, array([4.0, 5.0]), array([1]))
+        # Data set is not modified when an exception is raised
+        assert (obj.indep_var == RIVAR).all()
+        assert (obj.dep_var == RDVAR).all()
+
+    def test_round_data(self):
+        """Test round_data property behavior."""
+        dep_var = array([0.12345678901234, 2.5, 3.75])
+        obj = FUT(RIVAR, dep_var)
+        assert obj.round_data
+        assert obj.dep_var.tolist() == [0.12345678901, 2.5, 3.75]
+        obj = FUT(RIVAR, dep_var, round_data=False)
+        assert not obj.round_data
+        assert obj.dep_var.tolist() == [0.12345678901234, 2.5, 3.75]
+        assert obj.indep_var.dtype == float
+        obj.extend(array([4.12345678901234]), array([1]))
+        assert obj.indep_var[-1] == 4.12345678901234
+        # Only data set from now on is affected
+        obj.round_data = True
+        assert obj.dep_var[0] == 0.12345678901234
+        obj.append(5.12345678901234, 1)
+        assert obj.indep_var[-1] == 5.1234567890
+        obj.dep_var = array([0.12345678901234, 2.5, 3.75, 1, 1])
+        assert obj.dep_var[0] == 0.12345678901
+
+    @pytest.mark.basic_source
+    def test_round_data_exceptions(self):
+        """Test round_data property exceptions."""
+        AI(FUT, "round_data", RIVAR, RDVAR, round_data=1)
+        msg = "Argument `round_data` is not valid"
+        APROP(FUT(RIVAR, RDVAR), "round_data", "a", RuntimeError, msg)
+
+    def test_copy(self):
+        """Test copy property behavior."""
+        indep_var = array([1.0, 2.0, 3.0, 4.0])
+        dep_var = array([0.12345678901234, 2.5, 3.75, 5.0])
+        obj = FUT(indep_var, dep_var)
+        assert obj.copy
+        assert not np.shares_memory(obj.dep_var, dep_var)
+        obj = FUT(indep_var, dep_var, indep_min=2, copy=False)
+        assert not obj.copy
+        assert np.shares_memory(obj.indep_var, indep_var)
+        assert np.shares_memory(obj.dep_var, dep_var)
+        assert not obj.dep_var.flags.writeable
+        assert dep_var.flags.writeable
+        assert obj.dep_var.tolist() == [2.5, 3.75, 5.0]
+        # Objects that expose the buffer protocol are referenced
+        data = pyarray.array("d", [1.0, 2.0, 3.0, 4.0])
+        obj = FUT(data, dep_var, copy=False)
+        data[0] = 0.5
+        assert obj.indep_var.tolist() == [0.5, 2.0, 3.0, 4.0]
+        assert obj.dep_var[0] == 0.12345678901234
+        # Appended points are copied
+        obj.append(5.12345678901234, 6)
+        assert obj.indep_var.tolist() == [0.5, 2.0, 3.0, 4.0, 5.12345678901234]
+        assert obj.indep_var.flags.writeable
+        obj = FUT(indep_var, dep_var, copy=False)
+        obj.copy = True
+        obj.dep_var = dep_var
+        assert np.shares_memory(obj.indep_var, indep_var)
+        assert not np.shares_memory(obj.dep_var, dep_var)
+
+    @pytest.mark.basic_source
+    def test_copy_exceptions(self):
+        """Test copy property exceptions."""
+        AI(FUT, "copy", RIVAR, RDVAR, copy=1)
+        msg = "Argument `copy` is not valid"
+        APROP(FUT(RIVAR, RDVAR), "copy", "a", RuntimeError, msg)
+        # Vectors that cannot be referenced
+        dep_var = array([1.0, 2.0, 3.0])
+        AI(FUT, "indep_var", RIVAR, dep_var, copy=False)
+        AI(FUT, "dep_var", dep_var, RDVAR, copy=False)
+        AI(FUT, "dep_var", dep_var, array([1.0, 2, 3, 4, 5, 6])[::2], copy=False)
+        AI(FUT, "indep_var", "a", dep_var, copy=False)
+
     @pytest.mark.basic_source
-    @pytest.mark.parametrize("prop", ["indep_min", "indep_max", "indep_var", "dep_var"])
+    @pytest.mark.parametrize(
+        "prop",
+        ["copy", "indep_min", "indep_max", "indep_var", "dep_var", "round_data"],
+    )
     def test_cannot_delete_attributes_exceptions(self, prop):
         """Test that del method raises an exception on all class attributes."""
         AROPROP(FUT(RDVAR, array([100, 200, 300])), prop)
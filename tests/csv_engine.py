@@ -0,0 +1,144 @@
+# csv_engine.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,F0401
+# pylint: disable=R0201,R0205,R0904,R0912,R0914,W0212,W0232,W0613
+
+# Standard library imports
+import os
+import sys
+
+# PyPI imports
+import pmisc
+from pmisc import AI
+import pytest
+
+# Intra-package imports
+import pplot
+
+if sys.hexversion < 0x03000000:
+    from pplot.compat2 import _write
+else:
+    from pplot.compat3 import _write
+
+
+###
+# Helper functions
+###
+def write_csv_file(file_handle):
+    _write(file_handle, "Col1,Col2,Col3\n")
+    _write(file_handle, "0,1,2\n")
+    _write(file_handle, "1,2,4\n")
+    _write(file_handle, "2,3,1\n")
+
+
+def write_quoted_csv_file(file_handle):
+    _write(file_handle, "Col1,Col2,Col3\n")
+    _write(file_handle, '0,1,"a"\n')
+    _write(file_handle, '1,2,"b"\n')
+
+
+###
+# Test classes
+###
+class TestCsvCache(object):
+    """Test for parsed comma-separated values files cache."""
+
+    def setup_method(self, method):
+        """Start each test with an empty cache of the default size."""
+        self.max_size = pplot.csv_cache_info().max_size
+        pplot.clear_csv_cache()
+
+    def teardown_method(self, method):
+        """Restore default cache size."""
+        pplot.set_csv_cache_size(self.max_size)
+        pplot.clear_csv_cache()
+
+    def test_cache_info(self):
+        """Test csv_cache_info function behavior."""
+        obj = pplot.csv_cache_info()
+        assert (obj.hits, obj.misses, obj.entries, obj.size) == (0, 0, 0, 0)
+        assert obj.max_size > 0
+
+    def test_shared_table(self):
+        """Test that sources that read the same file share the parsed data."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj1 = pplot.CsvSource(fname, "Col1", "Col2")
+            obj2 = pplot.CsvSource(fname, "Col1", "Col3", indep_min=1)
+            assert obj1._csv_obj is obj2._csv_obj
+            info = pplot.csv_cache_info()
+            assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+            assert info.size > 0
+            assert obj1.dep_var.tolist() == [1, 2, 3]
+            assert obj2.dep_var.tolist() == [4, 1]
+            # Pcsv engine does not use the cache
+            pplot.CsvSource(fname, "Col1", "Col2", engine="pcsv")
+            assert pplot.csv_cache_info().hits == 1
+
+    def test_stale_entry(self):
+        """Test that a file is parsed again when it changes."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj1 = pplot.CsvSource(fname, "Col1", "Col2")
+            stat = os.stat(fname)
+            with open(fname, "a") as fobj:
+                fobj.write("3,4,5\n")
+            os.utime(fname, (stat.st_atime, stat.st_mtime + 10))
+            obj2 = pplot.CsvSource(fname, "Col1", "Col2")
+            assert obj1._csv_obj is not obj2._csv_obj
+            assert obj2.dep_var.tolist() == [1, 2, 3, 4]
+            info = pplot.csv_cache_info()
+            assert (info.hits, info.misses, info.entries) == (0, 2, 2)
+
+    def test_fallback_entry(self):
+        """Test that files not handled by the columnar engine are remembered."""
+        with pmisc.TmpFile(write_quoted_csv_file) as fname:
+            obj1 = pplot.CsvSource(fname, "Col1", "Col2")
+            obj2 = pplot.CsvSource(fname, "Col1", "Col2")
+            assert not isinstance(obj1._csv_obj, pplot.csv_engine.CsvTable)
+            assert not isinstance(obj2._csv_obj, pplot.csv_engine.CsvTable)
+            info = pplot.csv_cache_info()
+            assert (info.hits, info.misses, info.entries, info.size) == (1, 1, 1, 0)
+
+    def test_clear(self):
+        """Test clear_csv_cache function behavior."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj1 = pplot.CsvSource(fname, "Col1", "Col2")
+            pplot.clear_csv_cache()
+            info = pplot.csv_cache_info()
+            assert (info.hits, info.misses, info.entries, info.size) == (0, 0, 0, 0)
+            obj2 = pplot.CsvSource(fname, "Col1", "Col2")
+            assert obj1._csv_obj is not obj2._csv_obj
+
+    def test_eviction(self):
+        """Test least recently used eviction behavior."""
+        with pmisc.TmpFile(write_csv_file) as fname1:
+            with pmisc.TmpFile(write_csv_file) as fname2:
+                obj1 = pplot.CsvSource(fname1, "Col1", "Col2")
+                size = pplot.csv_cache_info().size
+                pplot.set_csv_cache_size(size)
+                obj2 = pplot.CsvSource(fname2, "Col1", "Col2")
+                info = pplot.csv_cache_info()
+                assert (info.entries, info.size, info.max_size) == (1, size, size)
+                obj3 = pplot.CsvSource(fname2, "Col1", "Col3")
+                assert obj2._csv_obj is obj3._csv_obj
+                obj4 = pplot.CsvSource(fname1, "Col1", "Col3")
+                assert obj1._csv_obj is not obj4._csv_obj
+                pplot.set_csv_cache_size(0)
+                info = pplot.csv_cache_info()
+                assert (info.entries, info.size) == (0, 0)
+                obj5 = pplot.CsvSource(fname1, "Col1", "Col3")
+                assert obj4._csv_obj is not obj5._csv_obj
+                assert pplot.csv_cache_info().entries == 0
+
+    def test_read_only(self):
+        """Test that cached data cannot be modified."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = pplot.CsvSource(fname, "Col1", "Col2")
+            with pytest.raises(ValueError):
+                obj._csv_obj.data("Col2")[0] = 10
+
+    @pytest.mark.csv_source
+    def test_set_csv_cache_size_exceptions(self):
+        """Test set_csv_cache_size function exceptions."""
+        for item in [-1, 1.5, "a"]:
+            AI(pplot.set_csv_cache_size, "max_size", max_size=item)
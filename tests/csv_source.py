@@ -10,6 +10,7 @@ import sys
 
 # PyPI imports
 import numpy as np
+import pcsv
 import pmisc
 from pmisc import AE, AI, APROP, AROPROP, GET_EXMSG, RE
 import pytest
@@ -236,7 +237,690 @@ class TestCsvSource(object):
             )
             assert obj._complete
 
+    ### Public methods
+    def test_batch_update(self):  # noqa: D202
+        """Test batch_update method behavior."""
+        calls = []
+
+        def fproc(indep_var, dep_var, offset):
+            calls.append(offset)
+            return indep_var, dep_var + offset
+
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc, fproc_eargs={"offset": 1})
+            assert obj.dep_var.tolist() == [2, 3, 4, 2, 3]
+            assert calls == [1]
+            with obj.batch_update():
+                obj.rfilter = {"Col1": 0}
+                obj.dep_col_label = "Col3"
+                obj.fproc_eargs = {"offset": 10}
+                obj.indep_min = 2
+                # Data does not change within the context
+                assert obj.dep_var.tolist() == [2, 3, 4, 2, 3]
+            assert calls == [1, 10]
+            assert obj.indep_var.tolist() == [2, 3]
+            assert obj.dep_var.tolist() == [14, 11]
+            # Nested contexts
+            with obj.batch_update():
+                obj.indep_min = None
+                with obj.batch_update():
+                    obj.dep_col_label = "Col4"
+                assert calls == [1, 10]
+            assert calls == [1, 10, 10]
+            assert obj.dep_var.tolist() == [13, 15, 18]
+            # Properties are restored if data re-computation fails
+            with pytest.raises(ValueError):
+                with obj.batch_update():
+                    obj.dep_col_label = "Col9"
+                    obj.indep_min = 3
+            assert obj.dep_col_label == "Col4"
+            assert obj.indep_min is None
+            assert obj.dep_var.tolist() == [13, 15, 18]
+            # Properties are restored if an exception is raised in the context
+            with pytest.raises(RuntimeError):
+                with obj.batch_update():
+                    obj.indep_max = 2
+                    raise RuntimeError("Error")
+            assert obj.indep_max is None
+            assert obj.dep_var.tolist() == [13, 15, 18]
+            obj.indep_max = 2
+            assert obj.dep_var.tolist() == [13, 15]
+
+    def test_data_reprocessing(self):  # noqa: D202
+        """Test that data is processed from the file data after a change."""
+
+        def fproc1(indep_var, dep_var):
+            return indep_var, 2 * dep_var
+
+        def fproc2(indep_var, dep_var):
+            return indep_var[:1], dep_var[:1]
+
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc1)
+            assert obj.dep_var.tolist() == [2, 4, 6, 2, 4]
+            obj.fproc = fproc1
+            assert obj.dep_var.tolist() == [2, 4, 6, 2, 4]
+            obj.fproc = fproc2
+            assert obj.dep_var.tolist() == [1]
+            obj.rfilter = {"Col1": 1}
+            assert obj.indep_var.tolist() == [4]
+            assert obj.dep_var.tolist() == [1]
+
+    @pytest.mark.parametrize("engine", ["numpy", "pcsv"])
+    def test_lazy(self, engine):  # noqa: D202
+        """Test deferred data computation."""
+        calls = []
+
+        def fproc(indep_var, dep_var):
+            calls.append(True)
+            return indep_var, dep_var + 1
+
+        with pmisc.TmpFile(write_csv_file) as fname:
+            pplot.clear_csv_cache()
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc, engine=engine, lazy=True)
+            assert obj._csv_obj is None
+            assert not calls
+            assert pplot.csv_cache_info().misses == 0
+            obj.rfilter = {"Col1": 0}
+            obj.dep_col_label = "Col3"
+            obj.indep_max = 2
+            assert not calls
+            assert obj.indep_var.tolist() == [1, 2]
+            assert obj.dep_var.tolist() == [3, 5]
+            assert len(calls) == 1
+            obj.dep_col_label = "Col4"
+            obj.indep_max = None
+            assert len(calls) == 1
+            assert obj._complete
+            assert len(calls) == 2
+            assert obj.dep_var.tolist() == [4, 6, 9]
+            # Exceptions are raised on data access
+            obj.dep_col_label = "Col9"
+            exmsg = (
+                "Column Col9 (dependent column label) could not be found "
+                "in comma-separated file {0} header".format(fname)
+            )
+            with pytest.raises(ValueError) as excinfo:
+                obj.dep_var
+            assert GET_EXMSG(excinfo) == exmsg
+            with pytest.raises(ValueError):
+                obj.dep_var
+            obj.dep_col_label = "Col2"
+            assert obj.dep_var.tolist() == [2, 3, 4]
+            pplot.clear_csv_cache()
+
+    @pytest.mark.csv_source
+    def test_lazy_exceptions(self):
+        """Test lazy argument exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [None, 5]:
+                AI(FOBJ, "lazy", fname, "Col7", "Col2", lazy=item)
+
+    @pytest.mark.parametrize("engine", ["numpy", "pcsv"])
+    def test_from_columns(self, engine):  # noqa: D202
+        """Test from_columns method behavior."""
+
+        def fproc(indep_var, dep_var, offset):
+            return indep_var, dep_var + offset
+
+        def fproc_inplace(indep_var, dep_var):
+            indep_var += 1
+            dep_var *= 2
+            return indep_var, dep_var
+
+        with pmisc.TmpFile(write_csv_file) as fname:
+            labels = ["Col2", "Col3", "Col4", "Col8"]
+            kwargs = dict(rfilter={"Col1": 0}, indep_min=2, engine=engine)
+            objs = FOBJ.from_columns(fname, "Col7", labels, **kwargs)
+            assert len(objs) == len(labels)
+            for obj, label in zip(objs, labels):
+                ref = FOBJ(fname, "Col7", label, **kwargs)
+                assert obj.dep_col_label == label
+                assert (obj.indep_var == ref.indep_var).all()
+                assert (obj.dep_var == ref.dep_var).all()
+            assert objs[0].indep_var is objs[-1].indep_var
+            assert not objs[0].indep_var.flags.writeable
+            assert objs[3].dep_var.tolist() == [6, 5]
+            # Changing one source does not affect the others
+            objs[1].indep_min = 3
+            assert objs[1].indep_var.tolist() == [3]
+            assert objs[0].indep_var.tolist() == [2, 3]
+            objs[0].dep_col_label = "Col6"
+            assert objs[0].dep_var.tolist() == [4, 3]
+            assert objs[2].dep_var.tolist() == [5, 8]
+            # Processing function
+            objs = FOBJ.from_columns(
+                fname, "Col7", labels, fproc=fproc, fproc_eargs={"offset": 10}
+            )
+            assert objs[0].dep_var.tolist() == [11, 12, 13, 11, 12]
+            assert objs[3].dep_var.tolist() == [17, 16, 15, 14, 13]
+            # Processing function that modifies its arguments in place
+            objs = FOBJ.from_columns(
+                fname, "Col7", labels, fproc=fproc_inplace, **kwargs
+            )
+            for obj, label in zip(objs, labels):
+                ref = FOBJ(fname, "Col7", label, fproc=fproc_inplace, **kwargs)
+                assert obj.indep_var.tolist() == [3, 4]
+                assert (obj.dep_var == ref.dep_var).all()
+            assert objs[3].dep_var.tolist() == [12, 10]
+
+    @pytest.mark.csv_source
+    def test_from_columns_exceptions(self):
+        """Test from_columns method exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [None, "Col2", [], ["Col2", 5]]:
+                AI(FOBJ.from_columns, "dep_col_labels", fname, "Col7", item)
+            AE(
+                FOBJ.from_columns,
+                ValueError,
+                "Column Col9 (dependent column label) could not be found "
+                "in comma-separated file {0} header".format(fname),
+                fname,
+                "Col7",
+                ["Col2", "Col9"],
+            )
+            AE(
+                FOBJ.from_columns,
+                ValueError,
+                "Arguments `indep_var` and `dep_var` must have the same "
+                "number of elements",
+                fname,
+                "Col7",
+                ["Col2", "Col5"],
+            )
+            AI(FOBJ.from_columns, "fproc", fname, "Col7", ["Col2"], fproc=5)
+            AI(FOBJ.from_columns, "fproc_eargs", fname, "Col7", ["Col2"], fproc_eargs=5)
+
+    @pytest.mark.parametrize("engine", ["numpy", "pcsv"])
+    def test_split_by(self, engine):  # noqa: D202
+        """Test split_by method behavior."""
+
+        def fproc(indep_var, dep_var):
+            return indep_var, 2 * dep_var
+
+        def write_sweep_file(file_handle):
+            _write(file_handle, "Corner,Temp,Time,Value\n")
+            _write(file_handle, "tt,25,1,10\n")
+            _write(file_handle, "tt,25,2,20\n")
+            _write(file_handle, "ff,25,1,11\n")
+            _write(file_handle, "ff,25,2,21\n")
+            _write(file_handle, "tt,-40,1,12\n")
+            _write(file_handle, "ff,,1,30\n")
+            _write(file_handle, "tt,-40,2,22\n")
+            _write(file_handle, "ff,-40,1,13\n")
+            _write(file_handle, "ff,-40,2,23\n")
+            _write(file_handle, "ss,125.5,3,14\n")
+            _write(file_handle, "ss,125.5,2,24\n")
+
+        with pmisc.TmpFile(write_sweep_file) as fname:
+            rfilter = {"Corner": ["tt", "ss"]}
+            objs = FOBJ.split_by(fname, "Temp", "Time", "Value", rfilter, engine=engine)
+            assert sorted(objs.keys()) == [-40, 25, 125.5]
+            for key, obj in objs.items():
+                ref_rfilter = {"Corner": ["tt", "ss"], "Temp": key}
+                ref = FOBJ(fname, "Time", "Value", ref_rfilter, engine=engine)
+                assert (obj.indep_var == ref.indep_var).all()
+                assert (obj.dep_var == ref.dep_var).all()
+            assert objs[-40].dep_var.tolist() == [12, 22]
+            assert objs[125.5].indep_var.tolist() == [2, 3]
+            assert objs[125.5].dep_var.tolist() == [24, 14]
+            # Row filter, range bounding and processing function
+            objs = FOBJ.split_by(
+                fname,
+                "Corner",
+                "Time",
+                "Value",
+                rfilter={"Temp": [25, 125.5]},
+                indep_min=2,
+                fproc=fproc,
+                engine=engine,
+            )
+            assert sorted(objs.keys()) == ["ff", "ss", "tt"]
+            if engine == "numpy":
+                assert objs["ff"].rfilter == {"Temp": [25, 125.5], "Corner": "ff"}
+            assert objs["ff"].dep_var.tolist() == [42]
+            assert objs["ss"].dep_var.tolist() == [48, 28]
+            assert objs["tt"].dep_var.tolist() == [40]
+            # Sources are independent of each other
+            objs["ss"].indep_min = 3
+            assert objs["ss"].dep_var.tolist() == [28]
+            assert objs["tt"].dep_var.tolist() == [40]
+            objs = FOBJ.split_by(
+                fname, "Temp", "Time", "Value", {"Corner": "xx"}, engine=engine
+            )
+            assert objs == {}
+
+    @pytest.mark.csv_source
+    def test_split_by_exceptions(self):
+        """Test split_by method exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [None, 5]:
+                AI(FOBJ.split_by, "group_col", fname, item, "Col7", "Col2")
+            AI(FOBJ.split_by, "fname", 5, "Col1", "Col7", "Col2")
+            AI(FOBJ.split_by, "rfilter", fname, "Col1", "Col7", "Col2", rfilter=5)
+            AI(FOBJ.split_by, "engine", fname, "Col1", "Col7", "Col2", engine=5)
+            AE(
+                FOBJ.split_by,
+                ValueError,
+                "Column Col9 (group column label) could not be found "
+                "in comma-separated file {0} header".format(fname),
+                fname,
+                "Col9",
+                "Col7",
+                "Col2",
+            )
+            AE(
+                FOBJ.split_by,
+                ValueError,
+                "Column Col9 in row filter not found "
+                "in comma-separated file {0} header".format(fname),
+                fname,
+                "Col1",
+                "Col7",
+                "Col2",
+                rfilter={"Col9": 1},
+            )
+            AE(
+                FOBJ.split_by,
+                ValueError,
+                "Column Col9 (dependent column label) could not be found "
+                "in comma-separated file {0} header".format(fname),
+                fname,
+                "Col1",
+                "Col7",
+                "Col9",
+            )
+        AE(
+            FOBJ.split_by,
+            OSError,
+            "File _not_a_file_ could not be found",
+            "_not_a_file_",
+            "Col1",
+            "Col7",
+            "Col2",
+        )
+
     ### Properties
+    def test_cache_dir(self, tmpdir):  # noqa: D202
+        """Test cache_dir property behavior."""
+
+        def fproc1(indep_var, dep_var, offset):
+            return indep_var, dep_var + offset
+
+        def fproc2(indep_var, dep_var, offset):
+            return indep_var, dep_var - offset
+
+        def fproc3(indep_var, dep_var, offset):
+            return indep_var, dep_var + offset.value
+
+        class Offset(object):  # pylint: disable=R0903
+            def __init__(self, value):
+                self.value = value
+
+        cache_dir = os.path.join(str(tmpdir), "cache")
+        entries = lambda: sorted(os.listdir(cache_dir))
+        kwargs = dict(
+            rfilter={"Col1": 0},
+            fproc_eargs={"offset": 10},
+            indep_max=2,
+            cache_dir=cache_dir,
+        )
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc1, **kwargs)
+            assert obj.cache_dir == cache_dir
+            assert obj.dep_var.tolist() == [11, 12]
+            assert obj._csv_obj is not None
+            ref_entries = entries()
+            assert len(ref_entries) == 1
+            # Data retrieved from cache
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc1, **kwargs)
+            assert obj._csv_obj is None
+            assert isinstance(obj._raw_dep_var, np.memmap)
+            assert obj.indep_var.tolist() == [1, 2]
+            assert obj.dep_var.tolist() == [11, 12]
+            assert entries() == ref_entries
+            obj.indep_max = 1
+            assert obj.dep_var.tolist() == [11]
+            obj.dep_col_label = "Col3"
+            assert obj._csv_obj is not None
+            assert obj.dep_var.tolist() == [12]
+            assert len(entries()) == 2
+            # Processing function change replaces entry
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc2, **kwargs)
+            assert obj._csv_obj is not None
+            assert obj.dep_var.tolist() == [-9, -8]
+            assert len(entries()) == 2
+            assert ref_entries[0] not in entries()
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc2, **kwargs)
+            assert obj._csv_obj is None
+            assert obj.dep_var.tolist() == [-9, -8]
+            # Different extra arguments are a different entry
+            kwargs["fproc_eargs"] = {"offset": 20}
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc2, **kwargs)
+            assert obj.dep_var.tolist() == [-19, -18]
+            assert len(entries()) == 3
+            # File change replaces entry
+            stat = os.stat(fname)
+            with open(fname, "r") as fobj:
+                lines = fobj.readlines()
+            lines[1] = "0,9,2,3,,5,1,7\n"
+            with open(fname, "w") as fobj:
+                fobj.writelines(lines)
+            os.utime(fname, (stat.st_atime, stat.st_mtime + 10))
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc2, **kwargs)
+            assert obj._csv_obj is not None
+            assert obj.dep_var.tolist() == [-11, -18]
+            assert len(entries()) == 3
+            # Corrupted entries are ignored
+            for entry in entries():
+                with open(os.path.join(cache_dir, entry), "w") as fobj:
+                    fobj.write("Not a Numpy file")
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc2, **kwargs)
+            assert obj._csv_obj is not None
+            assert obj.dep_var.tolist() == [-11, -18]
+            obj = FOBJ(fname, "Col7", "Col2", fproc=fproc2, **kwargs)
+            assert obj._csv_obj is None
+            assert obj.dep_var.tolist() == [-11, -18]
+            # Data of processing functions that cannot be identified reliably
+            # is not cached
+            ref_entries = entries()
+            kwargs["fproc_eargs"] = {"offset": Offset(10)}
+            for _ in range(2):
+                obj = FOBJ(fname, "Col7", "Col2", fproc=fproc3, **kwargs)
+                assert obj._csv_obj is not None
+                assert obj.dep_var.tolist() == [19, 12]
+            assert entries() == ref_entries
+
+    @pytest.mark.csv_source
+    def test_cache_dir_exceptions(self):
+        """Test cache_dir property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            AI(FOBJ, "cache_dir", fname, "Col7", "Col2", cache_dir=5)
+            obj = FOBJ(fname, "Col7", "Col2")
+            exmsg = "Argument `cache_dir` is not valid"
+            APROP(obj, "cache_dir", 5, RuntimeError, exmsg)
+
+    @pytest.mark.parametrize("chunk_size", [1, 20, 40, 2 ** 20])
+    def test_chunk_size(self, chunk_size):  # noqa: D202
+        """Test chunk_size property behavior."""
+
+        def fproc(indep_var, dep_var):
+            return indep_var * 10, dep_var - 1
+
+        def write_large_file(file_handle):
+            _write(file_handle, "Col1,Col2,Col3\n")
+            for num in range(200):
+                _write(file_handle, "{0},{1},{2}\n".format(num % 2, num, num % 7))
+
+        def write_quoted_file(file_handle):
+            _write(file_handle, "Col7,Col3,Name\n")
+            for num in range(1, 6):
+                _write(file_handle, '{0},{1},"a, b"\n'.format(num, 2 * num))
+
+        with pmisc.TmpFile(write_large_file) as fname:
+            for kwargs in [
+                dict(),
+                dict(rfilter={"Col1": 1}),
+                dict(indep_min=15, indep_max=150, fproc=fproc),
+                dict(rfilter={"Col1": 0}, indep_max=0.5),
+            ]:
+                ref = FOBJ(fname, "Col2", "Col3", **kwargs)
+                obj = FOBJ(fname, "Col2", "Col3", chunk_size=chunk_size, **kwargs)
+                assert obj.chunk_size == chunk_size
+                assert obj._csv_obj is None
+                assert (obj.indep_var == ref.indep_var).all()
+                assert (obj.dep_var == ref.dep_var).all()
+            # Changing streaming parameters re-reads file
+            obj = FOBJ(fname, "Col2", "Col3", rfilter={"Col1": 1})
+            obj.chunk_size = chunk_size
+            assert obj._csv_obj is None
+            obj.rfilter = {"Col1": 0}
+            assert obj.indep_var.tolist() == list(range(0, 200, 2))
+            obj.chunk_size = None
+            assert obj._csv_obj is not None
+            assert obj.indep_var.tolist() == list(range(0, 200, 2))
+            # Widening the range re-reads file
+            obj = FOBJ(fname, "Col2", "Col3", indep_max=10, chunk_size=chunk_size)
+            assert obj.indep_var.tolist() == list(range(11))
+            obj.indep_max = None
+            assert obj.indep_var.tolist() == list(range(200))
+        # Descending data
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(fname, "Col6", "Col7", indep_max=4, chunk_size=chunk_size)
+            assert obj.indep_var.tolist() == [0, 3, 4]
+            assert obj.dep_var.tolist() == [4, 3, 2]
+        # Files that the columnar engine cannot parse are not streamed
+        with pmisc.TmpFile(write_quoted_file) as fname:
+            obj = FOBJ(fname, "Col7", "Col3", chunk_size=chunk_size)
+            assert obj.indep_var.tolist() == [1, 2, 3, 4, 5]
+            assert obj.dep_var.tolist() == [2, 4, 6, 8, 10]
+
+    @pytest.mark.csv_source
+    def test_chunk_size_exceptions(self):
+        """Test chunk_size property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [0, 1.5, "a"]:
+                AI(FOBJ, "chunk_size", fname, "Col7", "Col2", chunk_size=item)
+            obj = FOBJ(fname, "Col7", "Col2")
+            msg = "Argument `chunk_size` is not valid"
+            APROP(obj, "chunk_size", -1, RuntimeError, msg)
+            kwargs = dict(chunk_size=10)
+            msg = "Filtered independent variable is empty"
+            AE(FOBJ, ValueError, msg, fname, "Col7", "Col3", {"Col1": 5}, **kwargs)
+            msg = (
+                "Argument `indep_var` is empty after "
+                "`indep_min`/`indep_max` range bounding"
+            )
+            AE(FOBJ, ValueError, msg, fname, "Col7", "Col3", indep_min=10, **kwargs)
+            msg = (
+                "Column Col9 (independent column label) could not be found "
+                "in comma-separated file {0} header".format(fname)
+            )
+            AE(FOBJ, ValueError, msg, fname, "Col9", "Col3", **kwargs)
+
+    def test_workers(self, monkeypatch):  # noqa: D202
+        """Test workers property behavior."""
+
+        def write_large_file(file_handle):
+            _write(file_handle, "Col1,Col2,Col3,Name\n")
+            _write(file_handle, "Units,s,V,\n")
+            for num in range(300):
+                col3 = "" if num % 11 else num % 7
+                name = "x" if num > 150 else "y"
+                row = [num % 3, num, col3, name]
+                _write(file_handle, ",".join(str(item) for item in row) + "\n")
+
+        def write_quoted_file(file_handle):
+            _write(file_handle, "Col1,Col2,Col3,Name\n")
+            for num in range(300):
+                _write(file_handle, "{0},{1},{2},1\n".format(num % 3, num, num))
+            _write(file_handle, '0,300,0,"a, b"\n')
+
+        monkeypatch.setattr(pplot.csv_engine, "_MIN_RANGE_SIZE", 256)
+        with pmisc.TmpFile(write_large_file) as fname:
+            ranges = pplot.csv_engine._file_ranges(fname, 4)
+            assert len(ranges) == 4
+            with open(fname, "rb") as fobj:
+                data = fobj.read()
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == len(data)
+            for (_, stop), (start, _) in zip(ranges[:-1], ranges[1:]):
+                assert (stop == start) and (data[start - 1 : start] == b"\n")
+            ref = pplot.csv_engine.CsvTable(fname)
+            table = pplot.csv_engine.CsvTable(fname, workers=4)
+            assert table.header() == ref.header()
+            assert table._rows == ref._rows == 300
+            for label in ref.header():
+                assert table.data(label).tolist() == ref.data(label).tolist()
+            for kwargs in [
+                dict(),
+                dict(rfilter={"Col1": 1, "Name": "x"}),
+                dict(rfilter={"Col3": {">": 2}}, indep_max=200),
+            ]:
+                pplot.clear_csv_cache()
+                ref = FOBJ(fname, "Col2", "Col1", **kwargs)
+                pplot.clear_csv_cache()
+                obj = FOBJ(fname, "Col2", "Col1", workers=3, **kwargs)
+                assert obj.workers == 3
+                assert (ref.indep_var == obj.indep_var).all()
+                assert (ref.dep_var == obj.dep_var).all()
+            obj.workers = None
+            assert obj.workers is None
+        # Files the columnar engine cannot parse fall back to the pcsv module
+        with pmisc.TmpFile(write_quoted_file) as fname:
+            obj = FOBJ(fname, "Col2", "Col3", rfilter={"Col1": 0}, workers=2)
+            assert isinstance(obj._csv_obj, pcsv.CsvFile)
+            assert obj.indep_var.size == 101
+        pplot.clear_csv_cache()
+
+    @pytest.mark.csv_source
+    def test_workers_exceptions(self):
+        """Test workers property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [0, 1.5, "a"]:
+                AI(FOBJ, "workers", fname, "Col7", "Col2", workers=item)
+            obj = FOBJ(fname, "Col7", "Col2")
+            msg = "Argument `workers` is not valid"
+            APROP(obj, "workers", -1, RuntimeError, msg)
+
+    def test_decimate(self):  # noqa: D202
+        """Test decimate property behavior."""
+
+        def write_large_file(file_handle):
+            _write(file_handle, "Col1,Col2\n")
+            for num in range(1000):
+                _write(file_handle, "{0},{1}\n".format(num, (num * 37) % 101))
+
+        with pmisc.TmpFile(write_large_file) as fname:
+            ref = FOBJ(fname, "Col1", "Col2")
+            obj = FOBJ(fname, "Col1", "Col2", decimate=100)
+            assert obj.decimate == 100
+            assert obj.indep_var.size <= 100
+            assert (np.diff(obj.indep_var) > 0).all()
+            # Envelope is preserved
+            for item in [obj.dep_var.min(), obj.dep_var.max()]:
+                assert item in [ref.dep_var.min(), ref.dep_var.max()]
+            assert obj.indep_var[0] == 0
+            # Range bounding is applied before decimation
+            obj.indep_min = 500
+            assert obj.indep_var.size <= 100
+            assert obj.indep_var[0] >= 500
+            obj.indep_min = 0
+            assert obj.indep_var[0] == 0
+            obj.decimate = 2000
+            assert (obj.indep_var == ref.indep_var).all()
+            obj.decimate = None
+            assert (obj.dep_var == ref.dep_var).all()
+            # On-the-fly decimation while streaming
+            obj = FOBJ(fname, "Col1", "Col2", decimate=50, chunk_size=500)
+            assert obj.indep_var.size <= 50
+            assert (np.diff(obj.indep_var) > 0).all()
+            assert obj.dep_var.min() == ref.dep_var.min()
+            assert obj.dep_var.max() == ref.dep_var.max()
+
+    @pytest.mark.csv_source
+    def test_decimate_exceptions(self):
+        """Test decimate property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [1, 2.5, "a"]:
+                AI(FOBJ, "decimate", fname, "Col7", "Col2", decimate=item)
+            obj = FOBJ(fname, "Col7", "Col2")
+            APROP(obj, "decimate", 0, RuntimeError, "Argument `decimate` is not valid")
+
+    @pytest.mark.parametrize("chunk_size", [None, 10])
+    def test_follow(self, chunk_size):  # noqa: D202
+        """Test follow mode and refresh method behavior."""
+
+        def fproc(indep_var, dep_var):
+            return indep_var, dep_var + 1
+
+        def append(fname, text):
+            with open(fname, "a") as fobj:
+                fobj.write(text)
+
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(
+                fname,
+                "Col7",
+                "Col2",
+                rfilter={"Col1": 1},
+                indep_max=20,
+                fproc=fproc,
+                chunk_size=chunk_size,
+                follow=True,
+            )
+            assert obj._csv_obj is None
+            assert obj.indep_var.tolist() == [4, 5]
+            assert obj.dep_var.tolist() == [2, 3]
+            assert not obj.refresh()
+            # Only complete rows are read, rows are filtered and bounded
+            append(fname, "1,5,0,0,0,0,6,0\n0,6,0,0,0,0,7,0\n1,7,0,0,0,0,8")
+            assert obj.refresh()
+            assert obj.indep_var.tolist() == [4, 5, 6]
+            assert obj.dep_var.tolist() == [2, 3, 6]
+            append(fname, ",0\n1,8,0,0,0,0,21,0\n")
+            assert obj.refresh()
+            assert obj.indep_var.tolist() == [4, 5, 6, 8]
+            assert obj.dep_var.tolist() == [2, 3, 6, 8]
+            assert not obj.refresh()
+            # Appended rows are not necessarily in range
+            append(fname, "0,9,0,0,0,0,22,0\n")
+            assert obj.refresh()
+            assert obj.indep_var.tolist() == [4, 5, 6, 8]
+            # Property changes re-read file
+            obj.indep_max = None
+            assert obj.indep_var.tolist() == [4, 5, 6, 8, 21]
+            obj.rfilter = {"Col1": 0}
+            assert obj.indep_var.tolist() == [1, 2, 3, 7, 22]
+            # Re-written file is read again
+            with open(fname, "w") as fobj:
+                write_csv_file(fobj)
+            assert obj.refresh()
+            assert obj.indep_var.tolist() == [1, 2, 3]
+            assert obj.dep_var.tolist() == [2, 3, 4]
+        # Decimation
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(fname, "Col7", "Col2", decimate=4, follow=True)
+            append(
+                fname,
+                "".join(
+                    "0,{0},0,0,0,0,{1},0\n".format(num % 5, num) for num in range(6, 50)
+                ),
+            )
+            assert obj.refresh()
+            assert obj.indep_var.size <= 4
+            assert obj.dep_var.min() == 0
+            assert obj.dep_var.max() == 4
+        # Files are read again when they change if not in follow mode
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = FOBJ(fname, "Col7", "Col2")
+            assert not obj.refresh()
+            append(fname, "1,5,0,0,0,0,6,0\n")
+            assert obj.refresh()
+            assert obj.indep_var.tolist() == [1, 2, 3, 4, 5, 6]
+            assert obj.dep_var.tolist() == [1, 2, 3, 1, 2, 5]
+            assert not obj.refresh()
+
+    @pytest.mark.csv_source
+    def test_follow_exceptions(self):
+        """Test follow argument exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [None, 5]:
+                AI(FOBJ, "follow", fname, "Col7", "Col2", follow=item)
+            msg = "Filtered independent variable is empty"
+            AE(FOBJ, ValueError, msg, fname, "Col7", "Col3", {"Col1": 5}, follow=True)
+            msg = (
+                "Argument `indep_var` is empty after "
+                "`indep_min`/`indep_max` range bounding"
+            )
+            AE(FOBJ, ValueError, msg, fname, "Col7", "Col3", indep_min=10, follow=True)
+            obj = FOBJ(fname, "Col7", "Col2", follow=True)
+            with open(fname, "a") as fobj:
+                fobj.write("1,5,0,0,0,0,3,0\n")
+            with pytest.raises(RuntimeError) as excinfo:
+                obj.refresh()
+            assert GET_EXMSG(excinfo) == "Argument `indep_var` is not valid"
+
     def test_indep_max(self):
         """Test indep_max property behavior."""
         items = [1, 2.0]
@@ -331,6 +1015,149 @@ class TestCsvSource(object):
                 obj.indep_min = 50
             assert GET_EXMSG(excinfo) == msg
 
+    @pytest.mark.parametrize("engine", ["numpy", "NUMPY", "pcsv", " Pcsv "])
+    def test_engine(self, engine):
+        """Test engine property behavior."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = pplot.CsvSource(
+                fname=fname,
+                indep_col_label="Col2",
+                dep_col_label="Col3",
+                rfilter={"Col1": 0},
+                engine=engine,
+            )
+            assert obj.engine == engine.strip().upper()
+            assert (obj.indep_var == np.array([1, 2, 3])).all()
+            assert (obj.dep_var == np.array([2, 4, 1])).all()
+            obj.engine = "pcsv" if obj.engine == "NUMPY" else "numpy"
+            assert (obj.indep_var == np.array([1, 2, 3])).all()
+            assert (obj.dep_var == np.array([2, 4, 1])).all()
+
+    def test_engine_equivalence(self):  # noqa: D202
+        """Test that all engines retrieve the same data."""
+
+        def write_mixed_file(file_handle):
+            _write(file_handle, "Ctrl,X,Y\n")
+            _write(file_handle, "Units,s,V\n")
+            _write(file_handle, ",,\n")
+            _write(file_handle, "a,1,5.5\n")
+            _write(file_handle, "b,2,\n")
+            _write(file_handle, "a,3,-1E-3\n")
+            _write(file_handle, "a,,4\n")
+            _write(file_handle, "a,5,7")
+
+        def write_quoted_file(file_handle):
+            _write(file_handle, 'Ctrl,X,Y\n"a",1,2\n"b,c",2,3\n"a",3,4\n')
+
+        items = [
+            (write_csv_file, "Col7", "Col3", None),
+            (write_csv_file, "Col2", "Col3", {"Col1": 0}),
+            (write_csv_file, "Col6", "Col3", {"Col1": 0}),
+            (write_csv_file, "Col7", "Col4", {"Col1": [0, 1], "Col3": [1, 2, 3]}),
+            (write_csv_file, "Col7", "Col5", {"Col1": 1}),
+            (write_mixed_file, "X", "X", None),
+            (write_mixed_file, "X", "Y", {"Ctrl": ["a", "b"]}),
+            (write_mixed_file, "X", "X", {"Ctrl": "a"}),
+            (write_quoted_file, "X", "Y", {"Ctrl": "a"}),
+            (write_csv_file, "Col7", "Col3", {"Col4": {">=": 5, "<": 8}}),
+            (write_csv_file, "Col2", "Col4", {"Col1": 0, "Col3": {"!=": 4}}),
+            (write_csv_file, "Col7", "Col2", {"Col5": {"<=": 8}}),
+            (write_mixed_file, "X", "Y", {"Ctrl": {"<=": "a"}, "Y": {"<": 6, "!=": 4}}),
+            (write_quoted_file, "X", "Y", {"Ctrl": {"!=": "a"}, "Y": {">": 2}}),
+        ]
+        for write_func, indep_col_label, dep_col_label, rfilter in items:
+            with pmisc.TmpFile(write_func) as fname:
+                ref, obj = [
+                    pplot.CsvSource(
+                        fname=fname,
+                        indep_col_label=indep_col_label,
+                        dep_col_label=dep_col_label,
+                        rfilter=rfilter,
+                        engine=engine,
+                    )
+                    for engine in ["pcsv", "numpy"]
+                ]
+            assert (ref.indep_var == obj.indep_var).all()
+            assert (ref.dep_var == obj.dep_var).all()
+        # Files with quoted fields are read with the pcsv engine
+        assert not isinstance(obj._csv_obj, pplot.csv_engine.CsvTable)
+
+    @pytest.mark.parametrize("comp", ["gzip", "bz2", "lzma"])
+    def test_compressed(self, comp):
+        """Test that compressed files are read transparently."""
+        module = pytest.importorskip(comp)
+        with pmisc.TmpFile(write_csv_file) as fname:
+            with open(fname, "rb") as fobj:
+                data = fobj.read()
+            ref = FOBJ(fname, "Col2", "Col3", {"Col1": 0})
+        with pmisc.TmpFile() as fname:
+            with open(fname, "wb") as fobj:
+                fobj.write(module.compress(data))
+            for kwargs in [
+                dict(engine="numpy"),
+                dict(engine="pcsv"),
+                dict(chunk_size=10),
+            ]:
+                obj = FOBJ(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+                assert not isinstance(obj._csv_obj, pcsv.CsvFile)
+                assert (ref.indep_var == obj.indep_var).all()
+                assert (ref.dep_var == obj.dep_var).all()
+        # Compressed files have to be parsed by the columnar engine
+        with pmisc.TmpFile() as fname:
+            with open(fname, "wb") as fobj:
+                fobj.write(module.compress(b'Ctrl,X,Y\n"a",1,2\n"b,c",2,3\n'))
+            msg = (
+                "Compressed file {0} has quoted fields or rows with "
+                "different number of columns".format(fname)
+            )
+            AE(FOBJ, RuntimeError, msg, fname, "X", "Y")
+
+    @pytest.mark.csv_source
+    def test_engine_exceptions(self):
+        """Test engine property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            for item in [None, 5]:
+                AI(FOBJ, "engine", fname, "Col7", "Col2", engine=item)
+            exmsg = (
+                "Argument `engine` is not one of ['NUMPY', 'PCSV'] (case insensitive)"
+            )
+            AE(FOBJ, ValueError, exmsg, fname, "Col7", "Col2", engine="pandas")
+            obj = pplot.CsvSource(
+                fname=fname, indep_col_label="Col7", dep_col_label="Col2"
+            )
+            APROP(obj, "engine", "pandas", ValueError, exmsg)
+
+    @pytest.mark.csv_source
+    @pytest.mark.parametrize("engine", ["numpy", "pcsv"])
+    def test_file_exceptions(self, engine):  # noqa: D202
+        """Test file contents exceptions."""
+
+        def write_empty_file(file_handle):
+            _write(file_handle, "")
+
+        def write_no_data_file(file_handle):
+            _write(file_handle, "Col1,Col2\na,b\n")
+
+        def write_duplicate_header_file(file_handle):
+            _write(file_handle, "Col1,col1\n1,2\n")
+
+        items = [
+            (write_empty_file, "File {0} is empty"),
+            (write_no_data_file, "File {0} has no valid data"),
+            (write_duplicate_header_file, "Column headers are not unique in file {0}"),
+        ]
+        for write_func, exmsg in items:
+            with pmisc.TmpFile(write_func) as fname:
+                AE(
+                    FOBJ,
+                    RE,
+                    exmsg.format(fname),
+                    fname,
+                    "Col1",
+                    "Col2",
+                    engine=engine,
+                )
+
     def test_fname(self):
         """Test constructor fname argument behavior."""
         with pmisc.TmpFile(write_csv_file) as fname:
@@ -620,6 +1447,54 @@ class TestCsvSource(object):
                     rfilter=item,
                 )
 
+    @pytest.mark.parametrize("chunk_size", [None, 2])
+    def test_rfilter_comparison(self, chunk_size):
+        """Test row filter comparisons."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = pplot.CsvSource(
+                fname=fname,
+                indep_col_label="Col7",
+                dep_col_label="Col2",
+                rfilter={"Col4": {">": 3, "<=": 7}, "Col5": {"==": 8}},
+                chunk_size=chunk_size,
+            )
+            assert (obj.indep_var == np.array([4])).all()
+            assert (obj.dep_var == np.array([1])).all()
+            obj.rfilter = {"Col1": [0, 1], "Col3": {">=": 3}}
+            assert (obj.indep_var == np.array([2, 4, 5])).all()
+            assert (obj.dep_var == np.array([2, 1, 2])).all()
+            # Empty fields are never selected
+            obj.rfilter = {"Col5": {"!=": 0}}
+            assert (obj.indep_var == np.array([4, 5])).all()
+
+    def test_column_projection(self):
+        """Test that only the columns needed are parsed."""
+        pplot.clear_csv_cache()
+        with pmisc.TmpFile(write_csv_file) as fname:
+            obj = pplot.CsvSource(
+                fname=fname,
+                indep_col_label="Col2",
+                dep_col_label="Col3",
+                rfilter={"Col1": 0},
+            )
+            table = obj._csv_obj
+            held = [num for num, col in enumerate(table._cols) if col is not None]
+            assert held == [0, 1, 2]
+            size = pplot.csv_cache_info().size
+            # Columns are added to the cached table when they are needed
+            obj.dep_col_label = "Col6"
+            assert obj._csv_obj is table
+            assert table._cols[5] is not None
+            assert (obj.dep_var == np.array([5, 4, 3])).all()
+            assert pplot.csv_cache_info().size > size
+            assert pplot.csv_cache_info().entries == 1
+            objs = pplot.CsvSource.from_columns(
+                fname, "Col2", ["Col3", "Col4"], rfilter={"Col1": 0}
+            )
+            assert (objs[1].dep_var == np.array([3, 5, 8])).all()
+            assert objs[0]._csv_obj is table
+        pplot.clear_csv_cache()
+
     @pytest.mark.csv_source
     def test_rfilter_exceptions(self):
         """Test constructor rfilter argument exceptions."""
@@ -631,6 +1506,33 @@ class TestCsvSource(object):
                 "comma-separated file {0} header".format(fname)
             )
             AE(FOBJ, ValueError, exmsg, fname, "Col7", "Col2", {"Col99": 500})
+            kwargs = dict(rfilter={"Col99": {">": 1}})
+            AE(FOBJ, ValueError, exmsg, fname, "Col7", "Col2", **kwargs)
+            AI(FOBJ, "rfilter", fname, "Col7", "Col2", {"Col1": {"=": 0}})
+
+    def test_round_data(self):
+        """Test round_data property behavior."""
+        with pmisc.TmpFile() as fname:
+            with open(fname, "w") as fobj:
+                fobj.write("Col1,Col2\n1,0.12345678901234\n2,3.5\n")
+            obj = pplot.CsvSource(fname, "Col1", "Col2")
+            assert obj.round_data
+            assert obj.dep_var.tolist() == [0.12345678901, 3.5]
+            obj.round_data = False
+            assert obj.dep_var.tolist() == [0.12345678901234, 3.5]
+            obj = pplot.CsvSource(fname, "Col1", "Col2", round_data=False)
+            assert not obj.round_data
+            assert obj.dep_var.tolist() == [0.12345678901234, 3.5]
+            assert obj.indep_var.dtype == float
+
+    @pytest.mark.csv_source
+    def test_round_data_exceptions(self):
+        """Test round_data property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            AI(FOBJ, "round_data", fname, "Col7", "Col2", round_data=1)
+            obj = FOBJ(fname, "Col7", "Col2")
+            msg = "Argument `round_data` is not valid"
+            APROP(obj, "round_data", None, RuntimeError, msg)
 
     @pytest.mark.csv_source
     def test_cannot_delete_attributes_exceptions(self):
@@ -640,8 +1542,11 @@ class TestCsvSource(object):
                 fname=fname, indep_col_label="Col7", dep_col_label="Col2"
             )
             prop_list = [
+                "chunk_size",
+                "decimate",
                 "dep_col_label",
                 "dep_var",
+                "engine",
                 "fname",
                 "fproc",
                 "fproc_eargs",
@@ -649,7 +1554,10 @@ class TestCsvSource(object):
                 "indep_max",
                 "indep_min",
                 "indep_var",
+                "memoize",
                 "rfilter",
+                "round_data",
+                "workers",
             ]
             for prop in prop_list:
                 AROPROP(obj, prop)
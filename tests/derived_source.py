@@ -0,0 +1,192 @@
+# derived_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# PyPI imports
+import numpy as np
+from pmisc import AE, AI, APROP, AROPROP, GET_EXMSG
+import pytest
+
+# Intra-package imports
+import pplot
+from pplot import DerivedSource as FUT
+from tests.function_source import counted
+
+
+###
+# Helper functions
+###
+def create_sources():
+    """Create data sources with different independent variables."""
+    return [
+        pplot.BasicSource(
+            indep_var=np.array([1, 2, 3, 4]), dep_var=np.array([10, 20, 30, 40])
+        ),
+        pplot.BasicSource(
+            indep_var=np.array([1.5, 2.5, 3.5]), dep_var=np.array([1, 2, 3])
+        ),
+    ]
+
+
+###
+# Test classes
+###
+class TestDerivedSource(object):
+    """Test for DerivedSource."""
+
+    def test_str(self):
+        """Test that str behaves correctly."""
+
+        def diff(minuend, subtrahend):
+            return minuend - subtrahend
+
+        obj = str(FUT(create_sources(), diff))
+        ref = (
+            "Number of sources: 2\n"
+            "Function: diff\n"
+            "Alignment: INTERP\n"
+            "Independent variable: [ 1.5, 2.0, 2.5, 3.0, 3.5 ]\n"
+            "Dependent variable: [ 14.0, 18.5, 23.0, 27.5, 32.0 ]"
+        )
+        assert obj == ref
+
+    def test_align(self):
+        """Test alignment of independent variables."""
+        src1, src2 = create_sources()
+        obj = FUT([src1, src2], lambda x, y: x / y, align="Interp")
+        assert obj.align == "INTERP"
+        assert (obj.indep_var == np.array([1.5, 2.0, 2.5, 3.0, 3.5])).all()
+        assert np.allclose(obj.dep_var, np.array([15, 20 / 1.5, 12.5, 12, 35 / 3.0]))
+        obj.align = " intersect "
+        assert obj.align == "INTERSECT"
+        src3 = pplot.BasicSource(
+            indep_var=np.array([0, 2, 2.5, 4, 9]), dep_var=np.array([1, 2, 3, 4, 5])
+        )
+        obj.sources = [src1, src3]
+        assert (obj.indep_var == np.array([2.0, 4.0])).all()
+        assert (obj.dep_var == np.array([10.0, 10.0])).all()
+        obj.align = "interp"
+        assert (obj.indep_var == np.array([1, 2, 2.5, 3, 4])).all()
+        assert np.allclose(obj.dep_var, np.array([20 / 3.0, 10, 25 / 3.0, 9, 10]))
+        # Same independent variable is not aligned
+        src4 = pplot.BasicSource(
+            indep_var=np.array([1, 2, 3, 4]), dep_var=np.array([4, 3, 2, 1])
+        )
+        for align in ["interp", "intersect"]:
+            obj = FUT([src1, src4], np.add, align=align)
+            assert obj.indep_var is src1.indep_var
+            assert (obj.dep_var == np.array([14.0, 23.0, 32.0, 41.0])).all()
+        # Single data source, normalized curve
+        obj = FUT([src1], lambda x: x / x.max())
+        assert (obj.dep_var == np.array([0.25, 0.5, 0.75, 1.0])).all()
+        # Derived sources can be data sources of other derived sources
+        obj = FUT([obj, src2], lambda x, y: x + y)
+        assert (obj.indep_var == np.array([1.5, 2.0, 2.5, 3.0, 3.5])).all()
+        assert np.allclose(obj.dep_var, np.array([1.375, 2.0, 2.625, 3.25, 3.875]))
+
+    def test_cache(self):
+        """Test that data is computed again only when a data source changes."""
+        calls = []
+        src1, src2 = create_sources()
+        obj = FUT([src1, src2], counted(np.subtract, calls))
+        assert not calls
+        obj.indep_var
+        obj.dep_var
+        str(obj)
+        assert calls == [5]
+        src2.indep_max = 3
+        assert (obj.indep_var == np.array([1.5, 2.0, 2.5])).all()
+        assert (obj.dep_var == np.array([14.0, 18.5, 23.0])).all()
+        assert calls == [5, 3]
+        src1.extend(np.array([5, 6]), np.array([50, 60]))
+        obj.dep_var
+        assert calls == [5, 3, 3]
+        obj.func = counted(np.add, calls)
+        assert (obj.dep_var == np.array([16.0, 21.5, 27.0])).all()
+        assert calls == [5, 3, 3, 3]
+        obj.dep_var
+        assert calls == [5, 3, 3, 3]
+
+    def test_series(self):
+        """Test that derived sources are valid series data sources."""
+        obj = pplot.Series(data_source=FUT(create_sources(), np.subtract), label="a")
+        assert (obj.indep_var == np.array([1.5, 2.0, 2.5, 3.0, 3.5])).all()
+        assert (obj.dep_var == np.array([14.0, 18.5, 23.0, 27.5, 32.0])).all()
+
+    @pytest.mark.derived_source
+    def test_sources_exceptions(self):
+        """Test data sources exceptions."""
+        src1, src2 = create_sources()
+        for item in [None, 5, [], (src1, src2), [src1, 5]]:
+            AI(FUT, "sources", item, np.add)
+        obj = FUT([src1, src2], np.subtract)
+        APROP(obj, "sources", [], RuntimeError, "Argument `sources` is not valid")
+        exmsg = "Argument `sources` is not fully specified"
+        src2._indep_var = None
+        with pytest.raises(RuntimeError) as excinfo:
+            obj.dep_var
+        assert GET_EXMSG(excinfo) == exmsg
+        exmsg = "Independent variable ranges of data sources do not overlap"
+        src3 = pplot.BasicSource(
+            indep_var=np.array([5, 6, 7]), dep_var=np.array([1, 2, 3])
+        )
+        obj = FUT([src1, src3], np.add)
+        with pytest.raises(ValueError) as excinfo:
+            obj.indep_var
+        assert GET_EXMSG(excinfo) == exmsg
+        exmsg = "Data sources do not have independent variable points in common"
+        obj = FUT(create_sources(), np.add, align="intersect")
+        with pytest.raises(ValueError) as excinfo:
+            obj.indep_var
+        assert GET_EXMSG(excinfo) == exmsg
+
+    @pytest.mark.derived_source
+    def test_func_exceptions(self):
+        """Test function exceptions."""
+        AI(FUT, "func", create_sources(), 5)
+        AI(FUT, "func", create_sources(), None)
+        obj = FUT(create_sources(), np.add)
+        APROP(obj, "func", "a", RuntimeError, "Argument `func` is not valid")
+
+        def ret_list(minuend, subtrahend):
+            return (minuend - subtrahend).tolist()
+
+        exmsg = "Argument `func` (function ret_list) return value is not valid"
+        obj = FUT(create_sources(), ret_list)
+        with pytest.raises(TypeError) as excinfo:
+            obj.dep_var
+        assert GET_EXMSG(excinfo) == exmsg
+        for func in [lambda x, y: x[:-1], lambda x, y: np.array(["a"] * x.size)]:
+            obj = FUT(create_sources(), func)
+            exmsg = "Argument `func` (function <lambda>) return value is not valid"
+            with pytest.raises(TypeError) as excinfo:
+                obj.dep_var
+            assert GET_EXMSG(excinfo) == exmsg
+
+        def raise_ex(minuend, subtrahend):
+            raise ValueError("Bad value")
+
+        exmsg = "Argument `func` (function raise_ex) raised an exception: Bad value"
+        obj = FUT(create_sources(), raise_ex)
+        with pytest.raises(RuntimeError) as excinfo:
+            obj.indep_var
+        assert GET_EXMSG(excinfo) == exmsg
+
+    @pytest.mark.derived_source
+    def test_align_exceptions(self):
+        """Test alignment exceptions."""
+        AI(FUT, "align", create_sources(), np.add, align=5)
+        exmsg = (
+            "Argument `align` is not one of ['INTERP', 'INTERSECT'] "
+            "(case insensitive)"
+        )
+        AE(FUT, ValueError, exmsg, create_sources(), np.add, align="a")
+
+    @pytest.mark.derived_source
+    @pytest.mark.parametrize(
+        "prop", ["align", "dep_var", "func", "indep_var", "sources"]
+    )
+    def test_cannot_delete_attributes_exceptions(self, prop):
+        """Test that del method raises an exception on all class attributes."""
+        AROPROP(FUT(create_sources(), np.add), prop)
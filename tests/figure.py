@@ -308,6 +308,34 @@ class TestFigure(object):
         obj = pplot.Figure(panels=default_panel)
         assert isinstance(obj.fig, mpl.figure.Figure)
 
+    def test_fig_function_source(self, default_series):
+        """Test that function sources are sampled at the figure resolution."""
+        source = pplot.FunctionSource(np.sin, 5, 8)
+        series = pplot.Series(data_source=source, label="sin", secondary_axis=True)
+        panel = pplot.Panel(series=[default_series, series])
+        assert series.indep_var.size == 100
+        obj = pplot.Figure(panels=panel, fig_width=8, fig_height=6, dpi=DPI)
+        assert isinstance(obj.fig, mpl.figure.Figure)
+        assert 100 < series.indep_var.size <= (8 * DPI) + 1
+        assert (series.indep_var[[0, -1]] == np.array([5, 8])).all()
+        assert (series.dep_var == np.sin(series.indep_var)).all()
+        assert (default_series.indep_var == np.array([5, 6, 7, 8])).all()
+        # Display samples are not left on the data source
+        assert source.indep_var.size == 100
+
+    def test_fig_function_source_range(self):
+        """Test that dependent axes are scaled with the display samples."""
+        # Spike that the default uniform sampling misses
+        func = lambda x: x + 5 * np.maximum(0, 1 - abs(x - 6.5) / 0.01)
+        source = pplot.FunctionSource(func, 5, 8)
+        assert source.dep_var.max() == 8
+        series = pplot.Series(data_source=source, label="spike")
+        panel = pplot.Panel(series=series)
+        obj = pplot.Figure(panels=panel, fig_width=8, fig_height=6, dpi=DPI)
+        assert isinstance(obj.fig, mpl.figure.Figure)
+        assert series.dep_var.max() > 9
+        assert panel.primary_axis_ticks[-1] >= series.scaled_dep_var.max()
+
     @pytest.mark.figure
     def test_fig_exceptions(self, default_panel, negative_panel):
         """Test figure fig property exceptions."""
@@ -0,0 +1,206 @@
+# fproc_cache.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,F0401
+# pylint: disable=R0201,R0205,R0904,W0212,W0232,W0613
+
+# Standard library imports
+import os
+
+# PyPI imports
+import numpy as np
+import pmisc
+from pmisc import AI
+import pytest
+
+# Intra-package imports
+import pplot
+from tests.csv_source import write_csv_file
+
+
+###
+# Global variables
+###
+CALLS = []
+OFFSET = {"value": 0}
+
+
+###
+# Helper functions
+###
+def fproc(indep_var, dep_var, scale=1):
+    CALLS.append(indep_var.size)
+    return indep_var, scale * dep_var
+
+
+def fproc_global(indep_var, dep_var):
+    CALLS.append(indep_var.size)
+    return indep_var, dep_var + OFFSET["value"]
+
+
+def fproc_obj(indep_var, dep_var, obj):
+    return obj(indep_var, dep_var)
+
+
+###
+# Helper classes
+###
+class Scale(object):
+    def __init__(self, factor):
+        self.factor = factor
+
+    def __call__(self, indep_var, dep_var):
+        CALLS.append(indep_var.size)
+        return indep_var, self.factor * dep_var
+
+
+###
+# Test classes
+###
+class TestFprocCache(object):
+    """Test for processing function results cache."""
+
+    def setup_method(self, method):
+        """Start each test with an empty cache of the default size."""
+        self.max_size = pplot.fproc_cache_info().max_size
+        pplot.clear_fproc_cache()
+        CALLS[:] = []
+
+    def teardown_method(self, method):
+        """Restore default cache size."""
+        pplot.set_fproc_cache_size(self.max_size)
+        pplot.clear_fproc_cache()
+
+    def test_cache_info(self):
+        """Test fproc_cache_info function behavior."""
+        obj = pplot.fproc_cache_info()
+        assert (obj.hits, obj.misses, obj.entries, obj.size) == (0, 0, 0, 0)
+        assert obj.max_size > 0
+
+    def test_shared_results(self):
+        """Test that sources that process the same data share the results."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            kwargs = dict(fproc=fproc, memoize=True)
+            obj1 = pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            obj2 = pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            assert CALLS == [3]
+            info = pplot.fproc_cache_info()
+            assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+            assert info.size > 0
+            assert obj1.dep_var.tolist() == obj2.dep_var.tolist() == [2, 4, 1]
+            # Different data, extra arguments or function are processed again
+            obj3 = pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 1}, **kwargs)
+            assert obj3.dep_var.tolist() == [5, 3]
+            obj3.fproc_eargs = {"scale": 2}
+            assert obj3.dep_var.tolist() == [10, 6]
+            obj3.fproc = lambda indep_var, dep_var, scale: (indep_var, dep_var + scale)
+            assert obj3.dep_var.tolist() == [7, 5]
+            assert CALLS == [3, 2, 2]
+            assert pplot.fproc_cache_info().entries == 4
+            # Memoization is opt-in
+            pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, fproc=fproc)
+            assert CALLS == [3, 2, 2, 3]
+            obj1.memoize = False
+            assert not obj1.memoize
+
+    def test_disk_cache(self, tmpdir):
+        """Test on-disk results cache."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            kwargs = dict(fproc=fproc, memoize=True, cache_dir=str(tmpdir))
+            obj1 = pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            entries = os.listdir(str(tmpdir))
+            assert len([item for item in entries if item.startswith("fproc_")]) == 1
+            # Remove processed data entries of the source so that the data is
+            # processed again
+            for item in entries:
+                if not item.startswith("fproc_"):
+                    os.remove(os.path.join(str(tmpdir), item))
+            pplot.clear_fproc_cache()
+            obj2 = pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            assert CALLS == [3]
+            assert (obj1.dep_var == obj2.dep_var).all()
+            info = pplot.fproc_cache_info()
+            assert (info.hits, info.misses, info.entries) == (1, 0, 1)
+
+    def test_eviction(self):
+        """Test least recently used eviction behavior."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            kwargs = dict(fproc=fproc, memoize=True)
+            pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            size = pplot.fproc_cache_info().size
+            pplot.set_fproc_cache_size(size)
+            pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 1}, **kwargs)
+            info = pplot.fproc_cache_info()
+            assert (info.entries, info.max_size) == (1, size)
+            assert 0 < info.size < size
+            pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 1}, **kwargs)
+            pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            assert CALLS == [3, 2, 3]
+            pplot.set_fproc_cache_size(0)
+            info = pplot.fproc_cache_info()
+            assert (info.entries, info.size) == (0, 0)
+            pplot.CsvSource(fname, "Col2", "Col3", {"Col1": 0}, **kwargs)
+            assert pplot.fproc_cache_info().entries == 0
+
+    def test_read_only(self):
+        """Test that cached results cannot be modified."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            pplot.CsvSource(fname, "Col7", "Col3", fproc=fproc, memoize=True)
+            indep_var, dep_var = pplot.fproc_cache._CACHE.values()[0]
+            with pytest.raises(ValueError):
+                dep_var[0] = 10
+            assert isinstance(indep_var, np.ndarray)
+
+    def test_unreliable_keys(self):
+        """Test that functions that cannot be identified are not memoized."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            args = (fname, "Col2", "Col3", {"Col1": 0})
+            func = Scale(2)
+
+            def closure(indep_var, dep_var):
+                return func(indep_var, dep_var)
+
+            obj1 = pplot.CsvSource(*args, fproc=closure, memoize=True)
+            func.factor = 3
+            obj2 = pplot.CsvSource(*args, fproc=closure, memoize=True)
+            assert obj1.dep_var.tolist() == [4, 8, 2]
+            assert obj2.dep_var.tolist() == [6, 12, 3]
+            # Extra arguments identified by their memory address
+            kwargs = dict(fproc=fproc_obj, fproc_eargs={"obj": func}, memoize=True)
+            obj3 = pplot.CsvSource(*args, **kwargs)
+            func.factor = 1
+            obj3.fproc_eargs = {"obj": func}
+            assert obj3.dep_var.tolist() == [2, 4, 1]
+            assert CALLS == [3, 3, 3, 3]
+            info = pplot.fproc_cache_info()
+            assert (info.hits, info.misses, info.entries) == (0, 0, 0)
+
+    def test_global_variables(self):
+        """Test that global variables read by the function are not in the key."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            args = (fname, "Col2", "Col3", {"Col1": 0})
+            obj1 = pplot.CsvSource(*args, fproc=fproc_global, memoize=True)
+            OFFSET["value"] = 1
+            try:
+                obj2 = pplot.CsvSource(*args, fproc=fproc_global, memoize=True)
+                obj3 = pplot.CsvSource(*args, fproc=fproc_global)
+            finally:
+                OFFSET["value"] = 0
+            assert obj1.dep_var.tolist() == obj2.dep_var.tolist() == [2, 4, 1]
+            assert obj3.dep_var.tolist() == [3, 5, 2]
+            assert CALLS == [3, 3]
+
+    @pytest.mark.csv_source
+    def test_set_fproc_cache_size_exceptions(self):
+        """Test set_fproc_cache_size function exceptions."""
+        for item in [-1, 1.5, "a"]:
+            AI(pplot.set_fproc_cache_size, "max_size", max_size=item)
+
+    @pytest.mark.csv_source
+    def test_memoize_exceptions(self):
+        """Test memoize property exceptions."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            AI(pplot.CsvSource, "memoize", fname, "Col7", "Col3", memoize=1)
+            obj = pplot.CsvSource(fname, "Col7", "Col3")
+            with pytest.raises(RuntimeError):
+                obj.memoize = "a"
@@ -0,0 +1,183 @@
+# function_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# PyPI imports
+import numpy as np
+from pmisc import AE, AI, APROP, AROPROP, GET_EXMSG
+import pytest
+
+# Intra-package imports
+from pplot import FunctionSource as FUT
+
+
+###
+# Helper functions
+###
+def counted(func, calls):
+    """Wrap function so that the size of its first argument is recorded."""
+
+    def wrapper(*args):
+        calls.append(args[0].size)
+        return func(*args)
+
+    return wrapper
+
+
+###
+# Test classes
+###
+class TestFunctionSource(object):
+    """Test for FunctionSource."""
+
+    def test_str(self):
+        """Test that str behaves correctly."""
+
+        def square(indep_var):
+            return indep_var ** 2
+
+        obj = str(FUT(square, 0, 10, num_points=11))
+        ref = (
+            "Function: square\n"
+            "Independent variable minimum: 0\n"
+            "Independent variable maximum: 10\n"
+            "Number of points: 11\n"
+            "Independent variable: [ 0.0, 1.0, 2.0, ..., 8.0, 9.0, 10.0 ]\n"
+            "Dependent variable: [ 0.0, 1.0, 4.0, ..., 64.0, 81.0, 100.0 ]"
+        )
+        assert obj == ref
+        obj = str(FUT(np.sqrt, 1, 4, num_points=4))
+        assert obj.split("\n")[0] == "Function: sqrt"
+        assert obj.split("\n")[-1] == (
+            "Dependent variable: [ 1.0, 1.414213562373, 1.732050807569, 2.0 ]"
+        )
+
+    def test_lazy(self):
+        """Test that the function is evaluated only when needed."""
+        calls = []
+        obj = FUT(counted(np.sin, calls), 0, 10)
+        assert not calls
+        assert (obj.indep_var == np.linspace(0, 10, 100)).all()
+        assert (obj.dep_var == np.sin(obj.indep_var)).all()
+        assert obj.dep_var.dtype == np.float64
+        obj.indep_var
+        assert calls == [100]
+        obj.num_points = 5
+        obj.indep_max = 4
+        assert calls == [100]
+        assert (obj.indep_var == np.array([0.0, 1.0, 2.0, 3.0, 4.0])).all()
+        assert calls == [100, 5]
+        obj = FUT(lambda x: 2 * x.astype(int), 1, 1)
+        assert (obj.indep_var == np.array([1.0])).all()
+        assert (obj.dep_var == np.array([2.0])).all()
+
+    def test_sample(self):
+        """Test adaptive sampling."""
+        calls = []
+        obj = FUT(counted(lambda x: 3 * x + 1, calls), -10, 10)
+        obj.indep_var
+        # Straight lines are bisected only once
+        assert obj._sample(None, None, 800)
+        assert calls == [100, 101, 100]
+        assert obj.indep_var.size == 201
+        assert (obj.indep_var[[0, -1]] == np.array([-10, 10])).all()
+        assert (obj.dep_var == 3 * obj.indep_var + 1).all()
+        # Same display range and resolution is not sampled again, the
+        # initial uniform grid is not used anymore
+        assert not obj._sample(None, None, 800)
+        assert not obj._sample()
+        assert len(calls) == 3
+        assert obj.indep_var.size == 201
+        # Samples are densest where curvature is highest
+        calls = []
+        obj = FUT(counted(np.abs, calls), -1.03125, 1)
+        assert obj._sample(-5, 5, 400)
+        assert sum(calls) <= 401
+        spacing = np.diff(obj.indep_var)
+        assert (spacing > 0).all()
+        assert (obj.dep_var == np.abs(obj.indep_var)).all()
+        kink = np.argmin(obj.dep_var)
+        assert spacing[kink - 1 : kink + 1].max() < spacing[0] / 3
+        assert obj.indep_var.size < 110
+        calls = []
+        obj = FUT(counted(np.sin, calls), 0, 100)
+        assert obj._sample(0, 100, 1000)
+        assert 126 <= obj.indep_var.size <= 1001
+        assert sum(calls) <= 1001
+        spacing = np.diff(obj.indep_var)
+        assert spacing.min() >= 0.75 * (100 / 1000.0)
+        # Display range is intersected with the function range
+        obj = FUT(np.cos, 0, 10)
+        assert obj._sample(2, 50, 80)
+        assert (obj.indep_var[[0, -1]] == np.array([2, 10])).all()
+        assert obj._sample(20, 50, 80)
+        assert (obj.indep_var[[0, -1]] == np.array([0, 10])).all()
+        # Logarithmic axis, a logarithm is a straight line
+        obj = FUT(np.log10, 1, 1000)
+        assert obj._sample(None, None, 400, True)
+        assert obj.indep_var.size == 101
+        assert (obj.indep_var[[0, -1]] == np.array([1, 1000])).all()
+        assert np.allclose(np.diff(np.log10(obj.indep_var)), 3 / 100.0)
+        # Logarithmic axis with non-positive range is sampled linearly
+        obj = FUT(np.negative, 0, 1000)
+        assert obj._sample(None, None, 400, True)
+        assert np.allclose(np.diff(obj.indep_var), 1000 / 100.0)
+
+    @pytest.mark.function_source
+    def test_func_exceptions(self):
+        """Test function exceptions."""
+        AI(FUT, "func", 5, 0, 1)
+        AI(FUT, "func", None, 0, 1)
+        obj = FUT(np.sin, 0, 1)
+        APROP(obj, "func", "a", RuntimeError, "Argument `func` is not valid")
+
+        def ret_list(indep_var):
+            return indep_var.tolist()
+
+        exmsg = "Argument `func` (function ret_list) return value is not valid"
+        obj = FUT(ret_list, 0, 1)
+        with pytest.raises(TypeError) as excinfo:
+            obj.indep_var
+        assert GET_EXMSG(excinfo) == exmsg
+        for func in [
+            lambda x: x[:-1],
+            lambda x: np.array(["a"] * x.size),
+            lambda x: np.zeros((x.size, 2)),
+        ]:
+            obj = FUT(func, 0, 1)
+            exmsg = "Argument `func` (function <lambda>) return value is not valid"
+            with pytest.raises(TypeError) as excinfo:
+                obj.dep_var
+            assert GET_EXMSG(excinfo) == exmsg
+
+        def raise_ex(indep_var):
+            raise ValueError("Bad value")
+
+        exmsg = "Argument `func` (function raise_ex) raised an exception: Bad value"
+        obj = FUT(raise_ex, 0, 1)
+        with pytest.raises(RuntimeError) as excinfo:
+            obj.indep_var
+        assert GET_EXMSG(excinfo) == exmsg
+
+    @pytest.mark.function_source
+    def test_indep_var_exceptions(self):
+        """Test independent variable exceptions."""
+        AI(FUT, "indep_min", np.sin, "a", 1)
+        AI(FUT, "indep_min", np.sin, None, 1)
+        AI(FUT, "indep_max", np.sin, 0, None)
+        AI(FUT, "num_points", np.sin, 0, 1, num_points=1)
+        AI(FUT, "num_points", np.sin, 0, 1, num_points=2.5)
+        msg = "Argument `indep_min` is greater than argument `indep_max`"
+        AE(FUT, ValueError, msg, np.sin, 3, 2)
+        obj = FUT(np.sin, 0, 5)
+        APROP(obj, "indep_max", -1, ValueError, msg)
+        APROP(obj, "indep_min", 6, ValueError, msg)
+
+    @pytest.mark.function_source
+    @pytest.mark.parametrize(
+        "prop", ["dep_var", "func", "indep_max", "indep_min", "indep_var", "num_points"]
+    )
+    def test_cannot_delete_attributes_exceptions(self, prop):
+        """Test that del method raises an exception on all class attributes."""
+        AROPROP(FUT(np.sin, 0, 1), prop)
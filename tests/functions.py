@@ -9,6 +9,9 @@ import platform
 import uuid
 
 # PyPI imports
+import numpy as np
+import pexdoc.pcontracts
+import peng
 from pmisc import ignored, AE, AI, GET_EXMSG
 import pytest
 
@@ -197,3 +200,91 @@ class TestParameterizedColorSpace(object):
             color_space(0.75),
             color_space(1.0),
         ]
+
+
+class TestTrustedMode(object):
+    """Test for trusted input mode."""
+
+    def teardown_method(self, method):
+        """Turn trusted input mode off."""
+        pplot.set_trusted_mode(False)
+
+    def test_trusted_mode(self):
+        """Test set_trusted_mode and trusted_mode functions behavior."""
+        indep_var, dep_var = np.array([1, 1, 2]), np.array([3, 4, 5])
+        assert not pplot.trusted_mode()
+        AI(pplot.BasicSource, "indep_var", indep_var, dep_var)
+        pplot.set_trusted_mode(True)
+        assert pplot.trusted_mode()
+        # Contracts are not checked
+        obj = pplot.BasicSource(indep_var, dep_var)
+        assert obj.indep_var.tolist() == [1, 1, 2]
+        # Other exceptions are raised with the same type and message
+        exmsg = "Argument `indep_min` is greater than argument `indep_max`"
+        data = np.array([1, 2, 3, 4])
+        AE(pplot.BasicSource, ValueError, exmsg, data, data, 3, 2)
+        exmsg = "Argument `fproc` (function fproc) return value is not valid"
+        with PseudoTmpFile() as fname:
+            with open(fname, "w") as fobj:
+                fobj.write("Col1,Col2\n1,2\n")
+            fproc = lambda indep_var, dep_var: True
+            fproc.__name__ = "fproc"
+            AE(pplot.CsvSource, TypeError, exmsg, fname, "Col1", "Col2", fproc=fproc)
+        pplot.set_trusted_mode(False)
+        assert not pplot.trusted_mode()
+        AI(pplot.BasicSource, "indep_var", indep_var, dep_var)
+
+    def test_disabled_contracts(self):
+        """Test that contracts disabled elsewhere stay disabled."""
+        pexdoc.pcontracts.disable_all()
+        try:
+            pplot.set_trusted_mode(True)
+            pplot.set_trusted_mode(False)
+            assert pexdoc.pcontracts.all_disabled()
+        finally:
+            pexdoc.pcontracts.enable_all()
+
+    @pytest.mark.functions
+    def test_set_trusted_mode_exceptions(self):
+        """Test set_trusted_mode function exceptions."""
+        AI(pplot.set_trusted_mode, "flag", flag=1)
+
+
+class TestRoundMantissa(object):
+    """Test for vectorized mantissa rounding kernel."""
+
+    @pytest.mark.parametrize("decimals", [1, 3, 5, 10, 14])
+    def test_round_mantissa(self, decimals):
+        """Test _round_mantissa function results match peng.round_mantissa."""
+        rng = np.random.RandomState(0)
+        data = np.concatenate(
+            [
+                rng.normal(size=1000) * 10.0 ** rng.randint(-300, 300, 1000),
+                rng.normal(size=1000) * 10.0 ** rng.randint(-30, 30, 1000),
+                np.round(rng.uniform(size=1000) * 1000, 4),
+                np.arange(-500, 500) * 0.001,
+                [0.0, -0.0, np.inf, -np.inf, 1e-310, 0.125, 2.5, 99.95],
+            ]
+        )
+        ref = peng.round_mantissa(data, decimals)
+        assert (pplot.functions._round_mantissa(data, decimals) == ref).all()
+        data = rng.randint(-(10 ** 6), 10 ** 6, 100)
+        ref = peng.round_mantissa(data, decimals)
+        assert (pplot.functions._round_mantissa(data, decimals) == ref).all()
+        data = rng.uniform(size=100).astype(np.float32)
+        ref = peng.round_mantissa(data, decimals)
+        assert (pplot.functions._round_mantissa(data, decimals) == ref).all()
+        for item in [None, 5, 1.23456789012345, np.float64(-0.987654321)]:
+            act = pplot.functions._round_mantissa(item, decimals)
+            ref = peng.round_mantissa(item, decimals)
+            assert (act == ref) and (type(act) == type(ref))
+
+    def test_round_mantissa_out(self):
+        """Test _round_mantissa function in-place rounding."""
+        data = np.array([1.23456, 2.34567, 0.0])
+        ret = pplot.functions._round_mantissa(data, 3, out=data)
+        assert ret is data
+        assert data.tolist() == [1.235, 2.346, 0.0]
+        out = np.empty(2)
+        pplot.functions._round_mantissa(np.array([1, 2]), 3, out=out)
+        assert out.tolist() == [1.0, 2.0]
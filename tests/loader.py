@@ -0,0 +1,114 @@
+# loader.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# Standard library imports
+import os
+
+# PyPI imports
+import pmisc
+from pmisc import AE, AI
+import pytest
+
+# Intra-package imports
+import pplot
+from tests.csv_source import write_csv_file
+
+
+###
+# Global variables
+###
+FUT = pplot.load_sources
+
+
+###
+# Helper functions
+###
+def fproc(indep_var, dep_var, offset):
+    return indep_var, dep_var + offset
+
+
+def fproc_pid(indep_var, dep_var):
+    return indep_var, 0 * dep_var + os.getpid()
+
+
+###
+# Test classes
+###
+class TestLoadSources(object):
+    """Test for load_sources function."""
+
+    @pytest.mark.parametrize("executor", ["thread", "PROCESS"])
+    def test_load_sources(self, executor):
+        """Test that sources are the same as when created serially."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            specs = [
+                dict(
+                    fname=fname,
+                    indep_col_label="Col7",
+                    dep_col_label=dep_col_label,
+                    rfilter=rfilter,
+                    fproc=fproc,
+                    fproc_eargs={"offset": offset},
+                )
+                for offset, dep_col_label in enumerate(["Col2", "Col3", "Col8"])
+                for rfilter in [None, {"Col1": 1}]
+            ]
+            assert FUT([], executor=executor) == []
+            for workers in [None, 1, 4]:
+                objs = FUT(specs, workers=workers, executor=executor)
+                assert len(objs) == len(specs)
+                for spec, obj in zip(specs, objs):
+                    ref = pplot.CsvSource(**spec)
+                    assert isinstance(obj, pplot.CsvSource)
+                    assert (obj.indep_var == ref.indep_var).all()
+                    assert (obj.dep_var == ref.dep_var).all()
+            # Sources are fully functional
+            obj = objs[1]
+            obj.rfilter = {"Col1": 0}
+            assert obj.indep_var.tolist() == [1, 2, 3]
+            assert obj.dep_var.tolist() == [1, 2, 3]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_load_sources_fproc(self, executor):
+        """Test that processing functions run where the executor selects."""
+        with pmisc.TmpFile(write_csv_file) as fname:
+            spec = dict(
+                fname=fname,
+                indep_col_label="Col7",
+                dep_col_label="Col2",
+                fproc=fproc_pid,
+            )
+            objs = FUT([spec, spec], workers=2, executor=executor)
+            pids = set(objs[0].dep_var.tolist() + objs[1].dep_var.tolist())
+            assert (os.getpid() in pids) == (executor == "thread")
+
+    @pytest.mark.loader
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_load_sources_exceptions(self, executor):
+        """Test load_sources function exceptions."""
+        AI(FUT, "specs", 5)
+        AI(FUT, "specs", [5])
+        AI(FUT, "workers", [], workers=0)
+        AI(FUT, "executor", [], executor=5)
+        msg = (
+            "Argument `executor` is not one of ['PROCESS', 'THREAD'] "
+            "(case insensitive)"
+        )
+        AE(FUT, ValueError, msg, [], executor="x")
+        with pmisc.TmpFile(write_csv_file) as fname:
+            specs = [
+                dict(fname=fname, indep_col_label="Col7", dep_col_label="Col2"),
+                dict(fname=fname, indep_col_label="Col7", dep_col_label="Col9"),
+                dict(fname=fname, indep_col_label="Col7", dep_col_label="Col2"),
+                dict(fname=fname, indep_col_label="Col9", dep_col_label="Col2"),
+            ]
+            msg = (
+                "Column Col9 (dependent column label) could not be found "
+                "in comma-separated file {0} header".format(fname)
+            )
+            AE(FUT, ValueError, msg, specs, workers=2, executor=executor)
+        msg = "File _not_a_file_ could not be found"
+        specs = [dict(fname="_not_a_file_", indep_col_label="a", dep_col_label="b")]
+        AE(FUT, OSError, msg, specs, executor=executor)
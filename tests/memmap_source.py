@@ -0,0 +1,250 @@
+# memmap_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# PyPI imports
+import numpy as np
+from pmisc import AE, AI, APROP, AROPROP, TmpFile
+import pytest
+
+# Intra-package imports
+from pplot import MemmapSource as FUT
+
+
+###
+# Global variables
+###
+RDTYPE = [("time", "<f8"), ("volt", "<f4"), ("code", "<i2")]
+
+
+###
+# Helper functions
+###
+def write_records(fname, offset=0, dtype=None, nrec=10):
+    """Write binary records file, optionally preceded by a header."""
+    data = np.zeros(nrec, dtype=RDTYPE if dtype is None else dtype)
+    data[data.dtype.names[0]] = np.arange(nrec)
+    data[data.dtype.names[1]] = 10 * np.arange(nrec)
+    with open(fname, "wb") as fobj:
+        fobj.write(b"\x00" * offset)
+        data.tofile(fobj)
+
+
+###
+# Test classes
+###
+class TestMemmapSource(object):
+    """Test for MemmapSource."""
+
+    def test_str(self):
+        """Test that str behaves correctly."""
+        with TmpFile() as fname:
+            write_records(fname)
+            obj = str(FUT(fname, "time", "volt", dtype=RDTYPE, indep_max=2.0))
+            ref = (
+                "File name: {0}\n"
+                "Independent field: time\n"
+                "Dependent field: volt\n"
+                "Independent variable minimum: -inf\n"
+                "Independent variable maximum: 2.0\n"
+                "Independent variable: [ 0.0, 1.0, 2.0 ]\n"
+                "Dependent variable: [ 0.0, 10.0, 20.0 ]".format(fname)
+            )
+            assert obj == ref
+            obj = FUT(fname, 0, 1, dtype=RDTYPE)
+            lines = str(obj).split("\n")
+            assert lines[1] == "Independent field: 0"
+            assert lines[-2] == (
+                "Independent variable: [ 0.0, 1.0, 2.0, ..., 7.0, 8.0, 9.0 ]"
+            )
+
+    def test_npy(self):
+        """Test Numpy files."""
+        with TmpFile() as fname:
+            data = np.zeros(5, dtype=RDTYPE)
+            data["time"] = [1, 2, 3, 4, 5]
+            data["code"] = [5, 4, 3, 2, 1]
+            with open(fname, "wb") as fobj:
+                np.save(fobj, data)
+            obj = FUT(fname, "time", "code", indep_min=2, indep_max=4)
+            assert (obj.indep_var == np.array([2.0, 3.0, 4.0])).all()
+            assert (obj.dep_var == np.array([4.0, 3.0, 2.0])).all()
+            assert obj.dep_var.dtype == np.float64
+        with TmpFile() as fname:
+            data = np.array([[1.0, 10.0, 5.0], [2.0, 20.0, 6.0], [3.0, 30.0, 7.0]])
+            with open(fname, "wb") as fobj:
+                np.save(fobj, data)
+            obj = FUT(fname, 0, 2, indep_min=1.5)
+            assert (obj.indep_var == np.array([2.0, 3.0])).all()
+            assert (obj.dep_var == np.array([6.0, 7.0])).all()
+            obj = FUT(fname, "t", "v", fields=["t", "v", "w"])
+            assert (obj.dep_var == np.array([10.0, 20.0, 30.0])).all()
+
+    def test_raw(self):
+        """Test raw binary record files."""
+        with TmpFile() as fname:
+            write_records(fname, offset=16)
+            obj = FUT(
+                fname, "time", "volt", dtype=RDTYPE, offset=16, indep_min=3, indep_max=5
+            )
+            assert (obj.indep_var == np.array([3.0, 4.0, 5.0])).all()
+            assert (obj.dep_var == np.array([30.0, 40.0, 50.0])).all()
+        with TmpFile() as fname:
+            write_records(fname, dtype=[("a", "<f8"), ("b", "<f8")])
+            obj = FUT(fname, "x", "y", dtype="<f8", fields=["x", "y"], indep_min=8)
+            assert (obj.indep_var == np.array([8.0, 9.0])).all()
+            assert (obj.dep_var == np.array([80.0, 90.0])).all()
+
+    def test_zero_copy(self):
+        """Test that float data is not copied."""
+        with TmpFile() as fname:
+            write_records(fname)
+            obj = FUT(fname, "time", "volt", dtype=RDTYPE, indep_min=2, indep_max=6)
+            assert np.shares_memory(obj.indep_var, obj._data)
+            assert not obj.indep_var.flags.writeable
+            # Non-float data is converted, only the bounded window is copied
+            assert not np.shares_memory(obj.dep_var, obj._data)
+            assert obj.dep_var.size == 5
+            # Re-bounding re-slices the file data
+            obj.indep_max = None
+            assert np.shares_memory(obj.indep_var, obj._data)
+            assert (obj.indep_var == np.arange(2, 10)).all()
+
+    @pytest.mark.parametrize("indep_min", [1, 2.0])
+    def test_indep_min(self, indep_min):
+        """Test indep_min property behavior."""
+        with TmpFile() as fname:
+            write_records(fname)
+            obj = FUT(fname, "time", "volt", dtype=RDTYPE, indep_min=indep_min)
+            assert obj.indep_min == indep_min
+            assert obj.indep_var[0] == indep_min
+            obj = FUT(fname, "time", "volt", dtype=RDTYPE)
+            obj.indep_min = indep_min
+            assert obj.indep_min == indep_min
+            assert obj.indep_var[0] == indep_min
+
+    @pytest.mark.parametrize("indep_max", [1, 2.0])
+    def test_indep_max(self, indep_max):
+        """Test indep_max property behavior."""
+        with TmpFile() as fname:
+            write_records(fname)
+            obj = FUT(fname, "time", "volt", dtype=RDTYPE, indep_max=indep_max)
+            assert obj.indep_max == indep_max
+            assert obj.indep_var[-1] == indep_max
+            obj = FUT(fname, "time", "volt", dtype=RDTYPE)
+            obj.indep_max = indep_max
+            assert obj.indep_max == indep_max
+            assert obj.indep_var[-1] == indep_max
+
+    def test_properties(self):
+        """Test read-only properties."""
+        with TmpFile() as fname:
+            write_records(fname)
+            obj = FUT(fname, "time", 1, dtype=RDTYPE)
+            assert obj.fname == fname
+            assert obj.indep_field == "time"
+            assert obj.dep_field == 1
+
+    @pytest.mark.memmap_source
+    def test_file_exceptions(self):
+        """Test file specification exceptions."""
+        AE(FUT, OSError, "File _not_a_file_ could not be found", "_not_a_file_", 0, 1)
+        with TmpFile() as fname:
+            write_records(fname)
+            AI(FUT, "fname", 5, "time", "volt")
+            AI(FUT, "indep_field", fname, None, "volt", dtype=RDTYPE)
+            AI(FUT, "dep_field", fname, "time", 1.5, dtype=RDTYPE)
+            AI(FUT, "fields", fname, "time", "volt", dtype="<f8", fields=[1, 2])
+            AI(FUT, "offset", fname, "time", "volt", dtype=RDTYPE, offset=-1)
+            AI(FUT, "dtype", fname, "time", "volt", dtype="not_a_dtype")
+            AI(FUT, "dtype", fname, "time", "volt", dtype="<f8")
+            AI(FUT, "fields", fname, "time", "volt", dtype=RDTYPE, fields=["a", "b"])
+            msg = "File {0} size is not a multiple of the record size".format(fname)
+            AE(FUT, ValueError, msg, fname, "time", "volt", dtype=RDTYPE, offset=1)
+            msg = "File {0} is empty".format(fname)
+            AE(FUT, ValueError, msg, fname, "time", "volt", dtype=RDTYPE, offset=140)
+            msg = "Field {0} not found in file {1}"
+            exmsg = msg.format("a", fname)
+            AE(FUT, ValueError, exmsg, fname, "a", "volt", dtype=RDTYPE)
+            AE(FUT, ValueError, msg.format(3, fname), fname, "time", 3, dtype=RDTYPE)
+            AE(FUT, ValueError, msg.format(-1, fname), fname, -1, 1, dtype=RDTYPE)
+        with TmpFile() as fname:
+            with open(fname, "wb") as fobj:
+                np.save(fobj, np.array([1.0, 2.0, 3.0]))
+            msg = (
+                "File {0} does not hold a structured or "
+                "two-dimensional array".format(fname)
+            )
+            AE(FUT, ValueError, msg, fname, 0, 1)
+        msg = "File {0} is not a valid Numpy array file"
+        with TmpFile() as fname:
+            with open(fname, "w") as fobj:
+                fobj.write("Time,Value\n1,2\n")
+            AE(FUT, ValueError, msg.format(fname), fname, 0, 1)
+        with TmpFile() as fname:
+            AE(FUT, ValueError, msg.format(fname), fname, 0, 1)
+        with TmpFile() as fname:
+            with open(fname, "wb") as fobj:
+                np.savez(fobj, data=np.array([[1.0, 2.0], [3.0, 4.0]]))
+            AE(FUT, ValueError, msg.format(fname), fname, 0, 1)
+        with TmpFile() as fname:
+            with open(fname, "wb") as fobj:
+                np.save(fobj, np.array([[1.0, 2.0], [3.0, 4.0]]))
+            AI(FUT, "fields", fname, "a", "b", fields=["a", "b", "c"])
+            AI(FUT, "fields", fname, "a", "b", fields=["a", "a"])
+        with TmpFile() as fname:
+            data = np.zeros(2, dtype=[("a", "<f8"), ("b", "S3")])
+            data["a"] = [1, 2]
+            with open(fname, "wb") as fobj:
+                np.save(fobj, data)
+            msg = "Field b in file {0} is not real-valued".format(fname)
+            AE(FUT, TypeError, msg, fname, "a", "b")
+
+    @pytest.mark.memmap_source
+    def test_indep_var_exceptions(self):
+        """Test independent variable exceptions."""
+        with TmpFile() as fname:
+            write_records(fname)
+            AI(FUT, "indep_min", fname, "time", "volt", dtype=RDTYPE, indep_min="a")
+            AI(FUT, "indep_max", fname, "time", "volt", dtype=RDTYPE, indep_max=True)
+            msg = "Argument `indep_min` is greater than argument `indep_max`"
+            AE(
+                FUT,
+                ValueError,
+                msg,
+                fname,
+                "time",
+                "volt",
+                dtype=RDTYPE,
+                indep_min=5,
+                indep_max=4,
+            )
+            obj = FUT(fname, "time", "volt", dtype=RDTYPE, indep_min=5)
+            APROP(obj, "indep_max", 4, ValueError, msg)
+            msg = (
+                "Argument `indep_var` is empty after "
+                "`indep_min`/`indep_max` range bounding"
+            )
+            APROP(obj, "indep_min", 45, ValueError, msg)
+            AE(FUT, ValueError, msg, fname, "time", "volt", dtype=RDTYPE, indep_max=-1)
+        # Only the range-bounded data has to be increasing
+        with TmpFile() as fname:
+            with open(fname, "wb") as fobj:
+                np.save(fobj, np.array([[1, 0], [2, 1], [3, 2], [5, 3], [4, 4]]))
+            msg = "Independent variable is not strictly increasing"
+            AE(FUT, ValueError, msg, fname, 0, 1)
+            obj = FUT(fname, 0, 1, indep_max=3)
+            assert (obj.dep_var == np.array([0.0, 1.0, 2.0])).all()
+            APROP(obj, "indep_max", 10, ValueError, msg)
+
+    @pytest.mark.memmap_source
+    @pytest.mark.parametrize(
+        "prop",
+        ["fname", "indep_field", "dep_field", "indep_min", "indep_max", "indep_var"],
+    )
+    def test_cannot_delete_attributes_exceptions(self, prop):
+        """Test that del method raises an exception on all class attributes."""
+        with TmpFile() as fname:
+            write_records(fname)
+            AROPROP(FUT(fname, "time", "volt", dtype=RDTYPE), prop)
@@ -0,0 +1,179 @@
+# pipeline.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# PyPI imports
+import numpy as np
+import pmisc
+from pmisc import AE, AI
+import pytest
+
+# Intra-package imports
+import pplot
+from pplot.pipeline import Decimate, Differentiate, Offset, Scale, Smooth, Stage
+
+
+###
+# Helper classes
+###
+class Counter(Stage):
+    """Stage that counts the number of times it processes data."""
+
+    def __init__(self, calls):  # noqa
+        super(Counter, self).__init__()
+        self.calls = calls
+
+    def _process(self, indep_var, dep_var, inplace):
+        self.calls.append(indep_var.size)
+        return indep_var, dep_var
+
+
+###
+# Test classes
+###
+class TestPipeline(object):
+    """Test for Pipeline class and built-in stages."""
+
+    def test_stages(self):
+        """Test built-in stages behavior."""
+        indep_var = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        dep_var = np.array([1.0, 4.0, 9.0, 16.0, 25.0])
+        ret = Offset(dep=1, indep=-1)(indep_var, dep_var)
+        assert ret[0].tolist() == [0, 1, 2, 3, 4]
+        assert ret[1].tolist() == [2, 5, 10, 17, 26]
+        ret = Scale(dep=2, indep=0.5)(indep_var, dep_var)
+        assert ret[0].tolist() == [0.5, 1, 1.5, 2, 2.5]
+        assert ret[1].tolist() == [2, 8, 18, 32, 50]
+        ret = Smooth(3)(indep_var, dep_var)
+        assert ret[0] is indep_var
+        assert ret[1].tolist() == [2.5, 14 / 3.0, 29 / 3.0, 50 / 3.0, 20.5]
+        assert Smooth(9)(indep_var, dep_var)[1].tolist() == [
+            14 / 3.0,
+            7.5,
+            11,
+            13.5,
+            50 / 3.0,
+        ]
+        ret = Differentiate()(indep_var, dep_var)
+        assert ret[1].tolist() == [3, 4, 6, 8, 9]
+        ret = Decimate(2)(indep_var, dep_var)
+        assert ret[0].tolist() == [1, 5]
+        # Input data is not modified
+        assert indep_var.tolist() == [1, 2, 3, 4, 5]
+        assert dep_var.tolist() == [1, 4, 9, 16, 25]
+        assert repr(Scale(dep=2)) == "Scale(dep=2, indep=1)"
+
+    @pytest.mark.parametrize("cache_size", [0, 16])
+    def test_pipeline(self, cache_size):
+        """Test pipeline behavior."""
+        indep_var = np.array([1.0, 2.0, 3.0, 4.0])
+        dep_var = np.array([4.0, 3.0, 2.0, 1.0])
+        obj = pplot.Pipeline(
+            [Scale(dep=2), Offset(dep=1), Scale(indep=2)], cache_size=cache_size
+        )
+        ret = obj(indep_var, dep_var)
+        assert ret[0].tolist() == [2, 4, 6, 8]
+        assert ret[1].tolist() == [9, 7, 5, 3]
+        assert indep_var.tolist() == [1, 2, 3, 4]
+        assert dep_var.tolist() == [4, 3, 2, 1]
+        assert repr(obj) == (
+            "Pipeline([Scale(dep=2, indep=1), Offset(dep=1, indep=0), "
+            "Scale(dep=1, indep=2)])"
+        )
+        assert pplot.Pipeline([])(indep_var, dep_var)[1].tolist() == [4, 3, 2, 1]
+
+    def test_stage_cache(self):
+        """Test that only the stages after a changed one are computed again."""
+        indep_var = np.array([1.0, 2.0, 3.0])
+        dep_var = np.array([3.0, 2.0, 1.0])
+        calls1, calls2 = [], []
+        obj = pplot.Pipeline([Counter(calls1), Offset(dep=1), Counter(calls2)])
+        obj(indep_var, dep_var)
+        obj.stages[1] = Offset(dep=2)
+        ret = obj(indep_var, dep_var)
+        assert ret[1].tolist() == [5, 4, 3]
+        assert (len(calls1), len(calls2)) == (1, 2)
+        with pytest.raises(ValueError):
+            ret[1][0] = 0
+        obj(indep_var, dep_var + 1)
+        assert (len(calls1), len(calls2)) == (2, 3)
+        # Least recently used results are evicted
+        calls = []
+        obj = pplot.Pipeline([Counter(calls), Offset(dep=1)], cache_size=2)
+        obj(indep_var, dep_var)
+        obj(indep_var, dep_var + 1)
+        obj(indep_var, dep_var)
+        assert len(calls) == 3
+        assert len(obj._cache) == 2
+
+    def test_sources(self):
+        """Test pipeline use with data sources."""
+        obj = pplot.Pipeline([Scale(dep=-1), Offset(dep=10)])
+        source = pplot.BasicSource(
+            np.array([1, 2, 3]), np.array([4, 5, 6]), indep_min=2
+        )
+        ret = obj.apply(source)
+        assert isinstance(ret, pplot.pipeline.ProcessedSource)
+        assert (ret.source is source) and (ret.pipeline is obj)
+        assert ret.indep_var.tolist() == [2, 3]
+        assert ret.dep_var.tolist() == [5, 4]
+        assert str(ret) == (
+            "Source: BasicSource\n"
+            "Pipeline: Pipeline([Scale(dep=-1, indep=1), Offset(dep=10, indep=0)])\n"
+            "Independent variable: [ 2.0, 3.0 ]\n"
+            "Dependent variable: [ 5.0, 4.0 ]"
+        )
+        # Processed data follows data source and stage changes
+        source.dep_var = np.array([7, 8, 9])
+        assert ret.dep_var.tolist() == [2, 1]
+        obj.stages.append(Scale(indep=2))
+        assert ret.indep_var.tolist() == [4, 6]
+        assert ret.dep_var.tolist() == [2, 1]
+        calls = []
+        ret = pplot.Pipeline([Counter(calls)]).apply(source)
+        assert ret.indep_var.tolist() == [2, 3]
+        assert ret.dep_var.tolist() == [8, 9]
+        assert len(calls) == 1
+        with pmisc.TmpFile() as fname:
+            with open(fname, "w") as fobj:
+                fobj.write("Time,Value\n1,10\n2,20\n3,30\n")
+            source = pplot.CsvSource(fname, "Time", "Value", fproc=obj.fproc)
+            assert source.dep_var.tolist() == [0, -10, -20]
+            obj.stages[1] = Offset(dep=30)
+            source.fproc = obj.fproc
+            assert source.dep_var.tolist() == [20, 10, 0]
+
+    @pytest.mark.pipeline
+    def test_exceptions(self):
+        """Test pipeline and stages exceptions."""
+        AI(pplot.Pipeline, "stages", stages=5)
+        AI(pplot.Pipeline, "cache_size", stages=[], cache_size=-1)
+        AI(Offset, "dep", dep="a")
+        AI(Offset, "indep", indep=None)
+        AI(Scale, "indep", indep=0)
+        AI(Smooth, "window", window=0)
+        AI(Smooth, "window", window=4)
+        AI(Decimate, "npoints", npoints=1)
+        msg = "Argument `stages` is not valid"
+        AE(pplot.Pipeline, RuntimeError, msg, stages=[Offset(), 5])
+        obj = pplot.Pipeline([Offset()])
+        obj.stages.append(None)
+        AE(obj, RuntimeError, msg, np.array([1.0]), np.array([1.0]))
+        AI(obj.apply, "source", source=5)
+        source = pplot.BasicSource(np.array([1.0]), np.array([1.0]))
+        AI(pplot.pipeline.ProcessedSource, "pipeline", source=source, pipeline=5)
+        ret = pplot.Pipeline([Offset()]).apply(source)
+        ret.pipeline.stages.append(None)
+        with pytest.raises(RuntimeError) as excinfo:
+            ret.dep_var
+        assert pmisc.GET_EXMSG(excinfo) == msg
+
+    def test_abstract_stage(self):
+        """Test that stages have to define the _process method."""
+
+        class Incomplete(Stage):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
@@ -0,0 +1,232 @@
+# sqlite_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# Standard library imports
+import contextlib
+import sqlite3
+
+# PyPI imports
+import numpy as np
+from pmisc import AE, AI, APROP, AROPROP, TmpFile
+import pytest
+
+# Intra-package imports
+from pplot import SqliteSource as FUT
+
+
+###
+# Helper functions
+###
+def write_db(fname, rows=None):
+    """Create test database."""
+    rows = (
+        [
+            (1, "a", 3, 10),
+            (1, "b", 1, 20),
+            (1, "a", 2, 30),
+            (2, "a", 1, 40),
+            (2, "b", 2, None),
+            (2, "a", 3, 60),
+            (2, "a", None, 70),
+        ]
+        if rows is None
+        else rows
+    )
+    with contextlib.closing(sqlite3.connect(fname)) as conn:
+        conn.execute('CREATE TABLE "Data Table" (Sweep, Kind, Time, Value)')
+        conn.execute('CREATE INDEX data_time ON "Data Table" (Time)')
+        conn.executemany('INSERT INTO "Data Table" VALUES (?, ?, ?, ?)', rows)
+        conn.commit()
+
+
+###
+# Test classes
+###
+class TestSqliteSource(object):
+    """Test for SqliteSource."""
+
+    def test_str(self):
+        """Test that str behaves correctly."""
+        with TmpFile() as fname:
+            write_db(fname)
+            obj = FUT(fname, "Data Table", "Time", "Value", rfilter={"Sweep": 1})
+            ref = (
+                "File name: {0}\n"
+                "Table: Data Table\n"
+                "Row filter:\n"
+                "   Sweep: 1\n"
+                "Independent column label: Time\n"
+                "Dependent column label: Value\n"
+                "Independent variable minimum: -inf\n"
+                "Independent variable maximum: +inf\n"
+                "Independent variable: [ 1.0, 2.0, 3.0 ]\n"
+                "Dependent variable: [ 20.0, 30.0, 10.0 ]".format(fname)
+            )
+            assert str(obj) == ref
+            obj = FUT(fname, "Data Table", "Time", "Value", rfilter={"Sweep": 2})
+            obj.indep_min = 1
+            obj.indep_max = 3.0
+            ref = (
+                "File name: {0}\n"
+                "Table: Data Table\n"
+                "Row filter:\n"
+                "   Sweep: 2\n"
+                "Independent column label: Time\n"
+                "Dependent column label: Value\n"
+                "Independent variable minimum: 1\n"
+                "Independent variable maximum: 3.0\n"
+                "Independent variable: [ 1.0, 3.0 ]\n"
+                "Dependent variable: [ 40.0, 60.0 ]".format(fname)
+            )
+            assert str(obj) == ref
+
+    def test_query(self):
+        """Test row filtering and range bounding."""
+        with TmpFile() as fname:
+            write_db(fname)
+            # Table and column names are case insensitive
+            obj = FUT(
+                fname,
+                "data table",
+                "time",
+                "VALUE",
+                rfilter={"Sweep": 1, "Kind": ["a", "c"]},
+            )
+            assert (obj.indep_var == np.array([2.0, 3.0])).all()
+            assert (obj.dep_var == np.array([30.0, 10.0])).all()
+            obj.rfilter = {"Sweep": 2, "Kind": "a"}
+            assert (obj.indep_var == np.array([1.0, 3.0])).all()
+            assert (obj.dep_var == np.array([40.0, 60.0])).all()
+            obj = FUT(
+                fname, "Data Table", "Time", "Value", rfilter={"Sweep": 1}, indep_min=2
+            )
+            assert (obj.indep_var == np.array([2.0, 3.0])).all()
+            obj.indep_max = 2.5
+            assert (obj.indep_var == np.array([2.0])).all()
+            assert (obj.dep_var == np.array([30.0])).all()
+            obj.indep_min = None
+            assert (obj.indep_var == np.array([1.0, 2.0])).all()
+            assert obj.indep_var.dtype == np.float64
+        # Range bounding is done on rounded data, like in other data sources
+        with TmpFile() as fname:
+            write_db(
+                fname,
+                [
+                    (1, "a", 0.999999999999, 10),
+                    (1, "a", 2, 20),
+                    (1, "a", 3.000000000001, 30),
+                    (1, "a", 3.1, 40),
+                ],
+            )
+            obj = FUT(fname, "Data Table", "Time", "Value", indep_min=1, indep_max=3)
+            assert (obj.indep_var == np.array([1.0, 2.0, 3.0])).all()
+            assert (obj.dep_var == np.array([10.0, 20.0, 30.0])).all()
+
+    def test_properties(self):
+        """Test read-only properties."""
+        with TmpFile() as fname:
+            write_db(fname)
+            obj = FUT(fname, "Data Table", "Time", "Value", rfilter={"Sweep": 1})
+            assert obj.fname == fname
+            assert obj.table == "Data Table"
+            assert obj.indep_col_label == "Time"
+            assert obj.dep_col_label == "Value"
+            assert obj.rfilter == {"Sweep": 1}
+
+    @pytest.mark.sqlite_source
+    def test_open_exceptions(self):
+        """Test table and column specification exceptions."""
+        msg = "File _not_a_file_ could not be found"
+        AE(FUT, OSError, msg, "_not_a_file_", "a", "b", "c")
+        with TmpFile() as fname:
+            write_db(fname)
+            AI(FUT, "fname", 5, "Data Table", "Time", "Value")
+            AI(FUT, "table", fname, 5, "Time", "Value")
+            AI(FUT, "indep_col_label", fname, "Data Table", None, "Value")
+            AI(FUT, "dep_col_label", fname, "Data Table", "Time", 1.0)
+            AI(FUT, "rfilter", fname, "Data Table", "Time", "Value", rfilter=5)
+            msg = "Table x could not be found in SQLite file {0}".format(fname)
+            AE(FUT, ValueError, msg, fname, "x", "Time", "Value")
+            msg = (
+                "Column x (independent column label) could not be found "
+                "in table Data Table"
+            )
+            AE(FUT, ValueError, msg, fname, "Data Table", "x", "Value")
+            msg = (
+                "Column x (dependent column label) could not be found "
+                "in table Data Table"
+            )
+            AE(FUT, ValueError, msg, fname, "Data Table", "Time", "x")
+            msg = "Column x in row filter not found in table Data Table"
+            AE(FUT, ValueError, msg, fname, "Data Table", "Time", "Value", {"x": 1})
+            msg = "Column 0 in row filter not found in table Data Table"
+            AE(FUT, ValueError, msg, fname, "Data Table", "Time", "Value", {0: 1})
+            msg = "Column x in row filter not found in table Data Table"
+            obj = FUT(fname, "Data Table", "Time", "Value", rfilter={"Sweep": 1})
+            APROP(obj, "rfilter", {"x": 1}, ValueError, msg)
+            msg = "Filtered independent variable is empty"
+            AE(FUT, ValueError, msg, fname, "Data Table", "Time", "Value", {"Sweep": 3})
+            msg = "Independent variable is not strictly increasing"
+            AE(FUT, ValueError, msg, fname, "Data Table", "Time", "Value")
+            msg = (
+                "Table Data Table has non-numeric data in the independent "
+                "or dependent columns"
+            )
+            AE(FUT, TypeError, msg, fname, "Data Table", "Time", "Kind")
+        with TmpFile() as fname:
+            with open(fname, "w") as fobj:
+                fobj.write("Not a database\n" * 100)
+            msg = "File {0} is not a SQLite database".format(fname)
+            AE(FUT, RuntimeError, msg, fname, "Data Table", "Time", "Value")
+        # Database errors other than a file that is not a database are not
+        # reported as such
+        with TmpFile() as fname:
+            write_db(fname)
+            obj = FUT(fname, "Data Table", "Time", "Value", rfilter={"Sweep": 1})
+            with contextlib.closing(sqlite3.connect(fname)) as conn:
+                conn.execute('DROP TABLE "Data Table"')
+                conn.commit()
+            with pytest.raises(sqlite3.OperationalError):
+                obj.indep_min = 2
+
+    @pytest.mark.sqlite_source
+    def test_indep_var_exceptions(self):
+        """Test range bounding exceptions."""
+        with TmpFile() as fname:
+            write_db(fname)
+            args = [fname, "Data Table", "Time", "Value", {"Sweep": 1}]
+            AI(FUT, "indep_min", *args, indep_min="a")
+            AI(FUT, "indep_max", *args, indep_max=False)
+            msg = "Argument `indep_min` is greater than argument `indep_max`"
+            AE(FUT, ValueError, msg, *args, indep_min=3, indep_max=2)
+            obj = FUT(*args, indep_min=2)
+            APROP(obj, "indep_max", 1, ValueError, msg)
+            msg = (
+                "Argument `indep_var` is empty after "
+                "`indep_min`/`indep_max` range bounding"
+            )
+            AE(FUT, ValueError, msg, *args, indep_min=10)
+            APROP(obj, "indep_min", 3.5, ValueError, msg)
+
+    @pytest.mark.sqlite_source
+    @pytest.mark.parametrize(
+        "prop",
+        [
+            "fname",
+            "table",
+            "indep_col_label",
+            "dep_col_label",
+            "rfilter",
+            "indep_min",
+            "indep_max",
+            "indep_var",
+            "dep_var",
+        ],
+    )
+    def test_cannot_delete_attributes_exceptions(self, prop):
+        """Test that del method raises an exception on all class attributes."""
+        with TmpFile() as fname:
+            write_db(fname)
+            AROPROP(FUT(fname, "Data Table", "Time", "Value", {"Sweep": 1}), prop)
@@ -0,0 +1,203 @@
+# table_source.py
+# Copyright (c) 2013-2019 Pablo Acosta-Serafini
+# See LICENSE for details
+# pylint: disable=C0103,C0111,E0611,R0201,R0204,R0205,W0212,W0232,W0612
+
+# Standard library imports
+import array as pyarray
+
+# PyPI imports
+import numpy as np
+from pmisc import AE, AI, APROP, AROPROP
+import pytest
+
+# Intra-package imports
+from pplot import TableSource as FUT
+
+
+###
+# Global variables
+###
+RDTYPE = [("temp", "<i4"), ("time", "<f8"), ("volt", "<f8"), ("code", "<i2")]
+
+
+###
+# Helper functions
+###
+def create_table():
+    """Create structured array table, three curves of three points each."""
+    table = np.zeros(9, dtype=RDTYPE)
+    table["temp"] = [25, 25, 25, 50, 50, 50, 85, 85, 85]
+    table["time"] = [1, 2, 3, 1, 2, 3, 1, 2, 3]
+    table["volt"] = [1.5, 2.5, 3.5, 1.0, 2.0, 3.0, 0.5, 1.5, 2.5]
+    table["code"] = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    return table
+
+
+###
+# Test classes
+###
+class TestTableSource(object):
+    """Test for TableSource."""
+
+    def test_str(self):
+        """Test that str behaves correctly."""
+        obj = str(FUT(create_table(), "time", "volt", {"temp": 50}, indep_max=2))
+        ref = (
+            "Row filter:\n"
+            "   temp: 50\n"
+            "Independent column label: time\n"
+            "Dependent column label: volt\n"
+            "Independent variable minimum: -inf\n"
+            "Independent variable maximum: 2\n"
+            "Independent variable: [ 1.0, 2.0 ]\n"
+            "Dependent variable: [ 1.0, 2.0 ]"
+        )
+        assert obj == ref
+        obj = str(FUT({"x": np.array([1.0, 2.0]), "y": [3, 4]}, "x", "y"))
+        assert obj.split("\n")[0] == "Row filter: None"
+
+    def test_table(self):
+        """Test structured array and mapping tables."""
+        table = create_table()
+        obj = FUT(table, "TIME", "Code", rfilter={"temp": 85})
+        assert obj.table is table
+        assert (obj.indep_var == np.array([1.0, 2.0, 3.0])).all()
+        assert (obj.dep_var == np.array([3.0, 2.0, 1.0])).all()
+        assert obj.dep_var.dtype == np.float64
+        cols = {"t": np.arange(5.0), "v": pyarray.array("d", [5, 6, 7, 8, 9])}
+        obj = FUT(cols, "t", "V", indep_min=1, indep_max=3)
+        assert (obj.indep_var == np.array([1.0, 2.0, 3.0])).all()
+        assert (obj.dep_var == np.array([6.0, 7.0, 8.0])).all()
+        obj = FUT({"t": [1, 2, 3], "v": [4, 5, 6]}, "t", "v")
+        assert (obj.dep_var == np.array([4.0, 5.0, 6.0])).all()
+
+    def test_zero_copy(self):
+        """Test that float columns are not copied."""
+        table = create_table()[:3]
+        obj = FUT(table, "time", "volt", indep_min=2)
+        assert np.shares_memory(obj.indep_var, table)
+        assert np.shares_memory(obj.dep_var, table)
+        assert not obj.indep_var.flags.writeable
+        assert table.flags.writeable
+        assert (obj.dep_var == np.array([2.5, 3.5])).all()
+        # Non-float data is converted, only the bounded window is copied
+        obj.dep_col_label = "code"
+        assert not np.shares_memory(obj.dep_var, table)
+        assert (obj.dep_var == np.array([8.0, 7.0])).all()
+        # Re-bounding re-slices the table data
+        obj.indep_min = None
+        assert np.shares_memory(obj.indep_var, table)
+        assert (obj.indep_var == np.array([1.0, 2.0, 3.0])).all()
+        cols = {"t": np.arange(5.0), "v": pyarray.array("d", [5, 6, 7, 8, 9])}
+        obj = FUT(cols, "t", "v")
+        cols["v"][0] = 4.5
+        assert obj.dep_var[0] == 4.5
+
+    def test_rfilter(self):
+        """Test row filters."""
+        table = create_table()
+        obj = FUT(table, "time", "volt", rfilter={"temp": [25, 0], "time": [2, 3]})
+        assert (obj.indep_var == np.array([2.0, 3.0])).all()
+        assert (obj.dep_var == np.array([2.5, 3.5])).all()
+        obj.rfilter = {"temp": {">": 25, "<=": 50}}
+        assert (obj.dep_var == np.array([1.0, 2.0, 3.0])).all()
+        obj.rfilter = {"Code": {"<": 4}}
+        assert (obj.dep_var == np.array([0.5, 1.5, 2.5])).all()
+        assert obj.rfilter == {"Code": {"<": 4}}
+        # String columns
+        cols = {
+            "dev": np.array(["a", "b", "a", "b"]),
+            "x": np.array([1.0, 1.0, 2.0, 2.0]),
+            "y": np.array([1.0, 2.0, 3.0, 4.0]),
+        }
+        obj = FUT(cols, "x", "y", rfilter={"dev": "b"})
+        assert (obj.dep_var == np.array([2.0, 4.0])).all()
+        obj.rfilter = {"dev": {"!=": "b"}, "x": {"!=": "b"}}
+        assert (obj.dep_var == np.array([1.0, 3.0])).all()
+        obj.rfilter = {"dev": ["a", 1], "y": {">": 1}}
+        assert (obj.dep_var == np.array([3.0])).all()
+
+    @pytest.mark.table_source
+    def test_table_exceptions(self):
+        """Test table specification exceptions."""
+        table = create_table()
+        for item in [
+            None,
+            5,
+            {},
+            {1: [1, 2], "y": [1, 2]},
+            {"x": [1, 2], "y": [1, 2, 3]},
+            {"x": [], "y": []},
+            {"x": [[1, 2], [3, 4]], "y": [1, 2]},
+            {"x": [1, 2], "X": [1, 2]},
+            np.array([1.0, 2.0]),
+            table[:0],
+        ]:
+            AI(FUT, "table", item, "time", "volt")
+        AI(FUT, "indep_col_label", table, None, "volt")
+        AI(FUT, "dep_col_label", table, "time", 5)
+        msg = "Column {0} ({1} column label) could not be found in table"
+        AE(FUT, ValueError, msg.format("a", "independent"), table, "a", "volt")
+        AE(FUT, ValueError, msg.format("b", "dependent"), table, "time", "b")
+        obj = FUT(table, "time", "volt", {"temp": 25})
+        APROP(obj, "dep_col_label", "b", ValueError, msg.format("b", "dependent"))
+        msg = "Column dev is not real-valued"
+        cols = {"dev": ["a", "b"], "x": [1.0, 2.0]}
+        AE(FUT, TypeError, msg, cols, "x", "dev")
+
+    @pytest.mark.table_source
+    def test_rfilter_exceptions(self):
+        """Test row filter exceptions."""
+        table = create_table()
+        AI(FUT, "rfilter", table, "time", "volt", rfilter=5)
+        AI(FUT, "rfilter", table, "time", "volt", rfilter={"temp": {"~": 1}})
+        exmsg = "Argument `rfilter` is empty"
+        AE(FUT, ValueError, exmsg, table, "time", "volt", rfilter={})
+        exmsg = "Column a in row filter not found in table"
+        AE(FUT, ValueError, exmsg, table, "time", "volt", rfilter={"a": 1})
+        exmsg = "Filtered independent variable is empty"
+        AE(FUT, ValueError, exmsg, table, "time", "volt", rfilter={"temp": 0})
+        exmsg = "Independent variable is not strictly increasing"
+        AE(FUT, ValueError, exmsg, table, "time", "volt")
+        obj = FUT(table, "time", "volt", rfilter={"temp": 25})
+        APROP(obj, "rfilter", {"temp": [25, 50]}, ValueError, exmsg)
+
+    @pytest.mark.table_source
+    def test_indep_var_exceptions(self):
+        """Test independent variable exceptions."""
+        table = create_table()[:3]
+        AI(FUT, "indep_min", table, "time", "volt", indep_min="a")
+        AI(FUT, "indep_max", table, "time", "volt", indep_max="b")
+        msg = "Argument `indep_min` is greater than argument `indep_max`"
+        AE(FUT, ValueError, msg, table, "time", "volt", indep_min=3, indep_max=2)
+        obj = FUT(table, "time", "volt", indep_min=2)
+        APROP(obj, "indep_max", 1, ValueError, msg)
+        msg = (
+            "Argument `indep_var` is empty after "
+            "`indep_min`/`indep_max` range bounding"
+        )
+        APROP(obj, "indep_min", 45, ValueError, msg)
+        AE(FUT, ValueError, msg, table, "time", "volt", indep_max=0)
+        # Unsorted data is detected even if the range-bounded data is sorted
+        msg = "Independent variable is not strictly increasing"
+        for kwargs in [dict(indep_max=1.5), dict(indep_min=1, indep_max=2)]:
+            AE(FUT, ValueError, msg, create_table(), "time", "volt", **kwargs)
+
+    @pytest.mark.table_source
+    @pytest.mark.parametrize(
+        "prop",
+        [
+            "dep_col_label",
+            "dep_var",
+            "indep_col_label",
+            "indep_max",
+            "indep_min",
+            "indep_var",
+            "rfilter",
+            "table",
+        ],
+    )
+    def test_cannot_delete_attributes_exceptions(self, prop):
+        """Test that del method raises an exception on all class attributes."""
+        AROPROP(FUT(create_table()[:3], "time", "volt"), prop)
@@ -6,11 +6,25 @@
 # Intra-package imports
 from tests.ccontracts import TestContracts
 from tests.basic_source import TestBasicSource
+from tests.csv_engine import TestCsvCache
 from tests.csv_source import TestCsvSource
+from tests.derived_source import TestDerivedSource
+from tests.fproc_cache import TestFprocCache
+from tests.function_source import TestFunctionSource
+from tests.loader import TestLoadSources
+from tests.memmap_source import TestMemmapSource
+from tests.pipeline import TestPipeline
 from tests.series import TestSeries
+from tests.sqlite_source import TestSqliteSource
+from tests.table_source import TestTableSource
 from tests.panel import TestPanel
 from tests.figure import TestFigure
-from tests.functions import TestDataSource, TestParameterizedColorSpace
+from tests.functions import (
+    TestDataSource,
+    TestParameterizedColorSpace,
+    TestRoundMantissa,
+    TestTrustedMode,
+)
 from tests.fixtures import (
     default_panel,
     default_series,
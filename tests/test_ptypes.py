@@ -4,6 +4,7 @@
 # pylint: disable=C0103,C0111,W0108
 
 # PyPI imports
+import numpy as np
 from pmisc import AE
 
 # Intra-package imports
@@ -29,6 +30,22 @@ def check_contract(obj, name, value):
 ###
 # Test functions
 ###
+def test_align_option_contract():
+    """Test for AlignOption pseudo-type."""
+    obj = pplot.ptypes.align_option
+    check_contract(obj, "align_option", 5)
+    check_contract(obj, "align_option", None)
+    exmsg = (
+        "[START CONTRACT MSG: align_option]Argument "
+        "`*[argument_name]*` is not one of ['INTERP', 'INTERSECT'] "
+        "(case insensitive)[STOP CONTRACT MSG]"
+    )
+    AE(obj, ValueError, exmsg, obj="x")
+    for item in ["INTERP", "INTERSECT"]:
+        obj(item)
+        obj(item.lower())
+
+
 def test_color_space_option_contract():
     """Test for LineStyleOption pseudo-type."""
     obj = pplot.ptypes.color_space_option
@@ -65,6 +82,59 @@ def test_color_space_option_contract():
         pplot.ptypes.color_space_option(item)
 
 
+def test_csv_engine_option_contract():
+    """Test for CsvEngineOption pseudo-type."""
+    obj = pplot.ptypes.csv_engine_option
+    check_contract(obj, "csv_engine_option", 5)
+    check_contract(obj, "csv_engine_option", None)
+    exmsg = (
+        "[START CONTRACT MSG: csv_engine_option]Argument "
+        "`*[argument_name]*` is not one of ['NUMPY', 'PCSV'] "
+        "(case insensitive)[STOP CONTRACT MSG]"
+    )
+    AE(obj, ValueError, exmsg, obj="x")
+    for item in ["NUMPY", "PCSV"]:
+        obj(item)
+        obj(item.lower())
+
+
+def test_executor_option_contract():
+    """Test for ExecutorOption pseudo-type."""
+    obj = pplot.ptypes.executor_option
+    check_contract(obj, "executor_option", 5)
+    check_contract(obj, "executor_option", None)
+    exmsg = (
+        "[START CONTRACT MSG: executor_option]Argument "
+        "`*[argument_name]*` is not one of ['PROCESS', 'THREAD'] "
+        "(case insensitive)[STOP CONTRACT MSG]"
+    )
+    AE(obj, ValueError, exmsg, obj="x")
+    for item in ["PROCESS", "THREAD"]:
+        obj(item)
+        obj(item.lower())
+
+
+def test_increasing_real_vector_contract():
+    """Test for IncreasingRealVector pseudo-type."""
+    obj = pplot.ptypes.increasing_real_vector
+    for item in [
+        5,
+        [1, 2],
+        np.array([]),
+        np.array([[1, 2]]),
+        np.array(["a", "b"]),
+        np.array([1, 1]),
+        np.array([1.0, 3.0, 2.0]),
+        np.array([1.0, np.nan]),
+        np.array([1, 2], dtype=np.uint8),
+        np.array([1.0, 2.0], dtype=np.float32),
+    ]:
+        check_contract(obj, "increasing_real_vector", item)
+    obj(np.array([5]))
+    obj(np.array([1, 2, 3]))
+    obj(np.array([-1.5, 0.0, 1e-20]))
+
+
 def test_interpolation_option_contract():
     """Test for InterpolationOption pseudo-type."""
     obj = pplot.ptypes.interpolation_option
@@ -93,3 +163,46 @@ def test_line_style_option_contract():
     pplot.ptypes.line_style_option(None)
     for item in ["-", "--", "-.", ":"]:
         pplot.ptypes.line_style_option(item)
+
+
+def test_real_vector_contract():
+    """Test for RealVector pseudo-type."""
+    obj = pplot.ptypes.real_vector
+    for item in [
+        5,
+        [1, 2],
+        np.array([]),
+        np.array([[1, 2]]),
+        np.array([True, False]),
+        np.array([None, None]),
+        np.array([2, 1], dtype=np.int8),
+        np.array([2, 1], dtype=np.uint64),
+        np.array([3.0, -1.0], dtype=np.float16),
+        np.array([3.0, -1.0], dtype=np.float32),
+    ]:
+        check_contract(obj, "real_vector", item)
+    obj(np.array([3.0, -1.0, 2.5]))
+    obj(np.array([2, 1]))
+
+
+def test_row_filter_contract():
+    """Test for RowFilter pseudo-type."""
+    obj = pplot.ptypes.row_filter
+    for item in [
+        5,
+        {5.0: 1},
+        {"a": True},
+        {"a": [1, None]},
+        {"a": {}},
+        {"a": {"=": 1}},
+        {"a": {"<": [1, 2]}},
+    ]:
+        check_contract(obj, "row_filter", item)
+    exmsg = (
+        "[START CONTRACT MSG: row_filter]Argument "
+        "`*[argument_name]*` is empty[STOP CONTRACT MSG]"
+    )
+    AE(obj, ValueError, exmsg, obj={})
+    obj(None)
+    obj({"a": 1, "b": "x", 0: [1.5, "y"]})
+    obj({"a": {"==": 1, "!=": "x", "<": 2, "<=": 3, ">": 0, ">=": 1.5}})